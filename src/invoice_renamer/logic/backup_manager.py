@@ -17,8 +17,45 @@ the LICENSE file in the distribution root.
 """
 import os
 import shutil
-from typing import List
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from invoice_renamer.utils import constants
+from invoice_renamer.logic.config_manager import ConfigManager
+
+# 対象とする拡張子（小文字のタプル）。比較は大文字小文字を区別しない（.PDF も対象にする）
+_PDF_EXTENSIONS = (constants.FILE_EXTENTION_NAME.lower(),)
+
+# ディレクトリ一覧のキャッシュ（パス -> (更新時刻ns, PDFファイル名リスト)）
+# ディレクトリの更新時刻が変わらない限り、再走査せずにキャッシュを返す
+_pdf_list_cache: Dict[str, Tuple[int, List[str]]] = {}
+_pdf_list_cache_lock = threading.Lock()
+
+# 更新時刻がこの秒数以内のディレクトリは一覧をキャッシュしない
+# （FAT/exFATは2秒単位、SMB共有等も精度が粗く、同じ時刻のうちに追加されたファイルを見逃すため）
+_PDF_LIST_CACHE_MIN_AGE = 2.0
+
+# コピーはI/O待ちが支配的なため、CPU数より多めのスレッドで並列実行する
+_COPY_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Linuxのreflink（コピーオンライト複製）用ioctl番号。Btrfs/XFS等で利用可能
+_FICLONE = 0x40049409
+
+# コピー時のバッファサイズ（1MiB）。既定値より大きくしてシステムコール回数を減らす
+_COPY_BUFFER_SIZE = 1 << 20
+
+# macOSのclonefile(2)。コピーのたびにlibcを読み込まないよう、読み込み時に一度だけ解決する
+_clonefile = None
+if sys.platform == 'darwin':
+    try:
+        import ctypes
+        _clonefile = ctypes.CDLL(None, use_errno=True).clonefile
+        _clonefile.argtypes = (ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32)
+        _clonefile.restype = ctypes.c_int
+    except (OSError, AttributeError):
+        _clonefile = None
 
 class BackupManager:
     """PDFファイルのバックアップを管理するクラス
@@ -30,36 +67,48 @@ class BackupManager:
         base_directory (str): 基準ディレクトリ
         work_directory (str): 一時作業用ディレクトリのパス
         pdf_files (List[str]): PDFファイルのリスト
+        use_hardlinks (bool): 作業用コピーにハードリンクを使うか
     """
 
-    def __init__(self, base_directory: str):
+    def __init__(self, base_directory: str, use_hardlinks: Optional[bool] = None):
         """BackupManagerを初期化
 
         Args:
             base_directory (str): PDFファイルが格納されているディレクトリ
+            use_hardlinks (Optional[bool]): ハードリンクを使うか。Noneの場合は設定ファイルに従う
         """
+        if use_hardlinks is None:
+            use_hardlinks = ConfigManager().get_use_hardlinks()
+        self.use_hardlinks = use_hardlinks
         self.base_directory = base_directory
         self.work_directory = os.path.join(base_directory, constants.WORK_FOLDER_NAME)
-        self.pdf_files = self.get_pdf_files(base_directory)
+        self.pdf_files = get_pdf_files(base_directory)
+
+    def create_temp_files(self):
+        """一時作業用ディレクトリを作成し、PDFファイルをコピー
+
+        Note:
+            初期化時に取得済みのPDF一覧を使うため、ディレクトリを再走査しない
+        """
+        make_work_dir(self.work_directory)
+        copy_pdfs_to_work_folder(self.base_directory, self.work_directory, self.pdf_files,
+                                 use_hardlinks=self.use_hardlinks)
 
 
-def create_temp_files(base_directory):
+def create_temp_files(base_directory, pdf_files=None):
     """一時作業用のデータをコピーするラップ関数
 
     Args:
         base_directory (str): 基準ディレクトリ
+        pdf_files (List[str], optional): 取得済みのPDF一覧。Noneの場合は走査して取得
 
     Note:
-        一時作業用ディレクトリを作成し、PDFファイルをコピーする
+        BackupManager.create_temp_filesに委譲する（ハードリンクの設定も同様に反映される）
     """
-    # 一時作業用ディレクトリを指定
-    work_directory_path = os.path.join(base_directory, constants.WORK_FOLDER_NAME)
-
-    # 一時作業用ディレクトリ作成
-    make_work_dir(work_directory_path)
-
-    # PDF一覧を参照してコピーを実施
-    copy_pdfs_to_work_folder(base_directory, work_directory_path)
+    manager = BackupManager(base_directory)
+    if pdf_files is not None:
+        manager.pdf_files = list(pdf_files)
+    manager.create_temp_files()
 
 
 def get_pdf_files(base_directory):
@@ -70,8 +119,42 @@ def get_pdf_files(base_directory):
 
     Returns:
         List[str]: PDFファイル名のリスト
+
+    Note:
+        os.scandirのDirEntryが保持する種別情報を使うため、
+        エントリごとの追加のstat呼び出しが発生しない。
+        ディレクトリの更新時刻が前回と同じ場合はキャッシュした一覧を返す。
+        更新時刻が現在時刻に近い（直後に変更され得る）一覧はキャッシュしない
     """
-    return [f for f in os.listdir(base_directory) if f.endswith(constants.FILE_EXTENTION_NAME)]
+    mtime = os.stat(base_directory).st_mtime_ns
+    with _pdf_list_cache_lock:
+        cached = _pdf_list_cache.get(base_directory)
+        if cached is not None and cached[0] == mtime:
+            return list(cached[1])
+
+    # 内包表記内でグローバル参照が繰り返されないよう、ローカル変数に退避
+    extensions = _PDF_EXTENSIONS
+    with os.scandir(base_directory) as entries:
+        pdf_files = [entry.name for entry in entries
+                     if entry.name.lower().endswith(extensions) and entry.is_file()]
+
+    if time.time() - mtime / 1e9 >= _PDF_LIST_CACHE_MIN_AGE:
+        with _pdf_list_cache_lock:
+            _pdf_list_cache[base_directory] = (mtime, pdf_files)
+    return list(pdf_files)
+
+
+def invalidate_pdf_files_cache(base_directory=None):
+    """ディレクトリ一覧のキャッシュを破棄
+
+    Args:
+        base_directory (str, optional): 対象ディレクトリ。Noneの場合はすべて破棄
+    """
+    with _pdf_list_cache_lock:
+        if base_directory is None:
+            _pdf_list_cache.clear()
+        else:
+            _pdf_list_cache.pop(base_directory, None)
 
 
 def make_work_dir(temp_directory_path):
@@ -85,33 +168,154 @@ def make_work_dir(temp_directory_path):
     """
     try:
         os.makedirs(temp_directory_path,exist_ok=True)
+        invalidate_pdf_files_cache(os.path.dirname(temp_directory_path))
         print(f"フォルダ '{temp_directory_path}' を作成しました。")
     except Exception as e:
         print(f"フォルダを作成できませんでした: {e}")
 
 
-def copy_pdfs_to_work_folder(base_directory, copy_to_directory):
+def _clone_file(source_path, destination_path):
+    """ファイルシステムの機能で、データを複製せずにファイルをコピー
+
+    Args:
+        source_path (str): コピー元ファイルのパス
+        destination_path (str): コピー先ファイルのパス
+
+    Returns:
+        bool: 複製できた場合True。未対応の環境・ファイルシステムではFalse
+
+    Note:
+        Linux: reflink（FICLONE）→ os.copy_file_range の順に試す。
+        macOS: clonefile(2) を試す。
+        いずれも同一ファイルシステム上ではデータを読み書きせずに完了し得る。
+        コピー先は呼び出し側で削除しておくこと（_copy_file参照）
+    """
+    try:
+        if sys.platform.startswith('linux'):
+            import fcntl
+            with open(source_path, 'rb') as src, open(destination_path, 'wb') as dst:
+                try:
+                    fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+                    return True
+                except OSError:
+                    pass
+                if hasattr(os, 'copy_file_range'):
+                    size = os.fstat(src.fileno()).st_size
+                    copied = 0
+                    while copied < size:
+                        n = os.copy_file_range(src.fileno(), dst.fileno(), size - copied)
+                        if n == 0:
+                            break
+                        copied += n
+                    return copied == size
+        elif _clonefile is not None:
+            if _clonefile(os.fsencode(source_path), os.fsencode(destination_path), 0) == 0:
+                return True
+    except (OSError, AttributeError):
+        pass
+    return False
+
+
+def _copy_file(source_path, destination_path, use_hardlinks=False):
+    """ファイルの内容とメタデータをコピー
+
+    Args:
+        source_path (str): コピー元ファイルのパス
+        destination_path (str): コピー先ファイルのパス
+        use_hardlinks (bool): Trueの場合、データをコピーせずハードリンクを作成
+
+    Note:
+        ハードリンク → コピーオンライト複製 → sendfile(Linux) → 1MiBバッファ の順に試す。
+        タイムスタンプ等のメタデータはshutil.copy2と同様に引き継ぐ。
+        コピー先がコピー元と同じファイル（ハードリンク等）の場合はshutil.copy2と同様に
+        SameFileErrorを送出する。コピー先を開いたまま書き込むと、共有している実体
+        （＝コピー元）が切り詰められて消えてしまうため。
+        既存のコピー先は、開く前に削除して新しいファイルとして作り直す
+
+    Raises:
+        shutil.SameFileError: コピー元とコピー先が同じファイルの場合
+    """
+    if os.path.exists(destination_path) and os.path.samefile(source_path, destination_path):
+        if use_hardlinks:
+            # 既に同じ実体へのハードリンクになっている
+            return
+        raise shutil.SameFileError(f"{source_path!r} と {destination_path!r} は同じファイルです")
+    if os.path.lexists(destination_path):
+        os.remove(destination_path)
+
+    if use_hardlinks:
+        try:
+            os.link(source_path, destination_path)
+            return
+        except OSError:
+            # 別ドライブ等でハードリンクが作れない場合は通常のコピーに切り替える
+            pass
+
+    if not _clone_file(source_path, destination_path):
+        with open(source_path, 'rb') as src, open(destination_path, 'wb') as dst:
+            if sys.platform.startswith('linux'):
+                size = os.fstat(src.fileno()).st_size
+                offset = 0
+                while offset < size:
+                    sent = os.sendfile(dst.fileno(), src.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            else:
+                shutil.copyfileobj(src, dst, length=_COPY_BUFFER_SIZE)
+    shutil.copystat(source_path, destination_path)
+
+
+def copy_file(source_path, destination_path):
+    """ファイルを複製（shutil.copy2の代替）
+
+    Args:
+        source_path (str): コピー元ファイルのパス
+        destination_path (str): コピー先ファイルのパス
+
+    Note:
+        同一ファイルシステム上ではreflink/copy_file_range/clonefileにより
+        データを読み書きせずに複製できる。ハードリンクは使わない
+
+    Raises:
+        shutil.SameFileError: コピー元とコピー先が同じファイル（ハードリンクを含む）の場合
+    """
+    _copy_file(source_path, destination_path, use_hardlinks=False)
+
+
+def copy_pdfs_to_work_folder(base_directory, copy_to_directory, pdf_files=None, use_hardlinks=False):
     """PDFの作業用コピーを作成
 
     Args:
         base_directory (str): コピー元のディレクトリ
         copy_to_directory (str): コピー先のディレクトリ
+        pdf_files (List[str], optional): コピー対象のPDF一覧。Noneの場合は走査して取得
+        use_hardlinks (bool): Trueの場合、コピーの代わりにハードリンクを作成
 
     Note:
         すべてのPDFファイルを作業用フォルダにコピーする
     """
-    # コピー対象のPDF一覧を取得
-    pdf_files = get_pdf_files(base_directory)
+    # コピー対象のPDF一覧を取得（呼び出し元で取得済みの場合は再利用）
+    if pdf_files is None:
+        pdf_files = get_pdf_files(base_directory)
 
-    # PDF一覧をもとに、ファイルを作業用フォルダにコピー
-    for pdf_file in pdf_files:
+    def _copy_one(pdf_file):
         source_path = os.path.join(base_directory, pdf_file)
-        copy_to_path = os.path.join(base_directory, constants.WORK_FOLDER_NAME, pdf_file)
-
         try:
-            shutil.copy2(source_path, copy_to_directory)
-            print(f"ファイル '{pdf_file}' を '{copy_to_directory}' にコピーしました。")
+            _copy_file(source_path, os.path.join(copy_to_directory, pdf_file), use_hardlinks)
+            return f"ファイル '{pdf_file}' を '{copy_to_directory}' にコピーしました。\n"
         except Exception as e:
-            print(f"ファイル '{pdf_file}' をコピーできませんでした: {e}")
+            return f"ファイル '{pdf_file}' をコピーできませんでした: {e}\n"
+
+    # PDF一覧をもとに、ファイルを作業用フォルダに並列でコピー
+    # 結果メッセージはファイルごとに出力せず、まとめて1回で書き出す
+    if pdf_files:
+        with ThreadPoolExecutor(max_workers=min(_COPY_MAX_WORKERS, len(pdf_files))) as executor:
+            messages = list(executor.map(_copy_one, pdf_files))
+        sys.stdout.write("".join(messages))
+        sys.stdout.flush()
+
+    # コピー先の一覧は変化しているため、キャッシュを破棄
+    invalidate_pdf_files_cache(copy_to_directory)
 
 
@@ -16,8 +16,14 @@ the Free Software Foundation, either version 3 of the License, or
 This program is distributed WITHOUT ANY WARRANTY; for more details see
 the LICENSE file in the distribution root.
 """
-import tomllib
+import copy
 import os
+from typing import Dict, Tuple
+
+# 解析済み設定のキャッシュ（パス -> ((更新時刻ns, サイズ), 設定dict)）
+# ConfigManagerは各モジュールで何度も生成されるため、ファイルが
+# 変更されていない限りTOMLの再解析を省略する
+_config_cache: Dict[str, Tuple[Tuple[int, int], dict]] = {}
 
 class ConfigManager:
     """設定管理クラス
@@ -37,10 +43,56 @@ class ConfigManager:
         """
         self.config = {}
         if os.path.exists(config_path):
-            with open(config_path, 'rb') as f:
-                self.config = tomllib.load(f)
+            self.config = self._load_config(config_path)
         else:
             self._set_defaults()
+        self._resolve_values()
+
+    def _resolve_values(self):
+        """各設定値を一度だけ取り出してインスタンス属性に保持
+
+        ゲッターは呼び出し頻度が高いため、ネストしたdictを
+        毎回たどらずに属性を返すだけで済むようにする。
+        """
+        logging_cfg = self.config.get('logging', {})
+        handlers = logging_cfg.get('handlers', {})
+        console_handler = handlers.get('console', {})
+        file_handler = handlers.get('file', {})
+        log_format = logging_cfg.get('format', {})
+
+        self._console_log_level = console_handler.get('level', 'INFO')
+        self._file_log_level = file_handler.get('level', 'DEBUG')
+        self._log_directory = file_handler.get('directory', 'logs')
+        self._log_filename = file_handler.get('name', 'application.log')
+        self._console_log_format = log_format.get('console', '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        self._file_log_format = log_format.get('file', '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s')
+        self._pdf_handler = self.config.get('pdf', {}).get('handler', 'pymupdf')
+        self._y_coordinate_tolerance = self.config.get('ocr', {}).get('y_coordinate_tolerance', 2.0)
+        self._use_hardlinks = bool(self.config.get('backup', {}).get('use_hardlinks', False))
+
+    @staticmethod
+    def _load_config(config_path: str) -> dict:
+        """設定ファイルを読み込む（更新時刻・サイズが同じ場合はキャッシュを返す）
+
+        Args:
+            config_path (str): 設定ファイルのパス
+
+        Returns:
+            dict: 解析済みの設定情報（キャッシュの複製。変更しても他のインスタンスに影響しない）
+        """
+        st = os.stat(config_path)
+        key = (st.st_mtime_ns, st.st_size)
+        cached = _config_cache.get(config_path)
+        if cached is not None and cached[0] == key:
+            return copy.deepcopy(cached[1])
+
+        # tomllibは読み込み時にreモジュール等を初期化するため、
+        # 実際に設定ファイルを解析する場合にのみインポートする
+        import tomllib
+        with open(config_path, 'rb') as f:
+            config = tomllib.loads(f.read().decode('utf-8'))
+        _config_cache[config_path] = (key, config)
+        return copy.deepcopy(config)
 
     def _set_defaults(self):
         """デフォルト設定の定義
@@ -69,6 +121,9 @@ class ConfigManager:
             },
             'ocr': {
                 'y_coordinate_tolerance': 2.0
+            },
+            'backup': {
+                'use_hardlinks': False
             }
         }
 
@@ -78,7 +133,7 @@ class ConfigManager:
         Returns:
             str: ログレベル（'INFO', 'DEBUG', 'WARNING', 'ERROR'等）
         """
-        return self.config.get('logging', {}).get('handlers', {}).get('console', {}).get('level', 'INFO')
+        return self._console_log_level
 
     def get_file_log_level(self) -> str:
         """ファイル出力のログレベルを取得
@@ -86,7 +141,7 @@ class ConfigManager:
         Returns:
             str: ログレベル（デフォルト: 'DEBUG'）
         """
-        return self.config.get('logging', {}).get('handlers', {}).get('file', {}).get('level', 'DEBUG')
+        return self._file_log_level
 
     def get_log_directory(self) -> str:
         """ログファイルの出力ディレクトリを取得
@@ -94,7 +149,7 @@ class ConfigManager:
         Returns:
             str: ログディレクトリのパス（デフォルト: 'logs'）
         """
-        return self.config.get('logging', {}).get('handlers', {}).get('file', {}).get('directory', 'logs')
+        return self._log_directory
 
     def get_log_filename(self) -> str:
         """ログファイルのベース名を取得
@@ -102,7 +157,7 @@ class ConfigManager:
         Returns:
             str: ログファイル名（デフォルト: 'application.log'）
         """
-        return self.config.get('logging', {}).get('handlers', {}).get('file', {}).get('name', 'application.log')
+        return self._log_filename
 
     def get_console_log_format(self) -> str:
         """コンソール出力のログフォーマットを取得
@@ -110,7 +165,7 @@ class ConfigManager:
         Returns:
             str: ログフォーマット文字列
         """
-        return self.config.get('logging', {}).get('format', {}).get('console', '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        return self._console_log_format
 
     def get_file_log_format(self) -> str:
         """ファイル出力のログフォーマットを取得
@@ -118,7 +173,7 @@ class ConfigManager:
         Returns:
             str: ログフォーマット文字列（ファイル名と行番号を含む）
         """
-        return self.config.get('logging', {}).get('format', {}).get('file', '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s')
+        return self._file_log_format
 
     def get_pdf_handler(self) -> str:
         """使用するPDFハンドラーの種類を取得
@@ -126,7 +181,7 @@ class ConfigManager:
         Returns:
             str: PDFハンドラー名（'pymupdf' または 'pdf2image'）
         """
-        return self.config.get('pdf', {}).get('handler', 'pymupdf')
+        return self._pdf_handler
 
     def get_y_coordinate_tolerance(self) -> float:
         """テキスト要素ソート時のY座標許容誤差を取得
@@ -137,6 +192,16 @@ class ConfigManager:
         Returns:
             float: Y座標許容誤差（ポイント単位、デフォルト: 2.0）
         """
-        return self.config.get('ocr', {}).get('y_coordinate_tolerance', 2.0)
+        return self._y_coordinate_tolerance
+
+    def get_use_hardlinks(self) -> bool:
+        """作業用フォルダへのコピーにハードリンクを使うかを取得
 
+        ハードリンクは元ファイルと実体を共有するため、
+        作業用ファイルを読み取り専用で扱う場合のみ有効にする。
+
+        Returns:
+            bool: ハードリンクを使う場合True（デフォルト: False）
+        """
+        return self._use_hardlinks
 
@@ -11,6 +11,9 @@
 - 自動適用・設定なし。ユーザーが調整するパラメータは設けない
 - OCRに渡す画像にのみ適用し、画面のプレビュー表示には影響させない
 - 失敗しても例外を投げず、生成できた変種のみを返す
+- 変種は必要になった時点で生成する（iter_preprocess_variants）
+- OpenCV・numpyがある場合はグレースケール化・拡大・メディアンフィルタを
+  OpenCVで行い、ない場合はPILで行う
 
 Copyright (C) 2023-2025 mrhoge
 
@@ -25,10 +28,21 @@ This program is distributed WITHOUT ANY WARRANTY; for more details see
 the LICENSE file in the distribution root.
 """
 
-from typing import List
+from typing import Iterator, List, Tuple
 
 from PIL import Image, ImageFilter
 
+try:
+    import numpy as np
+    import cv2
+    # 画像の前処理はOCRのスレッドプール内で実行されるため、
+    # OpenCV内部のスレッド並列は使わない（スレッドの奪い合いを避ける）
+    cv2.setNumThreads(0)
+except ImportError:
+    # OpenCV・numpyがない環境では、PILで画像の前処理を行う
+    np = None
+    cv2 = None
+
 # Tesseractは文字が小さい（目安: 文字高20px未満）と精度が急落するため、
 # 短辺がこの値を下回る切り抜き画像は拡大してから補正する
 _MIN_DIMENSION = 600
@@ -40,22 +54,45 @@ _UPSCALE_FACTOR = 2
 _MAX_PIXELS = 4_000_000
 
 
+def _use_cv2(image: Image.Image) -> bool:
+    """画像の前処理をOpenCVで行えるか（OpenCV・numpyがあり、L/RGB画像の場合）"""
+    return cv2 is not None and image.mode in ('L', 'RGB')
+
+
+def to_grayscale(image: Image.Image) -> Image.Image:
+    """画像をグレースケールに変換（PILのconvert('L')と同じ輝度の重み）"""
+    if image.mode == 'RGB' and _use_cv2(image):
+        return Image.fromarray(cv2.cvtColor(np.asarray(image), cv2.COLOR_RGB2GRAY))
+    return image.convert('L')
+
+
+def resize_for_ocr(image: Image.Image, size: Tuple[int, int]) -> Image.Image:
+    """OCR用に画像を拡大（OpenCVがある場合はバイキュービック補間、ない場合はLANCZOS）"""
+    if _use_cv2(image):
+        return Image.fromarray(cv2.resize(np.asarray(image), size, interpolation=cv2.INTER_CUBIC))
+    return image.resize(size, Image.Resampling.LANCZOS)
+
+
+def _median_filter(image: Image.Image, size: int) -> Image.Image:
+    """メディアンフィルタでごま塩ノイズを除去（OpenCVがある場合はcv2.medianBlur）"""
+    if _use_cv2(image):
+        return Image.fromarray(cv2.medianBlur(np.asarray(image), size))
+    return image.filter(ImageFilter.MedianFilter(size))
+
+
 def _to_grayscale_upscaled(pil_image: Image.Image) -> Image.Image:
     """グレースケール化し、小さい画像は拡大して返す"""
     img = pil_image
     if img.mode != 'L':
-        img = img.convert('L')
+        img = to_grayscale(img)
     if (min(img.size) < _MIN_DIMENSION
             and img.width * img.height * _UPSCALE_FACTOR ** 2 <= _MAX_PIXELS):
-        img = img.resize(
-            (img.width * _UPSCALE_FACTOR, img.height * _UPSCALE_FACTOR),
-            Image.Resampling.LANCZOS,
-        )
+        img = resize_for_ocr(img, (img.width * _UPSCALE_FACTOR, img.height * _UPSCALE_FACTOR))
     return img
 
 
-def preprocess_variants(pil_image: Image.Image, logger=None) -> List[Image.Image]:
-    """OCR再試行用の補正画像バリエーションを生成する
+def iter_preprocess_variants(pil_image: Image.Image, logger=None) -> Iterator[Image.Image]:
+    """OCR再試行用の補正画像バリエーションを、要求された時点で1つずつ生成する
 
     元画像でのOCRが空・無意味な結果だった場合に、これらの変種で
     順に再試行することを想定している。比較実験でノイズ画像からの
@@ -68,15 +105,30 @@ def preprocess_variants(pil_image: Image.Image, logger=None) -> List[Image.Image
         pil_image (Image.Image): 元画像。この画像自体は変更しない
         logger (logging.Logger, optional): 失敗時のデバッグログ出力先
 
-    Returns:
-        List[Image.Image]: 補正済み画像のリスト。失敗時は空リスト
+    Yields:
+        Image.Image: 補正済み画像。失敗した時点で打ち切る
+
+    Note:
+        グレースケール化・拡大は最初の変種を要求されたときに1回だけ行う。
+        1つ目の変種で読めた場合、2つ目の変種は生成されない
     """
-    variants = []
     try:
         base = _to_grayscale_upscaled(pil_image)
-        variants.append(base.filter(ImageFilter.MedianFilter(3)))
-        variants.append(base.filter(ImageFilter.MedianFilter(5)))
+        yield _median_filter(base, 3)
+        yield _median_filter(base, 5)
     except Exception as e:
         if logger is not None:
             logger.debug(f"OCR用の補正画像生成に失敗しました: {e}")
-    return variants
+
+
+def preprocess_variants(pil_image: Image.Image, logger=None) -> List[Image.Image]:
+    """OCR再試行用の補正画像バリエーションをすべて生成する
+
+    Args:
+        pil_image (Image.Image): 元画像。この画像自体は変更しない
+        logger (logging.Logger, optional): 失敗時のデバッグログ出力先
+
+    Returns:
+        List[Image.Image]: 補正済み画像のリスト（iter_preprocess_variantsと同じ順）。失敗時は空リスト
+    """
+    return list(iter_preprocess_variants(pil_image, logger))
@@ -16,31 +16,66 @@ the Free Software Foundation, either version 3 of the License, or
 This program is distributed WITHOUT ANY WARRANTY; for more details see
 the LICENSE file in the distribution root.
 """
-from abc import ABC, abstractmethod
-from typing import Optional, List
+from collections import OrderedDict
+from functools import wraps
+from typing import TYPE_CHECKING, Optional, List, Dict, Tuple
+from PySide6.QtCore import Qt
 from PySide6.QtGui import QPixmap, QImage
-import fitz  # PyMuPDF
-from pdf2image import convert_from_path
+import mmap
 import os
+import threading
 from invoice_renamer.utils.error_handler import ErrorHandler, ErrorType
 from invoice_renamer.utils.logger import setup_logger
 
+if TYPE_CHECKING:
+    # PyMuPDFは読み込みに時間がかかるため、起動時にはインポートせず、
+    # PDFを開く・描画する処理の中で初回使用時にインポートする
+    import fitz  # PyMuPDF
+
 # ウィジェット名
 BTN_CHOOSE_PDF_FOLDER = "PDFフォルダを選択"
 
 # メッセージ
 SELECTED_PDF_NAME = "選択されたPDF: "
 
-class PDFHandler(ABC):
-    """PDFハンドラーの抽象基底クラス
+# 開いたままにしておくPDFドキュメントの最大数
+# （少数のPDFを行き来する際に再オープン・再解析を避けるため）
+DOCUMENT_CACHE_SIZE = 8
+
+# このサイズ以下のPDFはメモリに読み込んでから開く（ファイルハンドルを保持しない）
+# 請求書PDFはほぼこの範囲に収まる。大きいファイルはパス指定で開き、ピークメモリを抑える
+IN_MEMORY_OPEN_MAX_BYTES = 8 * 1024 * 1024
+
+# プレビューの基準解像度（論理ピクセルあたりの倍率。1.0 = 72dpi）
+PREVIEW_BASE_SCALE = 2.0
+
+
+def _synchronized(method):
+    """ハンドラーのロックを保持した状態でメソッドを実行するデコレーター
+
+    プレビューはワーカースレッドで描画されるため、UIスレッドからの
+    テキスト抽出・PDFの読み込み等と同じドキュメントを同時に操作しないようにする
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class PDFHandler:
+    """PDFハンドラーの基底クラス
 
     PDFの読み込み、プレビュー生成、テキスト抽出などの
     共通インターフェースを定義する。
     依存性の注入パターンを使用して、実装クラスを切り替え可能。
+    未実装のメソッドはNotImplementedErrorを送出する。
 
     Attributes:
         current_pdf: 現在開いているPDFドキュメント
+        current_path (str): 現在開いているPDFファイルのパス
         total_pages (int): PDFの総ページ数
+        last_load_error (Optional[tuple]): 直前のload_pdfのエラー内容（(エラー種別, 追加情報)、成功時None）
         logger: ロガーインスタンス
         error_handler (ErrorHandler): エラーハンドラーインスタンス
     """
@@ -48,17 +83,97 @@ class PDFHandler(ABC):
 
     def __init__(self):
         self.current_pdf = None
+        self.current_path = None
         self.total_pages = 0
+        self.last_load_error = None
+        # ドキュメントへのアクセスを直列化するロック（同じスレッドからの再入を許可）
+        self._lock = threading.RLock()
         self.logger = setup_logger('invoice_renamer.pdf_handlers')
         self.error_handler = ErrorHandler(self.logger)
+        # 読み込み済みドキュメントのキャッシュ（パス -> (更新時刻ns, ドキュメント)）
+        self._doc_cache: "OrderedDict[str, Tuple[int, fitz.Document]]" = OrderedDict()
+        # 検証済みファイルの記録（パス -> (更新時刻ns, サイズ)）
+        self._validated: Dict[str, Tuple[int, int]] = {}
+
+    def _get_cached_document(self, pdf_path: str, mtime_ns: int) -> Optional["fitz.Document"]:
+        """キャッシュ済みのドキュメントを取得
+
+        ファイルの更新時刻が変わっている場合はキャッシュを破棄する。
+
+        Args:
+            pdf_path (str): PDFファイルのパス
+            mtime_ns (int): 現在のファイル更新時刻（ナノ秒）
+
+        Returns:
+            Optional[fitz.Document]: キャッシュ済みのドキュメント。無い場合はNone
+        """
+        cached = self._doc_cache.get(pdf_path)
+        if cached is None:
+            return None
+        if cached[0] != mtime_ns:
+            self._evict_document(pdf_path)
+            return None
+        self._doc_cache.move_to_end(pdf_path)
+        return cached[1]
+
+    def _cache_document(self, pdf_path: str, doc: "fitz.Document", mtime_ns: int) -> None:
+        """ドキュメントをキャッシュに登録し、上限を超えた古いものを閉じる
 
-    @abstractmethod
-    def get_preview(self, pdf_path: str, page: int = 0) -> Optional[QPixmap]:
+        Args:
+            pdf_path (str): PDFファイルのパス
+            doc (fitz.Document): 開いたドキュメント
+            mtime_ns (int): ファイル更新時刻（ナノ秒）
+        """
+        self._doc_cache[pdf_path] = (mtime_ns, doc)
+        self._doc_cache.move_to_end(pdf_path)
+        while len(self._doc_cache) > DOCUMENT_CACHE_SIZE:
+            _, (_, old_doc) = self._doc_cache.popitem(last=False)
+            if old_doc is not self.current_pdf:
+                old_doc.close()
+
+    def _set_current_document(self, pdf_path: str, doc: "fitz.Document") -> None:
+        """現在のドキュメントを差し替える
+
+        以前のドキュメントがキャッシュに残っていない場合（上限超過や更新で
+        取り除かれた場合）は閉じる。開いたままにするとファイルハンドルが残り、
+        Windowsでは元ファイルのリネームができなくなるため。
+
+        Args:
+            pdf_path (str): PDFファイルのパス
+            doc (fitz.Document): 開いたドキュメント
+        """
+        old_doc = self.current_pdf
+        self.current_pdf = doc
+        self.current_path = pdf_path
+        self.total_pages = doc.page_count
+        if (old_doc is not None and old_doc is not doc
+                and all(cached_doc is not old_doc for _, cached_doc in self._doc_cache.values())):
+            try:
+                old_doc.close()
+            except (ValueError, RuntimeError):
+                # 既にクローズされている場合は無視
+                pass
+
+    def _evict_document(self, pdf_path: str) -> None:
+        """キャッシュからドキュメントを取り除いて閉じる
+
+        Args:
+            pdf_path (str): PDFファイルのパス
+        """
+        cached = self._doc_cache.pop(pdf_path, None)
+        if cached is not None and cached[1] is not self.current_pdf:
+            try:
+                cached[1].close()
+            except (ValueError, RuntimeError):
+                pass
+
+    def get_preview(self, pdf_path: str, page: int = 0, target_dpr: float = 1.0) -> Optional[QPixmap]:
         """PDFのプレビュー画像を取得
 
         Args:
             pdf_path (str): PDFファイルのパス
             page (int): 取得対象のページ番号
+            target_dpr (float): 表示先画面のデバイスピクセル比
 
         Returns:
             Optional[QPixmap]: プレビュー画像。エラー時はNone
@@ -72,9 +187,24 @@ class PDFHandler(ABC):
         # except Exception as e:
         #     print(f"プレビュー生成エラー: {e}")
         #     return None
-        pass
+        raise NotImplementedError
+
+    def get_preview_image(self, pdf_path: str, page: int = 0, target_dpr: float = 1.0) -> Optional[QImage]:
+        """PDFのプレビュー画像をQImageとして取得（ワーカースレッドから呼び出し可能）
+
+        Args:
+            pdf_path (str): PDFファイルのパス
+            page (int): 取得対象のページ番号
+            target_dpr (float): 表示先画面のデバイスピクセル比
+
+        Returns:
+            Optional[QImage]: プレビュー画像。エラー時はNone
+
+        Note:
+            QPixmapはUIスレッド以外で作成できないため、バックグラウンドでの描画にはこちらを使う
+        """
+        raise NotImplementedError
 
-    @abstractmethod
     def get_text(self, pdf_path: str, page: Optional[int] = None) -> str:
         """PDFからテキストを抽出
 
@@ -93,9 +223,8 @@ class PDFHandler(ABC):
         #     return None
         # except Exception as e:
         #     return f"テキスト抽出エラー: {e}"
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def get_images(self, pdf_path: str, dpi: int = 300) -> list[QPixmap]:
         """PDFから画像を抽出
 
@@ -106,64 +235,95 @@ class PDFHandler(ABC):
         Returns:
             list[QPixmap]: _description_
         """
-        pass
+        raise NotImplementedError
 
-    def load_pdf(self, pdf_path: str, parent_widget=None) -> bool:
+    @_synchronized
+    def load_pdf(self, pdf_path: str, parent_widget=None, show_dialog: bool = True) -> bool:
         """PDFファイルをロードし、総ページ数を取得
 
         Args:
             pdf_path (str): PDFファイルのパス
             parent_widget: エラーダイアログの親ウィジェット
+            show_dialog (bool): エラー時にダイアログを表示するか。Falseの場合は
+                ログ出力のみ行い、エラー内容をlast_load_errorに保持する
 
         Returns:
             bool: 読み込み成功時True、失敗時False
         """
+        import fitz  # PyMuPDF
+        self.last_load_error = None
+
+        def report(error, error_type, additional_info=None):
+            self.error_handler.handle_error(error, error_type, parent_widget,
+                                            show_dialog=show_dialog, additional_info=additional_info)
+            self.last_load_error = (error_type, additional_info)
+
         try:
-            # ファイル存在チェック
-            if not os.path.exists(pdf_path):
+            # ファイル存在チェック（サイズ・更新時刻も同じstat結果から取得する）
+            try:
+                st = os.stat(pdf_path)
+            except FileNotFoundError:
                 error_type = ErrorType.FILE_NOT_FOUND
-                self.error_handler.handle_error(
+                report(
                     FileNotFoundError(f"File not found: {pdf_path}"),
                     error_type,
-                    parent_widget,
                     additional_info=f"ファイルパス: {pdf_path}"
                 )
                 return False
 
+            # 開いたことのあるPDFは、変更されていなければ再解析せずに使い回す
+            cached_doc = self._get_cached_document(pdf_path, st.st_mtime_ns)
+            if cached_doc is not None:
+                self._set_current_document(pdf_path, cached_doc)
+                return True
+
+            # 前回の検証後に変更されていなければ、サイズ・権限の確認を省略する
+            already_validated = self._validated.get(pdf_path) == (st.st_mtime_ns, st.st_size)
+
             # ゼロバイトファイルチェック
-            if os.path.getsize(pdf_path) == 0:
+            if not already_validated and st.st_size == 0:
                 self.logger.warning(f"ゼロバイトファイルをスキップ: {pdf_path}")
                 error_type = ErrorType.FILE_CORRUPTED
-                self.error_handler.handle_error(
+                report(
                     ValueError("File is empty (0 bytes)"),
                     error_type,
-                    parent_widget,
                     additional_info=f"ファイルサイズ: 0バイト\nファイルパス: {pdf_path}"
                 )
                 return False
 
-            # ファイルアクセス権限チェック
-            if not os.access(pdf_path, os.R_OK):
+            # ファイルアクセス権限チェック（実際に開いて確認し、小さいファイルはそのまま読み込む）
+            pdf_data = None
+            try:
+                if st.st_size <= IN_MEMORY_OPEN_MAX_BYTES:
+                    # mmap経由でページキャッシュから直接コピーし、
+                    # Python側の読み込みバッファを経由しない
+                    with open(pdf_path, 'rb') as f, \
+                            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        pdf_data = bytes(mm)
+                elif not already_validated:
+                    open(pdf_path, 'rb').close()
+            except PermissionError:
                 error_type = ErrorType.FILE_PERMISSION_DENIED
-                self.error_handler.handle_error(
+                report(
                     PermissionError(f"Permission denied: {pdf_path}"),
                     error_type,
-                    parent_widget,
                     additional_info=f"ファイルパス: {pdf_path}"
                 )
                 return False
 
             # PyMuPDFでPDFを開く
             try:
-                doc = fitz.open(pdf_path)
+                if pdf_data is not None:
+                    doc = fitz.open(stream=pdf_data, filetype="pdf")
+                else:
+                    doc = fitz.open(pdf_path, filetype="pdf")
             except fitz.FileDataError as e:
                 # PDFファイル構造が破損している場合
                 self.logger.error(f"破損したPDFファイル: {pdf_path} - {str(e)}")
                 error_type = ErrorType.FILE_CORRUPTED
-                self.error_handler.handle_error(
+                report(
                     e,
                     error_type,
-                    parent_widget,
                     additional_info=f"PDFファイルの構造が破損しています\nファイルパス: {pdf_path}"
                 )
                 return False
@@ -172,10 +332,9 @@ class PDFHandler(ABC):
             if doc.is_encrypted:
                 self.logger.warning(f"パスワード保護のためスキップ: {pdf_path}")
                 error_type = ErrorType.FILE_PERMISSION_DENIED
-                self.error_handler.handle_error(
+                report(
                     PermissionError("PDF is password protected"),
                     error_type,
-                    parent_widget,
                     additional_info=f"このPDFはパスワードで保護されています\nパスワード保護を解除してから再度お試しください\n\nファイルパス: {pdf_path}"
                 )
                 doc.close()
@@ -184,41 +343,62 @@ class PDFHandler(ABC):
             # ページ数チェック
             if doc.page_count == 0:
                 error_type = ErrorType.FILE_CORRUPTED
-                self.error_handler.handle_error(
+                report(
                     ValueError("PDF contains no pages"),
                     error_type,
-                    parent_widget,
                     additional_info="PDFにページが含まれていません"
                 )
                 doc.close()
                 return False
 
-            self.total_pages = doc.page_count
-            self.current_pdf = doc
+            self._set_current_document(pdf_path, doc)
+            self._cache_document(pdf_path, doc, st.st_mtime_ns)
+            self._validated[pdf_path] = (st.st_mtime_ns, st.st_size)
             self.logger.info(f"PDF読み込み成功: {pdf_path} ({self.total_pages}ページ)")
             return True
 
         except MemoryError as e:
             # メモリ不足エラー
             error_type = ErrorType.MEMORY_ERROR
-            self.error_handler.handle_error(e, error_type, parent_widget)
+            report(e, error_type)
             self.close()
             return False
             
         except (FileNotFoundError, PermissionError) as e:
             # ファイル関連エラー（上で個別処理済みだが念のため）
             error_type = self.error_handler.classify_file_error(pdf_path, e)
-            self.error_handler.handle_error(e, error_type, parent_widget)
+            report(e, error_type)
             self.close()
             return False
             
         except Exception as e:
             # その他の予期しないエラー
             error_type = self.error_handler.classify_pdf_error(e)
-            self.error_handler.handle_error(e, error_type, parent_widget)
+            report(e, error_type)
             self.close()
             return False
 
+    @_synchronized
+    def load_pdf_quietly(self, pdf_path: str) -> Tuple[int, Optional[Tuple[ErrorType, Optional[str]]]]:
+        """PDFファイルをロードし、総ページ数を返す（ワーカースレッドから呼び出し可能）
+
+        Args:
+            pdf_path (str): PDFファイルのパス
+
+        Returns:
+            Tuple[int, Optional[Tuple[ErrorType, Optional[str]]]]:
+                (総ページ数, エラー内容)。成功時のエラー内容はNone、
+                失敗時の総ページ数は0で、エラー内容は (エラー種別, 追加情報)
+
+        Note:
+            ダイアログはUIスレッド以外で表示できないため、エラー時はログ出力のみ行う。
+            呼び出し元がUIスレッドで、返されたエラー内容をもとにダイアログを表示すること。
+            読み込みとページ数の取得を同じロック内で行うため、他のスレッドの読み込みと混ざらない
+        """
+        if self.load_pdf(pdf_path, show_dialog=False):
+            return self.total_pages, None
+        return 0, self.last_load_error or (ErrorType.UNKNOWN_ERROR, None)
+
     def get_page_count(self) -> int:
         """総ページ数を返す
 
@@ -227,15 +407,23 @@ class PDFHandler(ABC):
         """
         return self.total_pages
 
+    @_synchronized
     def close(self) -> None:
-        """PDFファイルを閉じる"""
+        """PDFファイルを閉じる
+
+        ファイルハンドルを確実に解放するため、キャッシュからも取り除く。
+        """
         if hasattr(self, 'current_pdf') and self.current_pdf is not None:
+            for path, (_, doc) in list(self._doc_cache.items()):
+                if doc is self.current_pdf:
+                    del self._doc_cache[path]
             try:
                 self.current_pdf.close()
             except (ValueError, RuntimeError):
                 # 既にクローズされている場合は無視
                 pass
         self.current_pdf = None
+        self.current_path = None
         self.total_pages = 0
 
 class PyMuPDFHandler(PDFHandler):
@@ -245,36 +433,131 @@ class PyMuPDFHandler(PDFHandler):
     高速かつ機能豊富で、推奨される実装。
     """
 
-    def get_preview(self, pdf_path: str, page: int = 0) -> Optional[QPixmap]:
+    def __init__(self):
+        super().__init__()
+        # プレビュー描画用に使い回すPixmap（同じサイズが続く間は再確保しない）
+        self._preview_pix: "Optional[fitz.Pixmap]" = None
+
+    def _render_page(self, pdf_page, zoom: float) -> "fitz.Pixmap":
+        """ページを描画先Pixmapに描画する
+
+        Args:
+            pdf_page (fitz.Page): 描画するページ
+            zoom (float): 描画倍率
+
+        Returns:
+            fitz.Pixmap: 描画結果（次回の呼び出しで上書きされる）
+
+        Note:
+            同じPDF・同じ倍率のプレビューは同じサイズになるため、
+            前回のPixmapとサイズが一致する場合は白で塗り直して再利用し、
+            数MB単位のバッファ確保をフレームごとに行わないようにする
+        """
+        import fitz  # PyMuPDF
+        matrix = fitz.Matrix(zoom, zoom)
+        irect = (pdf_page.rect * matrix).irect
+        pix = self._preview_pix
+        if pix is None or tuple(pix.irect) != tuple(irect):
+            pix = fitz.Pixmap(fitz.csRGB, irect, False)
+            self._preview_pix = pix
+        pix.clear_with(255)
+        device = fitz.Device(pix, None)
+        try:
+            pdf_page.run(device, matrix)
+        finally:
+            device.close()
+        return pix
+
+    @_synchronized
+    def get_preview(self, pdf_path: str, page: int = 0, target_dpr: float = 1.0) -> Optional[QPixmap]:
         """PDFのプレビュー画像を生成
 
         Args:
             pdf_path (str): PDFファイルのパス
             page (int): ページ番号（0から始まる）。デフォルトは0
+            target_dpr (float): 表示先画面のデバイスピクセル比（HiDPIでは2.0等）
 
         Returns:
             Optional[QPixmap]: プレビュー画像。エラー時はNone
 
         Note:
-            2倍の解像度（Matrix(2,2)）でレンダリングして高品質な画像を生成
+            基準解像度（PREVIEW_BASE_SCALE）にデバイスピクセル比を掛けた倍率で
+            レンダリングし、QPixmapにデバイスピクセル比を設定して返す。
+            論理サイズは画面によらず一定で、HiDPI画面では実ピクセルで鮮明に表示される。
+            MuPDFのサンプルバッファをmemoryviewのままQImageに渡し、
+            QPixmapへの変換時の1回だけコピーが発生するようにしている。
+            描画先のPixmapは同じサイズが続く間は使い回す（_render_page参照）
         """
         try:
-            # 既存PDFが開かれているかを確認
-            if not self.current_pdf or self.current_pdf.name != pdf_path:
-                self.load_pdf(pdf_path)
-
-            if not self.current_pdf or not (0 <= page < self.total_pages):
+            img = self._render_preview(pdf_path, page, target_dpr)
+            if img is None:
                 return None
+            # samples_mvはコピーなしのビュー。pixは次回の描画で上書きされるが、
+            # fromImageでQPixmap側にコピーされるため、この関数内で完結する
+            pixmap = QPixmap.fromImage(img, Qt.NoFormatConversion)
+            pixmap.setDevicePixelRatio(max(target_dpr, 1.0))
+            return pixmap
+
+        except Exception as e:
+            print(f"プレビュー生成エラー: {e}")
+            return None
 
-            pdf_page = self.current_pdf[page]
-            pix = pdf_page.get_pixmap(matrix=fitz.Matrix(2, 2))
-            img = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format_RGB888)
-            return QPixmap.fromImage(img)
+    @_synchronized
+    def get_preview_image(self, pdf_path: str, page: int = 0, target_dpr: float = 1.0) -> Optional[QImage]:
+        """PDFのプレビュー画像をQImageとして生成（ワーカースレッドから呼び出し可能）
+
+        Args:
+            pdf_path (str): PDFファイルのパス
+            page (int): ページ番号（0から始まる）。デフォルトは0
+            target_dpr (float): 表示先画面のデバイスピクセル比（HiDPIでは2.0等）
+
+        Returns:
+            Optional[QImage]: デバイスピクセル比を設定したプレビュー画像。エラー時はNone
+
+        Note:
+            描画先のPixmapは次回の描画で上書きされるため、画素データをコピーしたQImageを返す
+        """
+        try:
+            img = self._render_preview(pdf_path, page, target_dpr)
+            if img is None:
+                return None
+            img = img.copy()
+            img.setDevicePixelRatio(max(target_dpr, 1.0))
+            return img
 
         except Exception as e:
             print(f"プレビュー生成エラー: {e}")
             return None
 
+    def _render_preview(self, pdf_path: str, page: int, target_dpr: float) -> Optional[QImage]:
+        """ページを描画し、描画先Pixmapのバッファを参照するQImageを返す
+
+        Args:
+            pdf_path (str): PDFファイルのパス
+            page (int): ページ番号（0から始まる）
+            target_dpr (float): 表示先画面のデバイスピクセル比
+
+        Returns:
+            Optional[QImage]: 描画結果（コピーなし。次回の描画で上書きされる）。
+                PDFを開けない・ページ番号が範囲外の場合はNone
+
+        Note:
+            呼び出し側でロックを保持すること。
+            ワーカースレッドから呼び出されるため、読み込みエラー時にダイアログは表示しない
+        """
+        # 既存PDFが開かれているかを確認
+        if not self.current_pdf or self.current_path != pdf_path:
+            self.load_pdf(pdf_path, show_dialog=False)
+
+        if not self.current_pdf or not (0 <= page < self.total_pages):
+            return None
+
+        pdf_page = self.current_pdf[page]
+        zoom = PREVIEW_BASE_SCALE * max(target_dpr, 1.0)
+        pix = self._render_page(pdf_page, zoom)
+        return QImage(pix.samples_mv, pix.width, pix.height, pix.stride, QImage.Format_RGB888)
+
+    @_synchronized
     def get_text(self, pdf_path: str, page: Optional[int] = None) -> str:
         """PDFからテキストを抽出
 
@@ -288,17 +571,20 @@ class PyMuPDFHandler(PDFHandler):
         """
         try:
             # 既存PDFが開かれているかを確認
-            if not self.current_pdf or self.current_pdf.name != pdf_path:
+            if not self.current_pdf or self.current_path != pdf_path:
                 self.load_pdf(pdf_path)
 
             if not self.current_pdf:
                 return "PDFファイルを開けませんでした"
 
             if page is None:
-                # 全ページのテキストを取得
-                return "\n".join(p.get_text() for p in self.current_pdf)
+                # 全ページのテキストを取得（ページ数分のリストを確保してから結合）
+                parts = [None] * self.current_pdf.page_count
+                for i, p in enumerate(self.current_pdf):
+                    parts[i] = p.get_text("text", sort=False)
+                return "\n".join(parts)
             elif 0 <= page < self.total_pages:
-                return self.current_pdf[page].get_text()
+                return self.current_pdf[page].get_text("text", sort=False)
             else:
                 return "指定されたページは存在しません"
 
@@ -313,6 +599,7 @@ class PyMuPDFHandler(PDFHandler):
         except Exception as e:
             return f"テキスト抽出エラー: {e}"
 
+    @_synchronized
     def close(self) -> None:
         """PDFファイルを閉じてリソースを解放
 
@@ -323,6 +610,31 @@ class PyMuPDFHandler(PDFHandler):
             self.current_pdf.close()
         super().close()
 
+    @_synchronized
+    def get_image_xrefs(self, pdf_path: str) -> List[int]:
+        """PDF内の埋め込み画像のxrefを出現順に取得
+
+        Args:
+            pdf_path (str): PDFファイルのパス
+
+        Returns:
+            List[int]: 画像のxref（複数ページで共有される画像は出現ごとに含む）。
+                PDFを開けない場合は空リスト
+
+        Note:
+            画像のデコードは行わないため、画像の有無や数だけを
+            知りたい場合はget_imagesよりも大幅に軽い。
+            ジェネレーターではロックが1ステップ分しか効かないため、一覧を作成してから返す
+        """
+        if not self.current_pdf or self.current_path != pdf_path:
+            self.load_pdf(pdf_path)
+
+        if not self.current_pdf:
+            return []
+
+        return [img[0] for page in self.current_pdf for img in page.get_images()]
+
+    @_synchronized
     def get_images(self, pdf_path: str, dpi: int = 300) -> List[QPixmap]:
         """PDFから画像を抽出
 
@@ -336,24 +648,20 @@ class PyMuPDFHandler(PDFHandler):
         Note:
             PDF内に埋め込まれた画像を抽出する。
             各ページから画像を検出し、QPixmapに変換して返す。
+            ロゴ等、複数ページで共有される画像（同じxref）は一度だけデコードする。
         """
         try:
-            if not self.current_pdf or self.current_pdf.name != pdf_path:
-                self.load_pdf(pdf_path)
-
-            if not self.current_pdf:
-                return [] # PDFファイルが開けない場合は空リストを返す
-
             images = []
-            for page in self.current_pdf:
-                # PyMuPDFでの画像抽出処理
-                image_list = page.get_images()
-                if image_list: # 画像が取得できた場合のみ追加
-                    for img in image_list:
-                        xref = img[0]
-                        base_image = self.current_pdf.extract_image(xref)
-                        image_data = QImage.fromData(base_image["image"])
-                        images.append(QPixmap.fromImage(image_data))
+            decoded = {}  # xref -> QPixmap
+            # PDFファイルが開けない場合、get_image_xrefsは空リストを返す
+            for xref in self.get_image_xrefs(pdf_path):
+                pixmap = decoded.get(xref)
+                if pixmap is None:
+                    base_image = self.current_pdf.extract_image(xref)
+                    image_data = QImage.fromData(base_image["image"])
+                    pixmap = QPixmap.fromImage(image_data)
+                    decoded[xref] = pixmap
+                images.append(pixmap)
             return images
 
         except Exception as e:
@@ -367,25 +675,83 @@ class PDF2ImageHandler(PDFHandler):
     学習・参考用の実装で、現在は機能が限定的。
 
     Note:
-        こちらの機能は学習用に実装したため、必要になるまで更新停止の予定
+        こちらの機能は学習用に実装したため、必要になるまで更新停止の予定。
+        プレビューはPyMuPDFでの描画を優先し、失敗した場合のみpdf2imageを使う
     """
-    def get_preview(self, pdf_path: str, page:int = 0) -> Optional[QPixmap]:
+    def __init__(self):
+        super().__init__()
+        # プレビュー描画用のPyMuPDFハンドラー（初回のプレビュー時に作成）
+        self._fast_renderer: Optional[PyMuPDFHandler] = None
+
+    @_synchronized
+    def get_preview(self, pdf_path: str, page:int = 0, target_dpr: float = 1.0) -> Optional[QPixmap]:
         """PDFのプレビュー画像を生成
 
         Args:
             pdf_path (str): PDFファイルのパス
             page (int): ページ番号（0から始まる）。デフォルトは0
+            target_dpr (float): 表示先画面のデバイスピクセル比（本実装では未使用）
 
         Returns:
             Optional[QPixmap]: プレビュー画像。エラー時はNone
 
         Note:
-            pdf2imageを使用してPDFをPIL画像に変換
+            まずPyMuPDFでプロセス内で描画する（pdftoppmの起動と、PPMを経由した
+            画像の受け渡しが不要）。描画できなかった場合のみpdf2imageを使用して
+            PDFをPIL画像に変換する。
+            PyMuPDFハンドラーのみを使う場合に読み込まないよう、pdf2imageは初回呼び出し時にインポートする
+        """
+        if self._fast_renderer is None:
+            self._fast_renderer = PyMuPDFHandler()
+        pixmap = self._fast_renderer.get_preview(pdf_path, page, target_dpr)
+        if pixmap is not None:
+            return pixmap
+
+        try:
+            from pdf2image import convert_from_path
+            images = convert_from_path(pdf_path, first_page=page+1, last_page=page+1)
+            if images:
+                # PILのtoqpixmapはRGBA変換を経由するため、RGBの画素データからQImageを直接作成する
+                # （QImageはデータをコピーしないが、QPixmap.fromImageの時点で複製されるため、
+                #   dataは変換が終わるまで参照していればよい）
+                pil_image = images[0].convert('RGB')
+                data = pil_image.tobytes('raw', 'RGB')
+                img = QImage(data, pil_image.width, pil_image.height, pil_image.width * 3, QImage.Format_RGB888)
+                return QPixmap.fromImage(img)
+        except Exception as e:
+            print(f"プレビュー生成エラー: {e}")
+        return None
+
+    @_synchronized
+    def get_preview_image(self, pdf_path: str, page: int = 0, target_dpr: float = 1.0) -> Optional[QImage]:
+        """PDFのプレビュー画像をQImageとして生成（ワーカースレッドから呼び出し可能）
+
+        Args:
+            pdf_path (str): PDFファイルのパス
+            page (int): ページ番号（0から始まる）。デフォルトは0
+            target_dpr (float): 表示先画面のデバイスピクセル比（本実装のpdf2imageでは未使用）
+
+        Returns:
+            Optional[QImage]: プレビュー画像。エラー時はNone
+
+        Note:
+            get_previewと同様に、PyMuPDFでの描画を優先する
         """
+        if self._fast_renderer is None:
+            self._fast_renderer = PyMuPDFHandler()
+        img = self._fast_renderer.get_preview_image(pdf_path, page, target_dpr)
+        if img is not None:
+            return img
+
         try:
+            from pdf2image import convert_from_path
             images = convert_from_path(pdf_path, first_page=page+1, last_page=page+1)
             if images:
-                return images[0].toqpixmap()
+                pil_image = images[0].convert('RGB')
+                data = pil_image.tobytes('raw', 'RGB')
+                # dataは呼び出し元に返らないため、画素データをコピーしたQImageを返す
+                return QImage(data, pil_image.width, pil_image.height, pil_image.width * 3,
+                              QImage.Format_RGB888).copy()
         except Exception as e:
             print(f"プレビュー生成エラー: {e}")
         return None
@@ -405,3 +771,27 @@ class PDF2ImageHandler(PDFHandler):
         """
         return "PDF2Imageハンドラーではテキスト抽出未対応"
 
+
+# ハンドラー名と実装クラスの対応表（config.tomlの[pdf] handlerの値で選択）
+HANDLERS = {
+    'pymupdf': PyMuPDFHandler,
+    'pdf2image': PDF2ImageHandler,
+}
+
+
+def make_pdf_handler(name: str) -> PDFHandler:
+    """ハンドラー名に対応するPDFハンドラーを生成
+
+    Args:
+        name (str): ハンドラー名（'pymupdf' または 'pdf2image'、大文字小文字は区別しない）
+
+    Returns:
+        PDFHandler: 生成したPDFハンドラー
+
+    Raises:
+        ValueError: 未知のハンドラー名が指定された場合
+    """
+    handler_class = HANDLERS.get(name.lower())
+    if handler_class is None:
+        raise ValueError(f"未知のPDFハンドラが指定されています: {name}")
+    return handler_class()
@@ -23,9 +23,22 @@ the Free Software Foundation, either version 3 of the License, or
 This program is distributed WITHOUT ANY WARRANTY; for more details see
 the LICENSE file in the distribution root.
 """
-from typing import List, Dict, Tuple, Optional, Union
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, List, Dict, Tuple, Optional, Union
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from dataclasses import dataclass
-import fitz  # PyMuPDF
+import hashlib
+import logging
+import math
+import os
+import queue
+import re
+import tempfile
+import threading
 import pytesseract
 from PIL import Image
 import io
@@ -33,10 +46,156 @@ from PySide6.QtCore import QRect
 from invoice_renamer.utils.logger import setup_logger
 from invoice_renamer.utils.error_handler import ErrorHandler, ErrorType
 from invoice_renamer.logic.config_manager import ConfigManager
-from invoice_renamer.logic.ocr_preprocess import preprocess_variants
+from invoice_renamer.logic.ocr_preprocess import iter_preprocess_variants, resize_for_ocr, to_grayscale
+
+if TYPE_CHECKING:
+    # PyMuPDFは読み込みに時間がかかるため、起動時にはインポートせず、
+    # 実際にPDFを扱うメソッド内で初回使用時にインポートする
+    import fitz  # PyMuPDF
+
+try:
+    import numpy as np
+except ImportError:
+    # numpyがない環境では、スパンの絞り込みをPythonのループで行う
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    # numbaがない環境では、numpyの配列演算でスパンを絞り込む
+    njit = None
+
+try:
+    import tesserocr
+except ImportError:
+    # tesserocrがない環境では、pytesseract（tesseractコマンドの起動）で処理する
+    tesserocr = None
+
+
+def _read_ocr_concurrency() -> int:
+    """環境変数からOCRの同時実行数を取得
+
+    Returns:
+        int: 同時実行数（1以上）。未設定・整数でない場合はCPU数
+
+    Note:
+        モジュールの読み込み時に呼ばれるため、不正な値でも例外を出さず、警告を記録して既定値を使う
+    """
+    default = os.cpu_count() or 1
+    value = os.environ.get('INVOICE_RENAMER_OCR_CONCURRENCY')
+    if value is None:
+        return default
+    try:
+        return max(1, int(value))
+    except ValueError:
+        setup_logger('invoice_renamer.selection_analyzer').warning(
+            "INVOICE_RENAMER_OCR_CONCURRENCY の値が整数ではないため、CPU数（%d）を使用します: %r", default, value)
+        return default
+
+
+# 同時に実行するOCRの上限数（環境変数 INVOICE_RENAMER_OCR_CONCURRENCY で変更可能）
+# 複数の分析が重なった場合も含め、モジュール全体でこの数を超えないようにする
+OCR_CONCURRENCY = _read_ocr_concurrency()
+_ocr_semaphore = threading.BoundedSemaphore(OCR_CONCURRENCY)
+
+# 開いたPDFドキュメントを保持する最大数（LRUで古いものから閉じる）
+DOCUMENT_CACHE_SIZE = 4
+
+# OCR用描画で目標とする文字の高さ（ピクセル）。Tesseractの精度が安定する大きさ
+OCR_TARGET_TEXT_HEIGHT_PX = 20
+
+# OCR用に描画する画素データの上限（バイト）。超える場合は倍率を下げて描画する
+MAX_RENDER_BYTES = 50 * 1024 * 1024
+
+# OCR用描画の倍率の範囲（テキスト情報から倍率を決める場合）
+OCR_MIN_SCALE = 1.0
+OCR_MAX_SCALE = 3.0
+
+# テキスト情報がない場合の、OCR用描画の長辺の上限（ピクセル）
+# OCR前の4Mピクセル制限（2000px四方）に収まるように描画し、後からの縮小を不要にする
+OCR_MAX_RENDER_DIMENSION = 2000
+
+# 長辺がOCR_MAX_RENDER_DIMENSIONを超えるJPEGを、デコード時に縮小する際の短辺の下限（ピクセル）
+# JPEGデコーダーは1/2・1/4・1/8の縮小を展開と同時に行えるため、全解像度での展開を省ける
+JPEG_DRAFT_MIN_DIMENSION = 1000
 
+# 座標変換行列のキャッシュの最大数（超えた場合はまとめて破棄する）
+MATRIX_CACHE_SIZE = 64
 
-@dataclass
+# ページ内の埋め込み画像のうち、選択範囲との重なりを調べる最大数
+MAX_IMAGES_PER_PAGE = 3
+
+# 日本語専用OCRでの再試行を省く条件（英数字の文字数と、平均信頼度の下限）
+ASCII_ACCEPT_MIN_CHARS = 3
+ASCII_ACCEPT_CONFIDENCE = 70
+
+# スパンの絞り込みをnumbaのコンパイル済み関数で行うスパン数の下限
+# （少ない場合はnumpyの配列演算の方が呼び出しの手間が少ない）
+NUMBA_FILTER_MIN_SPANS = 512
+
+# 読み順のソートをnumpyで行う要素数の下限（少ない場合はsortedの方が速い）
+VECTORIZED_SORT_MIN_COUNT = 64
+
+# 複数選択範囲のパイプライン処理で、段と段をつなぐキューの上限数
+PIPELINE_QUEUE_SIZE = 8
+
+# OCR結果のキャッシュ（画像内容のハッシュ -> 結果）の最大数
+# 環境変数 INVOICE_RENAMER_DISABLE_OCR_CACHE を設定するとキャッシュを使わない
+OCR_RESULT_CACHE_SIZE = 256
+OCR_RESULT_CACHE_ENABLED = not os.environ.get('INVOICE_RENAMER_DISABLE_OCR_CACHE')
+
+# 日本語文字（ひらがな・カタカナ・CJK統合漢字・CJK拡張A・半角カタカナ）
+_JP_RE = re.compile(r'[\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FAF\u3400-\u4DBF\uFF66-\uFF9D]')
+# ASCIIの英数字（str.isascii() and str.isalnum() と同じ文字）
+_ASCII_ALNUM_RE = re.compile(r'[A-Za-z0-9]')
+
+if njit is not None:
+    @njit(cache=True)
+    def _filter_spans_nb(bboxes, x0, y0, x1, y1):
+        """選択範囲と重なるスパンの番号を返す（numbaでコンパイル）"""
+        count = 0
+        indices = np.empty(bboxes.shape[0], dtype=np.int64)
+        for i in range(bboxes.shape[0]):
+            if bboxes[i, 2] >= x0 and bboxes[i, 0] <= x1 and bboxes[i, 3] >= y0 and bboxes[i, 1] <= y1:
+                indices[count] = i
+                count += 1
+        return indices[:count]
+else:
+    _filter_spans_nb = None
+
+
+@lru_cache(maxsize=32)
+def _parse_tesseract_config(config: str) -> Tuple[int, Tuple[Tuple[str, str], ...]]:
+    """pytesseract形式の設定文字列からページ分割モードと変数を取り出す
+
+    Args:
+        config (str): '--oem 3 --psm 6 -c key=value' 形式の設定文字列
+
+    Returns:
+        Tuple[int, Tuple[Tuple[str, str], ...]]: (ページ分割モード, (変数名, 値)のタプル)
+
+    Note:
+        --oem はAPI初期化時に既定値（OEM.DEFAULT）を使うため無視する。
+        設定文字列の種類は限られるため、解析結果はキャッシュする
+    """
+    psm = 3  # tesseractの既定値（自動レイアウト解析）
+    variables = {}
+    tokens = config.split()
+    i = 0
+    while i < len(tokens):
+        if tokens[i] == '--psm' and i + 1 < len(tokens):
+            psm = int(tokens[i + 1])
+            i += 2
+        elif tokens[i] == '-c' and i + 1 < len(tokens):
+            key, _, value = tokens[i + 1].partition('=')
+            variables[key] = value
+            i += 2
+        else:
+            i += 1
+    return psm, tuple(variables.items())
+
+
+@dataclass(slots=True)
 class AnalysisResult:
     """分析結果を格納するデータクラス
 
@@ -54,7 +213,7 @@ class AnalysisResult:
     reading_order: int
 
 
-@dataclass
+@dataclass(slots=True)
 class SelectionData:
     """選択範囲情報を格納するデータクラス
 
@@ -84,7 +243,264 @@ class SelectionAnalyzer:
         self.logger = setup_logger('invoice_renamer.selection_analyzer')
         self.error_handler = ErrorHandler(self.logger)
         self.config_manager = ConfigManager()
-        
+        # 言語ごとに待機中のtesserocr APIを保持する（言語 -> [API, 適用中の設定文字列, 変数の既定値] のリスト）
+        # 分析はスレッドを変えて実行されるため、スレッドではなく言語の単位で使い回す
+        self._tess_apis: Dict[str, list] = {}
+        self._tess_lock = threading.Lock()
+        self._tess_failed_langs = set()
+        # 開いたPDFのキャッシュ（パス -> (更新時刻, ドキュメント)）。同じPDFで範囲選択を
+        # 繰り返す場合に、ファイルの読み込みと解析を省略する
+        self._doc_cache: "OrderedDict[str, Tuple[float, fitz.Document]]" = OrderedDict()
+        # ページごとのテキスト情報のキャッシュ（(パス, ページ番号) -> (スパンのリスト, bbox配列)）
+        self._textdict_cache: Dict[Tuple[str, int], tuple] = {}
+        # ページごとの埋め込み画像情報のキャッシュ（(パス, ページ番号) -> (画像数, 画像位置のリスト)）
+        self._images_cache: Dict[Tuple[str, int], tuple] = {}
+        # 座標変換行列のキャッシュ（(ページ矩形, ズーム倍率, プレビューサイズ) -> 行列等）
+        self._matrix_cache: Dict[tuple, tuple] = {}
+        # 分析中のドキュメントの参照数（id(ドキュメント) -> 参照数）。参照中は閉じない
+        self._doc_pins: Dict[int, int] = {}
+        # PyMuPDFのドキュメントは複数スレッドから同時に操作できないため、
+        # キャッシュしたドキュメントへのアクセスはこのロックで直列化する
+        self._doc_lock = threading.RLock()
+        # OCR結果のキャッシュ（(画像内容のハッシュ, 言語, 設定) -> (テキスト, 信頼度)）
+        # ページの移動や再分析で同じ画像（ロゴ・印影等）を繰り返しOCRしないようにする
+        self._ocr_result_cache: "OrderedDict[tuple, Tuple[str, float]]" = OrderedDict()
+        self._ocr_result_cache_lock = threading.Lock()
+        # 画像要素のOCRを実行するスレッドプール。分析のたびに作らず、インスタンスで共有する
+        # （スレッドは必要になった時点で作られ、以降の分析で使い回される）
+        self._ocr_pool = ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, OCR_CONCURRENCY),
+                                            thread_name_prefix='ocr')
+        # 補正画像でのOCR再試行のうち、2つ目以降の変種を先行して実行するスレッドプール
+        # （_ocr_poolのタスク内から完了を待つため、_ocr_poolとは別にする）
+        self._ocr_retry_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ocr-retry')
+
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        """OCR用のスレッドプール、保持しているtesserocr APIとPDFドキュメントを解放"""
+        for pool_name in ('_ocr_pool', '_ocr_retry_pool'):
+            pool = getattr(self, pool_name, None)
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+        doc_cache = getattr(self, '_doc_cache', None)
+        if doc_cache:
+            with self._doc_lock:
+                for pdf_path in list(doc_cache):
+                    self._evict_doc(pdf_path)
+
+        tess_apis = getattr(self, '_tess_apis', None)
+        if not tess_apis:
+            return
+        with self._tess_lock:
+            for entries in tess_apis.values():
+                for entry in entries:
+                    entry[0].End()
+            tess_apis.clear()
+
+    def release_document(self, pdf_path: str):
+        """指定したPDFのドキュメントと、そのテキスト・画像情報のキャッシュを解放
+
+        Args:
+            pdf_path (str): PDFファイルのパス
+
+        Note:
+            開いたままのドキュメントはファイルハンドルを保持するため、
+            Windowsではファイルの移動・削除の前に呼び出す必要がある。
+            分析中のドキュメントは、その分析の終了時に閉じられる
+        """
+        with self._doc_lock:
+            if pdf_path in self._doc_cache:
+                self._evict_doc(pdf_path)
+            else:
+                for cache in (self._textdict_cache, self._images_cache):
+                    for key in [key for key in cache if key[0] == pdf_path]:
+                        del cache[key]
+
+    def _acquire_doc(self, pdf_path: str) -> fitz.Document:
+        """キャッシュからPDFドキュメントを取得し、使用中として登録
+
+        Args:
+            pdf_path (str): PDFファイルのパス
+
+        Returns:
+            fitz.Document: 開いたドキュメント。使い終わったら_release_docを呼ぶこと
+
+        Note:
+            呼び出し側で_doc_lockを保持すること。
+            ファイルの更新時刻が変わっていれば開き直す
+        """
+        import fitz  # PyMuPDF
+        mtime = os.path.getmtime(pdf_path)
+        cached = self._doc_cache.get(pdf_path)
+        if cached is not None and cached[0] == mtime:
+            self._doc_cache.move_to_end(pdf_path)
+            doc = cached[1]
+        else:
+            if cached is not None:
+                self._evict_doc(pdf_path)
+            doc = fitz.open(pdf_path)
+            self._doc_cache[pdf_path] = (mtime, doc)
+            while len(self._doc_cache) > DOCUMENT_CACHE_SIZE:
+                self._evict_doc(next(iter(self._doc_cache)))
+        self._doc_pins[id(doc)] = self._doc_pins.get(id(doc), 0) + 1
+        return doc
+
+    def _release_doc(self, doc: fitz.Document):
+        """_acquire_docで取得したドキュメントの使用を終了
+
+        Note:
+            呼び出し側で_doc_lockを保持すること。
+            使用中にキャッシュから外れたドキュメントは、ここで閉じる
+        """
+        pins = self._doc_pins.get(id(doc), 0) - 1
+        if pins > 0:
+            self._doc_pins[id(doc)] = pins
+            return
+        self._doc_pins.pop(id(doc), None)
+        if not any(entry[1] is doc for entry in self._doc_cache.values()):
+            doc.close()
+
+    def _evict_doc(self, pdf_path: str):
+        """ドキュメントとそのテキスト・画像情報をキャッシュから削除
+
+        Note:
+            呼び出し側で_doc_lockを保持すること。
+            分析中のドキュメントは閉じず、_release_docの時点で閉じる
+        """
+        _, doc = self._doc_cache.pop(pdf_path)
+        for cache in (self._textdict_cache, self._images_cache):
+            for key in [key for key in cache if key[0] == pdf_path]:
+                del cache[key]
+        if id(doc) not in self._doc_pins:
+            doc.close()
+
+    @contextmanager
+    def _tess_api(self, lang: str, config: str):
+        """指定言語・設定のtesserocr APIを借り受ける
+
+        Args:
+            lang (str): OCR言語（'jpn+eng'等）
+            config (str): pytesseract形式の設定文字列
+
+        Yields:
+            tesserocr.PyTessBaseAPI: 初期化・設定済みのAPI
+
+        Note:
+            APIは同時に複数スレッドから使えないため、使用中は待機リストから外す。
+            言語モデルの読み込みは生成時の1回だけ行い、設定（ページ分割モード・変数）が
+            異なる呼び出しでは、同じAPIの設定を切り替えて使い回す。
+            同じ設定が適用済みのAPIが待機していれば、それを優先して使う
+        """
+        with self._tess_lock:
+            entries = self._tess_apis.setdefault(lang, [])
+            entry = None
+            for i in range(len(entries) - 1, -1, -1):
+                if entries[i][1] == config:
+                    entry = entries.pop(i)
+                    break
+            if entry is None and entries:
+                entry = entries.pop()
+        if entry is None:
+            entry = [tesserocr.PyTessBaseAPI(lang=lang, oem=tesserocr.OEM.DEFAULT), None, {}]
+        if entry[1] != config:
+            self._configure_tess_api(entry, config)
+        try:
+            yield entry[0]
+        finally:
+            with self._tess_lock:
+                self._tess_apis.setdefault(lang, []).append(entry)
+
+    @staticmethod
+    def _configure_tess_api(entry: list, config: str):
+        """待機中のtesserocr APIに設定文字列の内容を適用
+
+        Args:
+            entry (list): [API, 適用中の設定文字列, 変数の既定値]
+            config (str): pytesseract形式の設定文字列
+
+        Note:
+            前の設定で変更した変数は既定値に戻してから、新しい設定を適用する
+            （文字の制限等が別の設定の呼び出しに残らないようにする）
+        """
+        api, _, defaults = entry
+        for name, value in defaults.items():
+            api.SetVariable(name, value)
+        psm, variables = _parse_tesseract_config(config)
+        api.SetPageSegMode(psm)
+        for name, value in variables:
+            if name not in defaults:
+                defaults[name] = api.GetVariableAsString(name) or ''
+            api.SetVariable(name, value)
+        entry[1] = config
+
+    def _image_to_string(self, image: Image.Image, config: str, lang: str) -> str:
+        """画像をOCRしてテキストを返す（pytesseract.image_to_string互換）"""
+        return self._image_to_string_with_conf(image, config, lang)[0]
+
+    def _image_to_string_with_conf(self, image: Image.Image, config: str, lang: str) -> Tuple[str, Optional[int]]:
+        """画像をOCRしてテキストと平均信頼度を返す
+
+        Args:
+            image (Image.Image): OCR対象の画像
+            config (str): pytesseract形式の設定文字列
+            lang (str): OCR言語
+
+        Returns:
+            Tuple[str, Optional[int]]: (認識されたテキスト, 単語の平均信頼度0〜100)
+                信頼度はtesserocrで処理した場合のみ得られ、それ以外はNone
+
+        Note:
+            tesserocrが使える場合は常駐するAPIで処理し、呼び出しごとの
+            tesseractプロセス起動と言語モデルの再読み込みを省く。
+            使えない場合や言語モデルの初期化に失敗した場合はpytesseractで処理する
+        """
+        if tesserocr is None or lang in self._tess_failed_langs:
+            return pytesseract.image_to_string(image, config=config, lang=lang), None
+
+        try:
+            with self._tess_api(lang, config) as api:
+                api.SetImage(image)
+                text = api.GetUTF8Text()
+                return text, api.MeanTextConf()
+        except RuntimeError as e:
+            # 言語モデルが見つからない等でAPIを初期化できない場合
+            self.logger.warning(f"tesserocrを初期化できないため、pytesseractで処理します (lang={lang}): {e}")
+            self._tess_failed_langs.add(lang)
+            return pytesseract.image_to_string(image, config=config, lang=lang), None
+
+    def warmup(self, ocr_language: str = 'jpn+eng'):
+        """OCRエンジンの初期化をバックグラウンドで開始
+
+        Args:
+            ocr_language (str): 事前に読み込むOCR言語（'auto'の場合は'jpn+eng'）
+
+        Note:
+            言語モデルの読み込みは最初のOCRで行われるため、何もしないと
+            最初の範囲選択だけが遅くなる。アプリ起動時に呼び出し、
+            OCR用のスレッドプールで小さな白画像を1回OCRしておく
+        """
+        lang = 'jpn+eng' if ocr_language == 'auto' else ocr_language
+        try:
+            self._ocr_pool.submit(self._warmup_ocr, lang)
+        except RuntimeError:
+            # close済みでスレッドプールが停止している場合
+            pass
+
+    def _warmup_ocr(self, lang: str):
+        """小さな白画像をOCRし、tesserocr APIの生成と言語モデルの読み込みを済ませる
+
+        Args:
+            lang (str): OCR言語
+        """
+        try:
+            self._image_to_string(Image.new('L', (32, 32), 255), '--oem 3 --psm 6', lang)
+            self.logger.debug(f"OCRエンジンの事前初期化が完了しました (lang={lang})")
+        except Exception as e:
+            # 事前初期化に失敗しても、実際の分析時に改めて初期化される
+            self.logger.debug(f"OCRエンジンの事前初期化に失敗しました (lang={lang}): {e}")
+
     def analyze_selection(self, selection: SelectionData, analysis_params: dict = None, quick_mode: bool = False) -> List[AnalysisResult]:
         """
         選択範囲内の要素を分析し、結果を返す
@@ -98,98 +514,212 @@ class SelectionAnalyzer:
             List[AnalysisResult]: 分析結果のリスト
         """
         try:
-            # メモリ使用量チェック
-            if not self._check_memory_usage():
-                self.logger.warning("メモリ使用率が高いため、高速モードに切り替えます")
-                quick_mode = True
-            
-            doc = fitz.open(selection.pdf_path)
-            page = doc[selection.page_number]
-            
-            # 分析パラメータから情報を取得
-            if analysis_params is None:
-                analysis_params = {}
-            zoom_scale = analysis_params.get('zoom_scale', 1.0)
-            preview_size = analysis_params.get('preview_size', (800, 600))
-            ocr_language = analysis_params.get('ocr_language', 'jpn+eng')
-            
-            # 分析モードの状態を常にログ出力
-            self.logger.info(f"🔍 SelectionAnalyzer - 分析モード: {'詳細' if not quick_mode else '高速'} (quick_mode={quick_mode})")
-            
-            # Qt座標をPDF座標に変換（ズームを考慮）
-            pdf_rect = self._convert_qt_to_pdf_coords_with_zoom(selection.rect, page, zoom_scale, preview_size, quick_mode)
-            
-            if not quick_mode:
-                # 詳細な診断情報を出力（詳細モードのみ）
-                self.logger.info("=" * 60)
-                self.logger.info(f"選択範囲分析開始（詳細モード）")
-                self.logger.info(f"Qt選択範囲: x={selection.rect.x()}, y={selection.rect.y()}, w={selection.rect.width()}, h={selection.rect.height()}")
-                self.logger.info(f"プレビューサイズ: {preview_size}")
-                self.logger.info(f"PDF範囲: {pdf_rect}")
-                self.logger.info(f"ページサイズ: {page.rect}")
+            with self._doc_lock:
+                doc = self._acquire_doc(selection.pdf_path)
+            try:
+                with self._doc_lock:
+                    page = doc[selection.page_number]
+                    context = self._locate_selection(page, selection, analysis_params, quick_mode)
+                    self._extract_selection_elements(page, context, quick_mode)
+                return self._analyze_selection_elements(page, selection, context, quick_mode)
+            finally:
+                with self._doc_lock:
+                    self._release_doc(doc)
             
-            # 選択範囲内の要素を取得（高速モード対応）
-            text_elements = self._extract_text_elements(page, pdf_rect, quick_mode)
-            image_elements = self._extract_image_elements_optimized(page, pdf_rect, quick_mode)
+        except Exception as e:
+            return self._create_error_results(e)
+
+    def analyze_selections_batch(self, selections: List[SelectionData], analysis_params: dict = None, quick_mode: bool = False) -> List[List[AnalysisResult]]:
+        """
+        複数の選択範囲をパイプライン処理で分析する
+        
+        Args:
+            selections (List[SelectionData]): 選択範囲情報のリスト
+            analysis_params (dict): 分析パラメータ (zoom_scale, preview_size等)
+            quick_mode (bool): 高速モード（詳細ログを省略）
             
-            if not quick_mode:
-                self.logger.info(f"抽出されたテキスト要素: {len(text_elements)}個")
-                self.logger.info(f"抽出された画像要素: {len(image_elements)}個")
+        Returns:
+            List[List[AnalysisResult]]: 選択範囲ごとの分析結果（selectionsと同じ順序）
 
-            # 分析結果を統合
-            results = []
+        Note:
+            座標変換(A) → 要素抽出(B) → OCR(C) の3段をスレッドで並行動作させ、
+            有界キューでつなぐ。ある選択範囲のOCR中に次の選択範囲の抽出を進めるため、
+            全体の処理時間は各段の合計ではなく、最も遅い段の時間に近づく。
+            PDFはキャッシュから取得し、処理中の選択範囲が残っている間は閉じない。
+            PyMuPDFのドキュメントは複数スレッドから同時に操作できないため、
+            PyMuPDFを呼び出す処理はロックで直列化する（OCRとは並行して動作する）
+        """
+        if not selections:
+            return []
 
-            # テキスト要素を処理
-            text_results = self._process_text_elements(text_elements)
-            results.extend(text_results)
+        results: List[Optional[List[AnalysisResult]]] = [None] * len(selections)
+        extract_queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        ocr_queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        fitz_lock = self._doc_lock
 
-            # テキスト要素が存在する場合はOCRをスキップ
-            # （テキスト型PDFの場合、OCRは不要で精度も低いため）
-            if len(text_results) > 0:
-                if not quick_mode:
-                    self.logger.info(f"✅ テキスト要素が{len(text_results)}個検出されたため、OCR処理をスキップします")
-            else:
-                # テキスト要素がない場合のみOCRを実行
-                if not quick_mode:
-                    self.logger.info("📷 テキスト要素が検出されなかったため、OCR処理を実行します")
-                results.extend(self._process_image_elements_optimized(image_elements, page, ocr_language, quick_mode))
+        def release_document(doc):
+            with fitz_lock:
+                self._release_doc(doc)
 
-            # 読み順でソート
-            results = self._sort_by_reading_order(results)
-            
-            # 結果が空の場合でも、診断情報を含む結果を返す
-            if not results:
-                if not quick_mode:
-                    self.logger.info("分析結果が空のため、診断結果を作成")
-                    diagnostic_info = self._create_diagnostic_info(page, pdf_rect, preview_size, selection.rect)
-                else:
-                    diagnostic_info = "選択範囲内にテキストが見つかりませんでした。"
-                    
-                default_result = AnalysisResult(
-                    text=diagnostic_info,
-                    element_type="diagnostic",
-                    confidence=0.0,
-                    bbox=(pdf_rect.x0, pdf_rect.y0, pdf_rect.x1, pdf_rect.y1),
-                    reading_order=0
-                )
-                results = [default_result]
-            
+        def stage_locate():
+            # 段A: PDFを開き、選択範囲をPDF座標に変換する
+            for index, selection in enumerate(selections):
+                doc = None
+                try:
+                    with fitz_lock:
+                        doc = self._acquire_doc(selection.pdf_path)
+                        page = doc[selection.page_number]
+                        context = self._locate_selection(page, selection, analysis_params, quick_mode)
+                    extract_queue.put((index, selection, doc, page, context))
+                except Exception as e:
+                    results[index] = self._create_error_results(e)
+                    if doc is not None:
+                        release_document(doc)
+            extract_queue.put(None)
+
+        def stage_extract():
+            # 段B: 選択範囲内のテキスト・画像要素を抽出する
+            while True:
+                item = extract_queue.get()
+                if item is None:
+                    break
+                index, selection, doc, page, context = item
+                try:
+                    with fitz_lock:
+                        self._extract_selection_elements(page, context, quick_mode)
+                    ocr_queue.put(item)
+                except Exception as e:
+                    results[index] = self._create_error_results(e)
+                    release_document(doc)
+            ocr_queue.put(None)
+
+        def stage_ocr():
+            # 段C: OCRと結果の整理を行う
+            while True:
+                item = ocr_queue.get()
+                if item is None:
+                    break
+                index, selection, doc, page, context = item
+                try:
+                    results[index] = self._analyze_selection_elements(page, selection, context, quick_mode, fitz_lock)
+                except Exception as e:
+                    results[index] = self._create_error_results(e)
+                finally:
+                    release_document(doc)
+
+        threads = [threading.Thread(target=stage, daemon=True)
+                   for stage in (stage_locate, stage_extract, stage_ocr)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        return results
+
+    def _locate_selection(self, page: fitz.Page, selection: SelectionData, analysis_params: Optional[dict], quick_mode: bool) -> dict:
+        """分析パラメータを取り出し、選択範囲をPDF座標に変換"""
+        # 分析パラメータから情報を取得
+        if analysis_params is None:
+            analysis_params = {}
+        zoom_scale = analysis_params.get('zoom_scale', 1.0)
+        preview_size = analysis_params.get('preview_size', (800, 600))
+        ocr_language = analysis_params.get('ocr_language', 'jpn+eng')
+        
+        # 分析モードの状態を常にログ出力
+        self.logger.info(f"🔍 SelectionAnalyzer - 分析モード: {'詳細' if not quick_mode else '高速'} (quick_mode={quick_mode})")
+        
+        # Qt座標をPDF座標に変換（ズームを考慮）
+        pdf_rect = self._convert_qt_to_pdf_coords_with_zoom(selection.rect, page, zoom_scale, preview_size, quick_mode)
+        
+        if not quick_mode:
+            # 詳細な診断情報を出力（詳細モードのみ）
+            self.logger.info("=" * 60)
+            self.logger.info(f"選択範囲分析開始（詳細モード）")
+            self.logger.info(f"Qt選択範囲: x={selection.rect.x()}, y={selection.rect.y()}, w={selection.rect.width()}, h={selection.rect.height()}")
+            self.logger.info(f"プレビューサイズ: {preview_size}")
+            self.logger.info(f"PDF範囲: {pdf_rect}")
+            self.logger.info(f"ページサイズ: {page.rect}")
+
+        return {
+            'pdf_rect': pdf_rect,
+            'preview_size': preview_size,
+            'ocr_language': ocr_language,
+        }
+
+    def _extract_selection_elements(self, page: fitz.Page, context: dict, quick_mode: bool):
+        """選択範囲内のテキスト・画像要素を抽出してcontextに格納"""
+        pdf_rect = context['pdf_rect']
+        # 選択範囲内の要素を取得（高速モード対応）
+        context['text_elements'] = self._extract_text_elements(page, pdf_rect, quick_mode)
+        # テキスト要素がある場合はOCRを行わないため、画像の描画・抽出も省略する
+        if context['text_elements']:
+            context['image_elements'] = []
+        else:
+            context['image_elements'] = self._extract_image_elements_optimized(page, pdf_rect, quick_mode)
+        
+        if not quick_mode:
+            self.logger.info(f"抽出されたテキスト要素: {len(context['text_elements'])}個")
+            self.logger.info(f"抽出された画像要素: {len(context['image_elements'])}個")
+
+    def _analyze_selection_elements(self, page: fitz.Page, selection: SelectionData, context: dict, quick_mode: bool, fitz_lock=None) -> List[AnalysisResult]:
+        """抽出済みの要素を処理し、読み順に並べた分析結果を返す"""
+        pdf_rect = context['pdf_rect']
+
+        # 分析結果を統合
+        results = []
+
+        # テキスト要素を処理
+        text_results = self._process_text_elements(context['text_elements'])
+        results.extend(text_results)
+
+        # テキスト要素が存在する場合はOCRをスキップ
+        # （テキスト型PDFの場合、OCRは不要で精度も低いため）
+        if len(text_results) > 0:
             if not quick_mode:
-                self.logger.info("=" * 60)
-            doc.close()
-            return results
-            
-        except Exception as e:
-            self.logger.error(f"選択範囲分析エラー: {str(e)}", exc_info=True)
-            # エラーの場合でも空でない結果を返す
-            error_result = AnalysisResult(
-                text=f"分析エラー: {str(e)}",
-                element_type="error",
+                self.logger.info(f"✅ テキスト要素が{len(text_results)}個検出されたため、OCR処理をスキップします")
+        else:
+            # テキスト要素がない場合のみOCRを実行
+            if not quick_mode:
+                self.logger.info("📷 テキスト要素が検出されなかったため、OCR処理を実行します")
+            results.extend(self._process_image_elements_optimized(context['image_elements'], page, context['ocr_language'], quick_mode))
+
+        # 読み順でソート
+        results = self._sort_by_reading_order(results)
+        
+        # 結果が空の場合でも、診断情報を含む結果を返す
+        if not results:
+            if not quick_mode:
+                self.logger.info("分析結果が空のため、診断結果を作成")
+                with fitz_lock or self._doc_lock:
+                    diagnostic_info = self._create_diagnostic_info(page, pdf_rect, context['preview_size'], selection.rect)
+            else:
+                diagnostic_info = "選択範囲内にテキストが見つかりませんでした。"
+                
+            default_result = AnalysisResult(
+                text=diagnostic_info,
+                element_type="diagnostic",
                 confidence=0.0,
-                bbox=(0, 0, 0, 0),
+                bbox=(pdf_rect.x0, pdf_rect.y0, pdf_rect.x1, pdf_rect.y1),
                 reading_order=0
             )
-            return [error_result]
+            results = [default_result]
+        
+        if not quick_mode:
+            self.logger.info("=" * 60)
+        return results
+
+    def _create_error_results(self, e: Exception) -> List[AnalysisResult]:
+        """分析エラー時の結果を作成"""
+        self.logger.error(f"選択範囲分析エラー: {str(e)}", exc_info=True)
+        # エラーの場合でも空でない結果を返す
+        error_result = AnalysisResult(
+            text=f"分析エラー: {str(e)}",
+            element_type="error",
+            confidence=0.0,
+            bbox=(0, 0, 0, 0),
+            reading_order=0
+        )
+        return [error_result]
     
     def _convert_qt_to_pdf_coords_with_zoom(self, qt_rect: QRect, page: fitz.Page, zoom_scale: float, preview_size: tuple, quick_mode: bool = False) -> fitz.Rect:
         """Qt座標をPDF座標に変換（ズーム考慮）
@@ -208,6 +738,7 @@ class SelectionAnalyzer:
             アスペクト比を考慮した座標変換を行い、
             ページ範囲外の座標は自動的にクリップされる
         """
+        import fitz  # PyMuPDF
         # ページのサイズを取得
         page_rect = page.rect
         
@@ -219,6 +750,67 @@ class SelectionAnalyzer:
             int(qt_rect.height() / zoom_scale)
         )
         
+        # 表示位置からPDF座標への変換行列（同じページ・ズーム・プレビューサイズでは使い回す）
+        matrix, scale, x_offset, y_offset = self._get_qt_to_pdf_matrix(page_rect, zoom_scale, preview_size)
+        
+        # Qt座標をPDF座標に変換（オフセットを考慮）
+        raw_rect = fitz.Rect(
+            actual_qt_rect.x(),
+            actual_qt_rect.y(),
+            actual_qt_rect.x() + actual_qt_rect.width(),
+            actual_qt_rect.y() + actual_qt_rect.height()
+        ) * matrix
+        
+        # 座標値の検証と補正（ページ範囲内にクリップ）
+        final_rect = raw_rect & page_rect
+        if not quick_mode and final_rect != raw_rect:
+            self.logger.warning("座標がページ範囲を超えています: PDF(%.2f, %.2f, %.2f, %.2f) vs Page(%.2f, %.2f)",
+                                raw_rect.x0, raw_rect.y0, raw_rect.x1, raw_rect.y1, page_rect.width, page_rect.height)
+        
+        # 範囲の有効性をチェック
+        if final_rect.is_empty:
+            if not quick_mode:
+                self.logger.error("無効な座標範囲: PDF(%.2f, %.2f, %.2f, %.2f)",
+                                  raw_rect.x0, raw_rect.y0, raw_rect.x1, raw_rect.y1)
+            # デフォルトの小さな範囲を返す
+            return fitz.Rect(10, 10, 50, 50)
+        
+        # デバッグ情報をログ出力（通常モードかつDEBUGレベルが有効な場合のみ）
+        if not quick_mode and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("座標変換詳細 (ズーム考慮):")
+            self.logger.debug("  ズーム倍率: %.3f", zoom_scale)
+            self.logger.debug("  元Qt座標: (%d, %d, %d, %d)", qt_rect.x(), qt_rect.y(), qt_rect.width(), qt_rect.height())
+            self.logger.debug("  調整後Qt座標: (%d, %d, %d, %d)", actual_qt_rect.x(), actual_qt_rect.y(), actual_qt_rect.width(), actual_qt_rect.height())
+            self.logger.debug("  プレビューサイズ: %s", preview_size)
+            self.logger.debug("  スケール: %.3f", scale)
+            self.logger.debug("  オフセット: x=%.1f, y=%.1f", x_offset, y_offset)
+            self.logger.debug("  最終PDF座標: (%.2f, %.2f, %.2f, %.2f)", raw_rect.x0, raw_rect.y0, raw_rect.x1, raw_rect.y1)
+            self.logger.debug("  ページサイズ: (%.2f, %.2f)", page_rect.width, page_rect.height)
+            self.logger.debug("  検証後の最終範囲: %s", final_rect)
+        
+        return final_rect
+
+    def _get_qt_to_pdf_matrix(self, page_rect: fitz.Rect, zoom_scale: float, preview_size: tuple) -> tuple:
+        """ズーム前のQt座標をPDF座標に変換する行列を取得（キャッシュ付き）
+
+        Args:
+            page_rect (fitz.Rect): ページの矩形
+            zoom_scale (float): ズーム倍率
+            preview_size (tuple): プレビューウィンドウのサイズ (width, height)
+
+        Returns:
+            tuple: (変換行列, スケール, xオフセット, yオフセット)
+
+        Note:
+            プレビューはページ全体をアスペクト比を保って中央に表示しているため、
+            オフセット分だけ平行移動してからスケールを掛ける行列になる
+        """
+        import fitz  # PyMuPDF
+        key = (tuple(page_rect), zoom_scale, tuple(preview_size))
+        cached = self._matrix_cache.get(key)
+        if cached is not None:
+            return cached
+
         # プレビューサイズもズームを考慮して調整
         preview_width, preview_height = preview_size
         actual_preview_width = int(preview_width / zoom_scale)
@@ -240,50 +832,13 @@ class SelectionAnalyzer:
             actual_display_width = page_rect.width / scale
             x_offset = (actual_preview_width - actual_display_width) / 2
             y_offset = 0
-        
-        # Qt座標をPDF座標に変換（オフセットを考慮）
-        pdf_x0 = (actual_qt_rect.x() - x_offset) * scale
-        pdf_y0 = (actual_qt_rect.y() - y_offset) * scale
-        pdf_x1 = (actual_qt_rect.x() + actual_qt_rect.width() - x_offset) * scale
-        pdf_y1 = (actual_qt_rect.y() + actual_qt_rect.height() - y_offset) * scale
-        
-        # 座標値の検証と補正
-        if pdf_x0 < 0 or pdf_y0 < 0 or pdf_x1 > page_rect.width or pdf_y1 > page_rect.height:
-            if not quick_mode:
-                self.logger.warning(f"座標がページ範囲を超えています: PDF({pdf_x0:.2f}, {pdf_y0:.2f}, {pdf_x1:.2f}, {pdf_y1:.2f}) vs Page({page_rect.width:.2f}, {page_rect.height:.2f})")
-            # ページ範囲内にクリップ
-            pdf_x0 = max(0, pdf_x0)
-            pdf_y0 = max(0, pdf_y0)
-            pdf_x1 = min(page_rect.width, pdf_x1)
-            pdf_y1 = min(page_rect.height, pdf_y1)
-        
-        # 範囲の有効性をチェック
-        if pdf_x1 <= pdf_x0 or pdf_y1 <= pdf_y0:
-            if not quick_mode:
-                self.logger.error(f"無効な座標範囲: PDF({pdf_x0:.2f}, {pdf_y0:.2f}, {pdf_x1:.2f}, {pdf_y1:.2f})")
-            # デフォルトの小さな範囲を返す
-            return fitz.Rect(10, 10, 50, 50)
-        
-        # デバッグ情報をログ出力（通常モードのみ）
-        if not quick_mode:
-            self.logger.info(f"座標変換詳細 (ズーム考慮):")
-            self.logger.info(f"  ズーム倍率: {zoom_scale:.3f}")
-            self.logger.info(f"  元Qt座標: ({qt_rect.x()}, {qt_rect.y()}, {qt_rect.width()}, {qt_rect.height()})")
-            self.logger.info(f"  調整後Qt座標: ({actual_qt_rect.x()}, {actual_qt_rect.y()}, {actual_qt_rect.width()}, {actual_qt_rect.height()})")
-            self.logger.info(f"  プレビューサイズ: {preview_size} -> ({actual_preview_width}, {actual_preview_height})")
-            self.logger.info(f"  ページアスペクト比: {page_aspect:.3f}")
-            self.logger.info(f"  プレビューアスペクト比: {preview_aspect:.3f}")
-            self.logger.info(f"  スケール: {scale:.3f}")
-            self.logger.info(f"  オフセット: x={x_offset:.1f}, y={y_offset:.1f}")
-            self.logger.info(f"  最終PDF座標: ({pdf_x0:.2f}, {pdf_y0:.2f}, {pdf_x1:.2f}, {pdf_y1:.2f})")
-            self.logger.info(f"  ページサイズ: ({page_rect.width:.2f}, {page_rect.height:.2f})")
-        
-        final_rect = fitz.Rect(pdf_x0, pdf_y0, pdf_x1, pdf_y1)
-        
-        if not quick_mode:
-            self.logger.info(f"  検証後の最終範囲: {final_rect}")
-        
-        return final_rect
+
+        matrix = fitz.Matrix(scale, scale).pretranslate(-x_offset, -y_offset)
+        if len(self._matrix_cache) >= MATRIX_CACHE_SIZE:
+            self._matrix_cache.clear()
+        cached = (matrix, scale, x_offset, y_offset)
+        self._matrix_cache[key] = cached
+        return cached
     
     def _convert_qt_to_pdf_coords(self, qt_rect: QRect, page: fitz.Page, preview_size: tuple = None, quick_mode: bool = False) -> fitz.Rect:
         """Qt座標をPDF座標に変換（旧メソッド互換用）"""
@@ -293,55 +848,164 @@ class SelectionAnalyzer:
         return self._convert_qt_to_pdf_coords_with_zoom(qt_rect, page, 1.0, preview_size, quick_mode)
     
     def _extract_text_elements(self, page: fitz.Page, rect: fitz.Rect, quick_mode: bool = False) -> List[Dict]:
-        """選択範囲内のテキスト要素を抽出"""
+        """選択範囲内のテキスト要素を抽出
+
+        Note:
+            ページ全体の文字情報を一度だけ取得してキャッシュし、選択範囲ごとに
+            文字の中心座標で絞り込む。同じページで範囲選択を繰り返す場合は
+            テキストの再抽出が発生しない（選択範囲でクリップした抽出と同じく、
+            スパンは範囲内の文字だけに切り詰める）
+        """
         try:
-            # テキストブロックを取得（選択範囲でクリップ）
-            text_dict = page.get_text("dict", clip=rect)
             text_elements = []
+            # スパンごとのログは件数が多いため、出力される場合のみ組み立てる
+            log_spans = not quick_mode and self.logger.isEnabledFor(logging.DEBUG)
+            # 文字ごとのループで属性参照と除算が繰り返されないよう、範囲を2倍した値を
+            # ローカル変数に展開しておき、中心座標の代わりに両端の和と比較する
+            rx0, ry0, rx1, ry1 = rect.x0 * 2, rect.y0 * 2, rect.x1 * 2, rect.y1 * 2
             
-            for block in text_dict["blocks"]:
-                if "lines" in block:  # テキストブロック
-                    for line in block["lines"]:
-                        for span in line["spans"]:
-                            bbox = span["bbox"]
-                            text = span["text"].strip()
-                            if text:
-                                text_elements.append({
-                                    "text": text,
-                                    "bbox": bbox,
-                                    "font": span.get("font", ""),
-                                    "size": span.get("size", 0)
-                                })
-                                self.logger.info(f"テキスト要素発見: '{text}' at {bbox}")
+            for span_bbox, chars, font, size in self._spans_in_rect(page, rect):
+                inside = [char for char in chars
+                          if rx0 <= char[1] + char[3] <= rx1
+                          and ry0 <= char[2] + char[4] <= ry1]
+                if not inside:
+                    continue
+                text = "".join(char[0] for char in inside).strip()
+                if text:
+                    bbox = (min(char[1] for char in inside), min(char[2] for char in inside),
+                            max(char[3] for char in inside), max(char[4] for char in inside))
+                    text_elements.append({
+                        "text": text,
+                        "bbox": bbox,
+                        "font": font,
+                        "size": size
+                    })
+                    if log_spans:
+                        self.logger.debug("テキスト要素発見: '%s' at %s", text, bbox)
             
             return text_elements
             
         except Exception as e:
             self.logger.error(f"テキスト要素抽出エラー: {str(e)}")
             return []
+
+    def _spans_in_rect(self, page: fitz.Page, rect: fitz.Rect) -> list:
+        """選択範囲と重なるテキストスパンを返す
+
+        Note:
+            スパン全体が選択範囲と重ならないものは文字単位の判定を省略できるため、
+            ここでまとめて除外する。numpyがある場合はbboxの配列に対して一括で判定し、
+            スパンが非常に多い場合はnumbaでコンパイルした関数を使う
+        """
+        spans, bboxes = self._get_page_spans(page)
+        rx0, ry0, rx1, ry1 = rect.x0, rect.y0, rect.x1, rect.y1
+        if _filter_spans_nb is not None and bboxes is not None and len(spans) >= NUMBA_FILTER_MIN_SPANS:
+            # スパンが多いページでは、マスク配列を作らずに1回の走査で番号を集める
+            return [spans[i] for i in _filter_spans_nb(bboxes, rx0, ry0, rx1, ry1)]
+        if bboxes is not None:
+            mask = ((bboxes[:, 2] >= rx0) & (bboxes[:, 0] <= rx1)
+                    & (bboxes[:, 3] >= ry0) & (bboxes[:, 1] <= ry1))
+            return [spans[i] for i in np.nonzero(mask)[0]]
+        return [span for span in spans
+                if not (span[0][2] < rx0 or span[0][0] > rx1
+                        or span[0][3] < ry0 or span[0][1] > ry1)]
+
+    def _get_page_spans(self, page: fitz.Page) -> tuple:
+        """ページ内のテキストスパンを取得（キャッシュ付き）
+
+        Returns:
+            tuple: (スパンのリスト, スパンのbboxの(N, 4)配列。numpyがない場合はNone)
+                スパンは (bbox, [(文字, x0, y0, x1, y1), ...], フォント名, サイズ) の形式
+        """
+        key = (page.parent.name, page.number)
+        cached = self._textdict_cache.get(key)
+        if cached is not None:
+            return cached
+
+        spans = []
+        for block in page.get_text("rawdict")["blocks"]:
+            if "lines" in block:  # テキストブロック
+                for line in block["lines"]:
+                    for span in line["spans"]:
+                        chars = [(char["c"], *char["bbox"]) for char in span["chars"]]
+                        if chars:
+                            spans.append((span["bbox"], chars, span.get("font", ""), span.get("size", 0)))
+
+        bboxes = None
+        if np is not None:
+            bboxes = np.array([span[0] for span in spans], dtype=np.float64).reshape(-1, 4)
+        cached = (spans, bboxes)
+        self._textdict_cache[key] = cached
+        return cached
     
+    def _get_page_images(self, page: fitz.Page) -> tuple:
+        """ページ内の埋め込み画像の位置を取得（キャッシュ付き）
+
+        Returns:
+            tuple: (ページ内の画像数, [(xref, 画像の位置, 位置取得エラー, (幅, 高さ)), ...])
+                位置はMAX_IMAGES_PER_PAGE個目までの画像について求め、
+                取得できなかった場合は位置がNone、エラーにメッセージが入る。
+                幅・高さは埋め込み画像の元の画素数
+
+        Note:
+            get_imagesとget_image_bboxはページのコンテンツを解析し直すため、
+            同じページで範囲選択を繰り返す場合に備えて結果を保持する
+        """
+        key = (page.parent.name, page.number)
+        cached = self._images_cache.get(key)
+        if cached is not None:
+            return cached
+
+        image_list = page.get_images()
+        page_images = []
+        for img in image_list[:MAX_IMAGES_PER_PAGE]:
+            xref = img[0]
+            size = (img[2], img[3])
+            try:
+                page_images.append((xref, page.get_image_bbox(xref), None, size))
+            except Exception as bbox_error:
+                page_images.append((xref, None, str(bbox_error), size))
+        cached = (len(image_list), page_images)
+        self._images_cache[key] = cached
+        return cached
+
     def _extract_image_elements_optimized(self, page: fitz.Page, rect: fitz.Rect, quick_mode: bool = False) -> List[Dict]:
         """選択範囲内の画像要素を最適化して抽出（高速版）"""
+        import fitz  # PyMuPDF
         try:
             image_elements = []
             
-            if not quick_mode:
-                self.logger.info(f"--- 選択範囲画像抽出（最適化版） ---")
-                self.logger.info(f"選択範囲: {rect}")
+            debug_enabled = not quick_mode and self.logger.isEnabledFor(logging.DEBUG)
+            if debug_enabled:
+                self.logger.debug("--- 選択範囲画像抽出（最適化版） ---")
+                self.logger.debug("選択範囲: %s", rect)
             
             # 方法1: 選択範囲を低解像度で直接レンダリング（高速化）
             try:
-                # 高速モードでは1.5倍、通常モードでは2倍解像度
-                matrix_scale = 1.5 if quick_mode else 2.0
-                pix = page.get_pixmap(clip=rect, matrix=fitz.Matrix(matrix_scale, matrix_scale))
-                img_data = pix.tobytes("png")
+                # Tesseractは内部でグレースケールに変換するため、最初からグレースケールで描画し、
+                # PNGへのエンコードを省いて画素データをそのまま渡す（メモリも1/3になる）
+                matrix_scale = self._choose_ocr_scale(page, rect, quick_mode)
+                # 描画前に必要なメモリを見積もり、上限を超える場合は倍率を下げる
+                render_bytes = self._estimate_render_bytes(rect, matrix_scale)
+                if render_bytes > MAX_RENDER_BYTES:
+                    matrix_scale *= math.sqrt(MAX_RENDER_BYTES / render_bytes)
+                    self.logger.warning("描画サイズがメモリ上限を超えるため、倍率を%.2fに下げます", matrix_scale)
+                pix = page.get_pixmap(clip=rect, matrix=fitz.Matrix(matrix_scale, matrix_scale),
+                                      colorspace=fitz.csGRAY, alpha=False)
+                # samples（bytes）はコピーが発生するため、Pixmapのメモリを直接参照する
+                img_data = pix.samples_mv
                 
-                if len(img_data) > 500:  # 最小サイズチェック（通常より緩和）
+                # 最小サイズチェック（通常より緩和）。単色（空白）の範囲はOCRしても結果が出ないため除外
+                if len(img_data) > 500 and not pix.is_unicolor:
                     image_elements.append({
                         "image_data": img_data,
+                        "mode": "L",
+                        "size": (pix.width, pix.height),
+                        "stride": pix.stride,
+                        "pixmap": pix,  # img_dataが参照するメモリを保持するため
                         "bbox": tuple(rect),
                         "xref": None,
-                        "ext": "png",
+                        "ext": "raw",
                         "index": 0,
                         "method": "direct_rendering_optimized",
                         "crop_info": {
@@ -350,196 +1014,112 @@ class SelectionAnalyzer:
                             "quick_mode": quick_mode
                         }
                     })
-                    if not quick_mode:
-                        self.logger.info(f"最適化レンダリング成功: {len(img_data)} bytes")
+                    if debug_enabled:
+                        self.logger.debug("最適化レンダリング成功: %d bytes", len(img_data))
                 else:
-                    if not quick_mode:
-                        self.logger.info("最適化レンダリング: データサイズが小さすぎる")
+                    if debug_enabled:
+                        self.logger.debug("最適化レンダリング: データサイズが小さすぎる、または空白")
                     
             except Exception as render_error:
                 if not quick_mode:
-                    self.logger.warning(f"最適化レンダリング失敗: {str(render_error)}")
+                    self.logger.warning("最適化レンダリング失敗: %s", render_error)
             
             # 高速モードでは既存画像の詳細分析をスキップ
             if not quick_mode:
                 # 通常モードのみ: 既存の画像要素から選択範囲と重複するものを抽出
                 try:
-                    image_list = page.get_images()
-                    if len(image_list) > 0:
-                        self.logger.info(f"ページ内の画像数: {len(image_list)}")
+                    image_count, page_images = self._get_page_images(page)
+                    if image_count > 0:
+                        if debug_enabled:
+                            self.logger.debug("ページ内の画像数: %d", image_count)
                         
-                        for img_index, img in enumerate(image_list[:3]):  # 最大3つまでに制限
+                        for img_index, (xref, img_rect, _, img_size) in enumerate(page_images):
                             try:
-                                xref = img[0]
-                                img_rect = page.get_image_bbox(xref)
-                                
-                                # 重複チェック（簡略化）
-                                if rect.intersects(img_rect):
-                                    try:
-                                        base_image = page.parent.extract_image(xref)
-                                        img_data = base_image["image"]
-                                        
-                                        if len(img_data) > 1000:
-                                            image_elements.append({
-                                                "image_data": img_data,
-                                                "bbox": tuple(img_rect),
-                                                "xref": xref,
-                                                "ext": base_image["ext"],
-                                                "index": img_index + 1,
-                                                "method": "existing_image_intersection"
-                                            })
-                                            
-                                    except Exception as extract_error:
-                                        self.logger.warning(f"既存画像抽出失敗 {img_index + 1}: {str(extract_error)}")
-                                        
-                            except Exception as img_error:
-                                continue
-                                
-                except Exception as list_error:
-                    self.logger.warning(f"画像リスト処理エラー: {str(list_error)}")
-            
-            if not quick_mode:
-                self.logger.info(f"最適化抽出完了: {len(image_elements)}個の画像要素")
-            
-            return image_elements
-            
-        except Exception as e:
-            self.logger.error(f"最適化画像抽出エラー: {str(e)}")
-            return []
-    
-    def _extract_image_elements_with_cropping(self, page: fitz.Page, rect: fitz.Rect) -> List[Dict]:
-        """選択範囲内の画像要素を抽出し、選択範囲で切り抜き"""
-        try:
-            image_elements = []
-            
-            self.logger.info(f"--- 選択範囲画像抽出（切り抜きあり） ---")
-            self.logger.info(f"選択範囲: {rect}")
-            
-            # 方法1: 選択範囲を画像として直接レンダリング（最も確実）
-            try:
-                # 選択範囲の画像を直接取得
-                pix = page.get_pixmap(clip=rect, matrix=fitz.Matrix(2.0, 2.0))  # 2倍解像度
-                img_data = pix.tobytes("png")
-                
-                if len(img_data) > 1000:  # 最小サイズチェック
-                    image_elements.append({
-                        "image_data": img_data,
-                        "bbox": tuple(rect),
-                        "xref": None,  # 直接レンダリングなのでxrefはなし
-                        "ext": "png",
-                        "index": 0,
-                        "method": "direct_rendering",
-                        "crop_info": {
-                            "original_rect": rect,
-                            "cropped": True
-                        }
-                    })
-                    self.logger.info(f"直接レンダリング成功: {len(img_data)} bytes")
-                else:
-                    self.logger.info("直接レンダリング: データサイズが小さすぎる")
-                    
-            except Exception as render_error:
-                self.logger.warning(f"直接レンダリング失敗: {str(render_error)}")
-            
-            # 方法2: 既存の画像要素から選択範囲と重複するものを抽出して切り抜き
-            try:
-                image_list = page.get_images()
-                self.logger.info(f"ページ内の画像数: {len(image_list)}")
-                
-                for img_index, img in enumerate(image_list):
-                    try:
-                        xref = img[0]
-                        
-                        # 画像の位置を取得
-                        try:
-                            img_rect = page.get_image_bbox(xref)
-                            self.logger.info(f"画像 {img_index + 1}: 位置 {img_rect}")
-                        except Exception as bbox_error:
-                            self.logger.warning(f"画像 {img_index + 1}: 位置取得失敗 - {str(bbox_error)}")
-                            continue  # 位置が取得できない画像はスキップ
-                        
-                        # 選択範囲との重複をチェック
-                        if rect.intersects(img_rect):
-                            intersection = rect & img_rect
-                            if intersection.width > 5 and intersection.height > 5:  # 最小重複サイズ
-                                self.logger.info(f"画像 {img_index + 1}: 選択範囲と重複 {intersection}")
-                                
-                                # 画像データを取得
+                                # 重複チェック（簡略化）。位置を取得できなかった画像は対象外
+                                if img_rect is None or not rect.intersects(img_rect):
+                                    continue
+                                intersection = rect & img_rect
+                                if intersection.width <= 5 or intersection.height <= 5:  # 最小重複サイズ
+                                    continue
                                 try:
-                                    base_image = page.parent.extract_image(xref)
-                                    original_image_data = base_image["image"]
-                                    
-                                    # PIL Imageで開いて切り抜き
-                                    pil_image = Image.open(io.BytesIO(original_image_data))
-                                    
-                                    # 画像座標での切り抜き範囲を計算
-                                    # 注意: PDF座標と画像座標は異なる可能性がある
-                                    img_width, img_height = pil_image.size
-                                    
-                                    # PDF座標を画像座標に変換
-                                    # 画像の実際の範囲 (img_rect) を画像サイズ (img_width, img_height) にマッピング
-                                    scale_x = img_width / img_rect.width if img_rect.width > 0 else 1
-                                    scale_y = img_height / img_rect.height if img_rect.height > 0 else 1
-                                    
-                                    # 選択範囲を画像座標に変換
-                                    crop_x0 = max(0, int((rect.x0 - img_rect.x0) * scale_x))
-                                    crop_y0 = max(0, int((rect.y0 - img_rect.y0) * scale_y))
-                                    crop_x1 = min(img_width, int((rect.x1 - img_rect.x0) * scale_x))
-                                    crop_y1 = min(img_height, int((rect.y1 - img_rect.y0) * scale_y))
-                                    
-                                    self.logger.info(f"切り抜き座標: ({crop_x0}, {crop_y0}, {crop_x1}, {crop_y1})")
-                                    
-                                    # 有効な切り抜き範囲かチェック
-                                    if crop_x1 > crop_x0 and crop_y1 > crop_y0:
-                                        # 画像を切り抜き
-                                        cropped_image = pil_image.crop((crop_x0, crop_y0, crop_x1, crop_y1))
-                                        
-                                        # PNG形式で保存
-                                        img_buffer = io.BytesIO()
-                                        cropped_image.save(img_buffer, format='PNG')
-                                        cropped_data = img_buffer.getvalue()
-                                        
-                                        image_elements.append({
-                                            "image_data": cropped_data,
-                                            "bbox": tuple(intersection),  # 重複領域をbboxとして使用
-                                            "xref": xref,
-                                            "ext": "png",
-                                            "index": img_index,
-                                            "method": "cropped_from_existing",
-                                            "crop_info": {
-                                                "original_rect": img_rect,
-                                                "crop_rect": (crop_x0, crop_y0, crop_x1, crop_y1),
-                                                "cropped": True,
-                                                "original_size": pil_image.size,
-                                                "cropped_size": cropped_image.size
-                                            }
-                                        })
-                                        
-                                        self.logger.info(f"画像 {img_index + 1} を切り抜き: {cropped_image.size}")
-                                    else:
-                                        self.logger.warning(f"画像 {img_index + 1}: 無効な切り抜き範囲")
+                                    element = self._render_image_intersection(page, xref, img_rect, img_size,
+                                                                              intersection, img_index)
+                                    if element is not None:
+                                        image_elements.append(element)
+                                except Exception as extract_error:
+                                    self.logger.warning("既存画像抽出失敗 %d: %s", img_index + 1, extract_error)
                                         
-                                except Exception as crop_error:
-                                    self.logger.error(f"画像 {img_index + 1} 切り抜きエラー: {str(crop_error)}")
-                            else:
-                                self.logger.info(f"画像 {img_index + 1}: 重複が小さすぎるためスキップ")
-                        else:
-                            self.logger.info(f"画像 {img_index + 1}: 選択範囲と重複なし")
-                            
-                    except Exception as img_error:
-                        self.logger.error(f"画像 {img_index + 1} 処理エラー: {str(img_error)}")
-                        continue
-                        
-            except Exception as extract_error:
-                self.logger.error(f"既存画像抽出エラー: {str(extract_error)}")
+                            except Exception as img_error:
+                                continue
+                                
+                except Exception as list_error:
+                    self.logger.warning("画像リスト処理エラー: %s", list_error)
+            
+            if debug_enabled:
+                self.logger.debug("最適化抽出完了: %d個の画像要素", len(image_elements))
             
-            self.logger.info(f"最終的に抽出された画像要素: {len(image_elements)}個")
             return image_elements
             
         except Exception as e:
-            self.logger.error(f"画像要素抽出エラー: {str(e)}")
+            self.logger.error(f"最適化画像抽出エラー: {str(e)}")
             return []
     
+    def _render_image_intersection(self, page: fitz.Page, xref: int, img_rect: fitz.Rect, img_size: tuple,
+                                   intersection: fitz.Rect, img_index: int) -> Optional[Dict]:
+        """埋め込み画像のうち、選択範囲と重なる部分だけを描画して画像要素にする
+
+        Args:
+            page (fitz.Page): 対象ページ
+            xref (int): 埋め込み画像のxref
+            img_rect (fitz.Rect): ページ上の画像の位置
+            img_size (tuple): 埋め込み画像の元の画素数（幅, 高さ）
+            intersection (fitz.Rect): 選択範囲と画像の重なり
+            img_index (int): ページ内の画像の番号（0から始まる）
+
+        Returns:
+            Optional[Dict]: 画像要素。描画できなかった場合はNone
+
+        Note:
+            画像全体をextract_imageで取り出してデコードすると、全面スキャン画像では
+            大半を捨てるために全体を展開することになるため、重なり部分だけを
+            埋め込み画像の解像度（OCR_MAX_RENDER_DIMENSION・MAX_RENDER_BYTESまで）で描画する
+        """
+        import fitz  # PyMuPDF
+        img_width, img_height = img_size
+        scale_x = img_width / img_rect.width if img_rect.width > 0 else 1
+        scale_y = img_height / img_rect.height if img_rect.height > 0 else 1
+        scale = min(max(scale_x, scale_y),
+                    OCR_MAX_RENDER_DIMENSION / max(intersection.width, intersection.height))
+        # 描画サイズがメモリ上限を超える場合は倍率を下げる
+        render_bytes = self._estimate_render_bytes(intersection, scale)
+        if render_bytes > MAX_RENDER_BYTES:
+            scale *= math.sqrt(MAX_RENDER_BYTES / render_bytes)
+
+        pix = page.get_pixmap(clip=intersection, matrix=fitz.Matrix(scale, scale),
+                              colorspace=fitz.csGRAY, alpha=False)
+        # 単色（空白）の部分はOCRしても結果が出ないため除外
+        if pix.width <= 0 or pix.height <= 0 or pix.is_unicolor:
+            return None
+        return {
+            "image_data": pix.samples_mv,
+            "mode": "L",
+            "size": (pix.width, pix.height),
+            "stride": pix.stride,
+            "pixmap": pix,  # image_dataが参照するメモリを保持するため
+            "bbox": tuple(intersection),  # 重複領域をbboxとして使用
+            "xref": xref,
+            "ext": "raw",
+            "index": img_index + 1,
+            "method": "cropped_from_existing",
+            "crop_info": {
+                "original_rect": img_rect,
+                "crop_rect": tuple(intersection),
+                "cropped": True,
+                "original_size": (img_width, img_height),
+                "cropped_size": (pix.width, pix.height)
+            }
+        }
+
     def _create_diagnostic_info(self, page: fitz.Page, pdf_rect: fitz.Rect, preview_size: tuple, qt_rect: QRect) -> str:
         """診断情報を作成"""
         info_parts = []
@@ -550,8 +1130,8 @@ class SelectionAnalyzer:
         
         # 画像情報（エラー対応）
         try:
-            image_list = page.get_images()
-            info_parts.append(f"ページ内画像数: {len(image_list)}")
+            image_count, page_images = self._get_page_images(page)
+            info_parts.append(f"ページ内画像数: {image_count}")
             
             # 直接レンダリングのテスト
             try:
@@ -560,15 +1140,13 @@ class SelectionAnalyzer:
             except Exception as render_error:
                 info_parts.append(f"直接レンダリングエラー: {str(render_error)[:50]}...")
             
-            for i, img in enumerate(image_list[:3]):  # 最初の3つまで
+            for i, (xref, img_rect, bbox_error, _) in enumerate(page_images):  # 最初の3つまで
                 try:
-                    xref = img[0]
-                    try:
-                        img_rect = page.get_image_bbox(xref)
+                    if img_rect is not None:
                         intersects = pdf_rect.intersects(img_rect)
                         info_parts.append(f"画像{i+1}: {img_rect} (重複:{intersects})")
-                    except Exception as bbox_error:
-                        info_parts.append(f"画像{i+1}: 位置取得エラー ({str(bbox_error)[:30]}...)")
+                    else:
+                        info_parts.append(f"画像{i+1}: 位置取得エラー ({bbox_error[:30]}...)")
                         
                 except Exception as img_error:
                     info_parts.append(f"画像{i+1}: 処理エラー ({str(img_error)[:30]}...)")
@@ -607,340 +1185,418 @@ class SelectionAnalyzer:
         """画像要素をOCR処理（最適化版）"""
         results = []
         
-        # 大量の画像要素がある場合はメモリ使用量をチェック
-        if len(image_elements) > 5 and not self._check_memory_usage():
-            self.logger.warning("メモリ不足のため、OCR処理を制限します")
-            image_elements = image_elements[:3]  # 最初の3つの要素のみ処理
-        
         if not quick_mode:
             self.logger.info(f"OCR処理開始（最適化版）: {len(image_elements)}個の画像要素")
         
-        for idx, element in enumerate(image_elements):
-            try:
-                if not quick_mode:
-                    self.logger.info(f"画像要素 {element.get('index', idx)} のOCR処理を開始")
-                
-                # 画像をPIL Imageに変換（メモリエラー対応）
-                try:
-                    image_bytes = element["image_data"]
-                    pil_image = Image.open(io.BytesIO(image_bytes))
-                    
-                    # 画像が大きすぎる場合はリサイズ
-                    if pil_image.size[0] * pil_image.size[1] > 4000000:  # 4M pixels以上
-                        self.logger.warning(f"画像が大きすぎるためリサイズします: {pil_image.size}")
-                        max_dimension = 2000
-                        ratio = min(max_dimension / pil_image.size[0], max_dimension / pil_image.size[1])
-                        new_size = (int(pil_image.size[0] * ratio), int(pil_image.size[1] * ratio))
-                        pil_image = pil_image.resize(new_size, Image.Resampling.LANCZOS)
-                    
-                    if not quick_mode:
-                        self.logger.info(f"画像サイズ: {pil_image.size}, モード: {pil_image.mode}")
-                        
-                except MemoryError as me:
-                    # メモリ不足エラー
-                    self.error_handler.handle_error(me, ErrorType.MEMORY_ERROR, show_dialog=False)
-                    self.logger.error(f"画像変換でメモリ不足 (要素 {idx})")
-                    continue
-                except Exception as ie:
-                    self.logger.error(f"画像変換エラー (要素 {idx}): {str(ie)}")
-                    continue
+        if not image_elements:
+            return results
 
-                # OCR設定（日本語優先設定）
-                if quick_mode:
-                    # 高速モード：日本語と英語を併用、文字制限を最小限に
-                    ocr_config = '--oem 3 --psm 6 -c preserve_interword_spaces=1'
-                else:
-                    # 通常モード：日本語優先で詳細設定
-                    ocr_config = (
-                        '--oem 3 --psm 6 '
-                        '-c preserve_interword_spaces=1 '
-                        '-c tessedit_char_blacklist=§°¢£¤¥¦©«®±²³´µ¶·¸¹º»¼½¾'
-                    )
-                
-                # OCR実行（選択された言語で）
-                # まず元画像で実行する。Tesseract 5は内部前処理が優秀で、
-                # 品質の良い画像に補正を常時かけると逆に精度が落ちるため
-                if ocr_language == 'auto':
-                    # 自動検出モード
-                    text = self._auto_detect_language_ocr(pil_image, ocr_config, quick_mode)
-                else:
-                    # 指定された言語でOCR実行
-                    text = pytesseract.image_to_string(pil_image, config=ocr_config, lang=ocr_language)
-
-                    # 日本語が含まれている場合のフォールバック
-                    if ocr_language == 'jpn+eng' and (not text.strip() or not self._contains_japanese_text(text)):
-                        text_jpn = pytesseract.image_to_string(pil_image, config='--oem 3 --psm 6', lang='jpn')
-                        if text_jpn.strip() and self._contains_japanese_text(text_jpn):
-                            text = text_jpn
-                            if not quick_mode:
-                                self.logger.info(f"日本語専用OCRで再試行: '{text[:50]}{'...' if len(text) > 50 else ''}'")
-
-                # フォールバック: 元画像で意味のある結果が得られなかった場合のみ、
-                # 補正画像（ノイズ除去・拡大）で再試行する。スキャン品質が低い
-                # レシート対策。元画像で読めた場合の結果には一切影響しない
-                if not self._ocr_text_looks_valid(text):
-                    for variant_idx, variant in enumerate(preprocess_variants(pil_image, self.logger)):
-                        retry_text = pytesseract.image_to_string(variant, config=ocr_config, lang='jpn+eng' if ocr_language == 'auto' else ocr_language)
-                        if self._ocr_text_looks_valid(retry_text):
-                            text = retry_text
-                            if not quick_mode:
-                                self.logger.info(f"補正画像(変種{variant_idx + 1})でのOCR再試行に成功: '{text.strip()[:30]}...'")
-                            break
-                
-                if text and text.strip():
-                    confidence = 0.8 if quick_mode else 0.9  # 高速モードでは信頼度を少し下げる
-                    result = AnalysisResult(
-                        text=text.strip(),
-                        element_type="image",
-                        confidence=confidence,
-                        bbox=element["bbox"],
-                        reading_order=idx
-                    )
-                    results.append(result)
-                    
-                    if not quick_mode:
-                        self.logger.info(f"OCR成功: '{text.strip()[:30]}...'")
-                else:
-                    if not quick_mode:
-                        self.logger.info("OCR結果が空またはテキストなし")
-                
-            except Exception as e:
-                # OCRエラーを分類してフォールバック処理
-                error_type = self.error_handler.classify_ocr_error(e)
-                
-                if not quick_mode:
-                    self.logger.error(f"OCR処理エラー (要素 {idx}): {str(e)}")
-                
-                # フォールバック処理を試行
-                fallback_result = self._try_ocr_fallback(pil_image, element, idx, quick_mode)
-                if fallback_result:
-                    results.append(fallback_result)
-                
-                continue
+        # tesserocrが使えない場合、複数要素の1回目のOCRはtesseractの1回の起動でまとめて行う
+        tasks = [(element, idx, None, None) for idx, element in enumerate(image_elements)]
+        if (len(image_elements) > 1 and ocr_language != 'auto'
+                and (tesserocr is None or ocr_language in self._tess_failed_langs)):
+            tasks = self._batch_first_pass(image_elements, ocr_language, quick_mode)
+
+        # 要素ごとのOCRは共有のスレッドプールで並列に実行する（tesseractはネイティブコードで
+        # GILを解放するため、スレッドでもほぼ並列に処理できる）。mapを使い、結果は要素の順序のまま受け取る
+        ocr_results = self._ocr_pool.map(
+            lambda task: self._ocr_one(task[0], task[1], ocr_language, quick_mode, task[2], task[3]),
+            tasks
+        )
+        results.extend(result for result in ocr_results if result)
         
         if not quick_mode:
             self.logger.info(f"OCR処理完了: {len(results)}個の結果")
         
         return results
-    
-    def _process_image_elements(self, image_elements: List[Dict], page: fitz.Page) -> List[AnalysisResult]:
-        """画像要素をOCR処理"""
-        results = []
-        
-        self.logger.info(f"OCR処理開始: {len(image_elements)}個の画像要素")
-        
+
+    def _batch_first_pass(self, image_elements: List[Dict], ocr_language: str, quick_mode: bool) -> list:
+        """複数の画像要素の1回目のOCRを、tesseractの1回の起動でまとめて実行
+
+        Args:
+            image_elements (List[Dict]): 画像要素のリスト
+            ocr_language (str): OCR言語
+            quick_mode (bool): 高速モード
+
+        Returns:
+            list: _ocr_oneに渡す (要素, 番号, 画像, 1回目のOCR結果) のリスト。
+                画像に変換できなかった要素は含まない。まとめて処理できなかった場合、
+                1回目のOCR結果はNone（要素ごとに実行する）
+
+        Note:
+            _batch_ocr_via_list_fileでまとめて実行するため、
+            tesseractの起動と言語モデルの読み込みが要素数分から1回に減る
+        """
+        loaded = []
         for idx, element in enumerate(image_elements):
-            try:
-                self.logger.info(f"画像要素 {element.get('index', idx)} のOCR処理を開始")
-                
-                # 画像をPIL Imageに変換
-                image_bytes = element["image_data"]
-                pil_image = Image.open(io.BytesIO(image_bytes))
-                
+            pil_image = self._load_element_image(element, idx, quick_mode)
+            if pil_image is not None:
+                loaded.append((element, idx, pil_image))
+
+        texts = self._batch_ocr_via_list_file([pil_image for _, _, pil_image in loaded], ocr_language,
+                                              self._ocr_config_for_mode(quick_mode))
+        return [(element, idx, pil_image, text) for (element, idx, pil_image), text in zip(loaded, texts)]
+
+    def _batch_ocr_via_list_file(self, pil_images: List[Image.Image], lang: str, config: str) -> List[Optional[str]]:
+        """複数の画像を、画像一覧ファイルを入力にしたtesseractの1回の起動でOCR
+
+        Args:
+            pil_images (List[Image.Image]): OCRする画像のリスト
+            lang (str): OCR言語
+            config (str): tesseractの設定
+
+        Returns:
+            List[Optional[str]]: 画像ごとのOCR結果。画像が1つ以下の場合や
+                まとめて処理できなかった場合はNone（呼び出し元で画像ごとに実行する）
+
+        Note:
+            画像ファイルの一覧を書いたテキストファイルを入力にすると、tesseractは
+            1回の起動で全画像を処理し、画像ごとの結果を改ページ文字で区切って出力する
+        """
+        texts = [None] * len(pil_images)
+        if len(pil_images) <= 1:
+            return texts
+        try:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                paths = []
+                for i, pil_image in enumerate(pil_images):
+                    # すぐにtesseractが読み戻すだけなので、圧縮の必要がない
+                    # PNM（PGM/PPM）で書き出し、PNGの圧縮・展開を省く
+                    if pil_image.mode not in ("1", "L", "RGB"):
+                        pil_image = pil_image.convert("RGB")
+                    path = os.path.join(temp_dir, f"element_{i}.pnm")
+                    pil_image.save(path, format='PPM')
+                    paths.append(path)
+                list_path = os.path.join(temp_dir, "images.txt")
+                with open(list_path, 'w', encoding='utf-8') as f:
+                    f.write("\n".join(paths) + "\n")
+                output = pytesseract.image_to_string(list_path, config=config, lang=lang)
+            pages = output.split('\f')
+            if len(pages) >= len(pil_images):
+                texts = pages[:len(pil_images)]
+            else:
+                self.logger.warning(f"一括OCRの結果数が画像数と一致しないため、要素ごとに実行します: {len(pages)} / {len(pil_images)}")
+        except Exception as e:
+            self.logger.warning(f"一括OCRに失敗したため、要素ごとに実行します: {str(e)}")
+        return texts
+
+    def _estimate_render_bytes(self, rect: fitz.Rect, scale: float, channels: int = 1) -> int:
+        """範囲を指定倍率で描画した場合の画素データのサイズを見積もる
+
+        Args:
+            rect (fitz.Rect): 描画する範囲（PDF座標）
+            scale (float): 描画倍率
+            channels (int): 1画素あたりのチャンネル数（グレースケールは1）
+
+        Returns:
+            int: 画素データのバイト数
+        """
+        return int(rect.width * rect.height * scale * scale * channels)
+
+    def _choose_ocr_scale(self, page: fitz.Page, rect: fitz.Rect, quick_mode: bool) -> float:
+        """OCR用に描画する倍率を決める
+
+        Args:
+            page (fitz.Page): PDFページオブジェクト
+            rect (fitz.Rect): 描画する範囲（PDF座標）
+            quick_mode (bool): 高速モード
+
+        Returns:
+            float: 描画倍率
+
+        Note:
+            テキスト情報がある場合は文字サイズの中央値から、文字の高さが
+            OCR_TARGET_TEXT_HEIGHT_PX前後になる倍率を選ぶ（小さい文字は拡大、
+            大きい文字は無駄に拡大しない）。テキスト情報がない場合は従来の倍率
+            （高速モード1.5倍、通常モード2倍）を上限に、長辺がOCR_MAX_RENDER_DIMENSIONを
+            超えないよう抑える
+        """
+        spans = self._spans_in_rect(page, rect) or self._get_page_spans(page)[0]
+        sizes = sorted(span[3] for span in spans if span[3] > 0)
+        if sizes:
+            median_size = sizes[len(sizes) // 2]
+            # 文字サイズはポイント単位で、倍率sの行列では1ポイントがsピクセルで描画される
+            scale = OCR_TARGET_TEXT_HEIGHT_PX / median_size
+            return min(max(scale, OCR_MIN_SCALE), OCR_MAX_SCALE)
+
+        default_scale = 1.5 if quick_mode else 2.0
+        longest = max(rect.width, rect.height)
+        if longest <= 0:
+            return default_scale
+        return min(default_scale, OCR_MAX_RENDER_DIMENSION / longest)
+
+    def _element_to_image(self, element: Dict) -> Image.Image:
+        """画像要素をPIL Imageに変換
+
+        Note:
+            描画済みの画素データ（modeを持つ要素）はコピーせずにImageとして参照し、
+            PNG等のエンコード済みデータはデコードする。大きなJPEGは、OCRに十分な
+            解像度を残してデコード時にグレースケール・縮小する（Image.draft）
+        """
+        image_data = element["image_data"]
+        mode = element.get("mode")
+        if mode:
+            size = element["size"]
+            stride = element.get("stride", 0)
+            return Image.frombuffer(mode, size, image_data, "raw", mode, stride, 1)
+        pil_image = Image.open(io.BytesIO(image_data))
+        if pil_image.format == 'JPEG' and max(pil_image.size) > OCR_MAX_RENDER_DIMENSION:
+            pil_image.draft('L', (JPEG_DRAFT_MIN_DIMENSION, JPEG_DRAFT_MIN_DIMENSION))
+        return pil_image
+
+    def _ocr_cache_key(self, element: Dict, *params) -> Optional[tuple]:
+        """画像要素の内容とOCRの条件から、OCR結果のキャッシュキーを作成
+
+        Args:
+            element (Dict): 画像要素（image_data等）
+            *params: 結果に影響するOCRの条件（言語・設定等）
+
+        Returns:
+            Optional[tuple]: キャッシュキー。キャッシュを使わない場合はNone
+        """
+        if not OCR_RESULT_CACHE_ENABLED:
+            return None
+        digest = hashlib.blake2b(element["image_data"], digest_size=16).digest()
+        return (digest, element.get("mode"), element.get("size")) + params
+
+    def _get_cached_ocr(self, key: Optional[tuple]) -> Optional[Tuple[str, float]]:
+        """キャッシュしたOCR結果を取得
+
+        Returns:
+            Optional[Tuple[str, float]]: (テキスト, 信頼度)。キャッシュにない場合はNone
+        """
+        if key is None:
+            return None
+        with self._ocr_result_cache_lock:
+            cached = self._ocr_result_cache.get(key)
+            if cached is not None:
+                self._ocr_result_cache.move_to_end(key)
+            return cached
+
+    def _store_cached_ocr(self, key: Optional[tuple], text: str, confidence: float):
+        """OCR結果をキャッシュに保存（上限を超えた場合は古いものから破棄）"""
+        if key is None:
+            return
+        with self._ocr_result_cache_lock:
+            self._ocr_result_cache[key] = (text, confidence)
+            self._ocr_result_cache.move_to_end(key)
+            while len(self._ocr_result_cache) > OCR_RESULT_CACHE_SIZE:
+                self._ocr_result_cache.popitem(last=False)
+
+    def _ocr_one(self, element: Dict, idx: int, ocr_language: str, quick_mode: bool,
+                 pil_image: Optional[Image.Image] = None, first_pass: Optional[str] = None) -> Optional[AnalysisResult]:
+        """画像要素1つをOCR処理
+
+        Args:
+            element (Dict): 画像要素（image_data, bbox等）
+            idx (int): 要素の番号（読み順の初期値に使用）
+            ocr_language (str): OCR言語
+            quick_mode (bool): 高速モード
+            pil_image (Optional[Image.Image]): 変換済みの画像。Noneの場合は要素から変換する
+            first_pass (Optional[str]): 一括実行済みの1回目のOCR結果。Noneの場合はここで実行する
+
+        Returns:
+            Optional[AnalysisResult]: 分析結果。テキストが得られない場合はNone
+
+        Note:
+            並列実行されるため、同時に実行されるOCRの数は
+            モジュール全体でOCR_CONCURRENCYまでに制限する。
+            同じ内容の画像を同じ条件でOCR済みの場合は、キャッシュした結果を返す
+        """
+        cache_key = self._ocr_cache_key(element, ocr_language, quick_mode)
+        cached = self._get_cached_ocr(cache_key)
+        if cached is not None:
+            return AnalysisResult(
+                text=cached[0],
+                element_type="image",
+                confidence=cached[1],
+                bbox=element["bbox"],
+                reading_order=idx
+            )
+
+        with _ocr_semaphore:
+            result = self._ocr_one_unlocked(element, idx, ocr_language, quick_mode, pil_image, first_pass)
+        if result is not None:
+            self._store_cached_ocr(cache_key, result.text, result.confidence)
+        return result
+
+    def _load_element_image(self, element: Dict, idx: int, quick_mode: bool) -> Optional[Image.Image]:
+        """画像要素をOCR用のPIL Imageに変換（大きすぎる場合は縮小）
+
+        Returns:
+            Optional[Image.Image]: 変換した画像。変換できない場合はNone
+        """
+        # 画像をPIL Imageに変換（メモリエラー対応）
+        try:
+            pil_image = self._element_to_image(element)
+            
+            # 画像が大きすぎる場合はリサイズ
+            if pil_image.size[0] * pil_image.size[1] > 4000000:  # 4M pixels以上
+                self.logger.warning(f"画像が大きすぎるためリサイズします: {pil_image.size}")
+                max_dimension = 2000
+                ratio = min(max_dimension / pil_image.size[0], max_dimension / pil_image.size[1])
+                new_size = (int(pil_image.size[0] * ratio), int(pil_image.size[1] * ratio))
+                pil_image = pil_image.resize(new_size, Image.Resampling.LANCZOS)
+            
+            if not quick_mode:
                 self.logger.info(f"画像サイズ: {pil_image.size}, モード: {pil_image.mode}")
+            return pil_image
                 
-                # 切り抜き情報をログ出力
-                crop_info = element.get("crop_info", {})
-                method = element.get("method", "unknown")
-                self.logger.info(f"処理方法: {method}")
-                if crop_info:
-                    self.logger.info(f"切り抜き情報: {crop_info}")
-                
-                # 画像が小さすぎる場合でも結果を作成
-                if pil_image.width < 10 or pil_image.height < 10:
-                    self.logger.info("画像が小さすぎますが、結果を作成します")
-                    result = AnalysisResult(
-                        text=f"画像が小さすぎます (サイズ: {pil_image.size}, 方法: {method})",
-                        element_type="image",
-                        confidence=0.0,
-                        bbox=element["bbox"],
-                        reading_order=0
-                    )
-                    results.append(result)
-                    continue
-                
-                # OCR処理を試行
-                ocr_success = False
-                extracted_text = ""
-                confidence = 0.0
-                
-                try:
-                    # Tesseractが利用可能かチェック
-                    self.logger.info("Tesseractでのテキスト抽出を開始")
-                    
-                    # 画像前処理を試行
-                    processed_images = self._preprocess_image_for_ocr(pil_image)
-                    
-                    # 最適化されたOCR設定（処理時間短縮 + 品質向上）
-                    # OCR言語設定に応じて設定を変更
-                    ocr_configs = self._get_ocr_configs_for_language(ocr_language)
-                    
-                    best_text = ""
-                    best_confidence = 0
-                    
-                    for config_idx, ocr_config in enumerate(ocr_configs):
-                        try:
-                            # 各画像前処理版でOCRを試行
-                            for img_variant_name, img_variant in processed_images.items():
-                                try:
-                                    test_text = pytesseract.image_to_string(
-                                        img_variant,
-                                        lang=ocr_config['lang'],
-                                        config=ocr_config['config']
-                                    ).strip()
-                                    
-                                    # 無効な文字をフィルタリング
-                                    test_text = self._filter_invalid_characters(test_text)
-                                    
-                                    if test_text:
-                                        self.logger.info(f"OCR設定{config_idx+1}({img_variant_name}): '{test_text[:30]}{'...' if len(test_text) > 30 else ''}'")
-                                        
-                                        # 改良された品質評価
-                                        text_score = self._evaluate_ocr_quality(test_text, ocr_config)
-                                        
-                                        if text_score > best_confidence:
-                                            best_confidence = text_score
-                                            best_text = test_text
-                                            self.logger.info(f"新しい最良結果: スコア{text_score:.1f}, テキスト: '{test_text[:20]}...'")
-                                            
-                                            # 十分に良い結果が得られた場合は早期終了
-                                            if text_score > 50:
-                                                self.logger.info("十分な品質の結果が得られたため、OCR処理を終了")
-                                                break
-                                        
-                                except Exception as variant_error:
-                                    self.logger.debug(f"OCR設定{config_idx+1}({img_variant_name})でエラー: {str(variant_error)}")
-                                    continue
-                            
-                            # 早期終了条件をチェック
-                            if best_confidence > 50:
-                                break
-                                        
-                        except Exception as config_error:
-                            self.logger.debug(f"OCR設定 {ocr_config} でエラー: {str(config_error)}")
-                            continue
-                    
-                    extracted_text = best_text
-                    
-                    self.logger.info(f"OCR結果 (長さ {len(extracted_text)}): '{extracted_text[:50]}{'...' if len(extracted_text) > 50 else ''}'")
-                    
-                    if extracted_text:
-                        ocr_success = True
-                        confidence = min(best_confidence / 20.0, 1.0)  # スコアを0-1に正規化
-                    else:
-                        self.logger.info("OCRでテキストが抽出されませんでした")
-                
-                except Exception as ocr_error:
-                    self.logger.error(f"OCR処理エラー: {str(ocr_error)}")
-                
-                # 結果を作成（OCRが失敗しても画像要素として記録）
-                if ocr_success and extracted_text:
-                    result_text = extracted_text
-                    result_confidence = confidence
+        except MemoryError as me:
+            # メモリ不足エラー
+            self.error_handler.handle_error(me, ErrorType.MEMORY_ERROR, show_dialog=False)
+            self.logger.error(f"画像変換でメモリ不足 (要素 {idx})")
+            return None
+        except Exception as ie:
+            self.logger.error(f"画像変換エラー (要素 {idx}): {str(ie)}")
+            return None
+
+    def _ocr_config_for_mode(self, quick_mode: bool) -> str:
+        """モードに応じたOCR設定文字列を返す（日本語優先設定）"""
+        if quick_mode:
+            # 高速モード：日本語と英語を併用、文字制限を最小限に
+            return '--oem 3 --psm 6 -c preserve_interword_spaces=1'
+        # 通常モード：日本語優先で詳細設定
+        return (
+            '--oem 3 --psm 6 '
+            '-c preserve_interword_spaces=1 '
+            '-c tessedit_char_blacklist=§°¢£¤¥¦©«®±²³´µ¶·¸¹º»¼½¾'
+        )
+
+    def _ocr_one_unlocked(self, element: Dict, idx: int, ocr_language: str, quick_mode: bool,
+                          pil_image: Optional[Image.Image] = None, first_pass: Optional[str] = None) -> Optional[AnalysisResult]:
+        """画像要素1つをOCR処理（同時実行数の制御なし）"""
+        try:
+            if not quick_mode:
+                self.logger.info(f"画像要素 {element.get('index', idx)} のOCR処理を開始")
+            
+            if pil_image is None:
+                pil_image = self._load_element_image(element, idx, quick_mode)
+                if pil_image is None:
+                    return None
+
+            ocr_config = self._ocr_config_for_mode(quick_mode)
+            
+            # OCR実行（選択された言語で）
+            # まず元画像で実行する。Tesseract 5は内部前処理が優秀で、
+            # 品質の良い画像に補正を常時かけると逆に精度が落ちるため
+            if ocr_language == 'auto':
+                # 自動検出モード
+                text = self._auto_detect_language_ocr(pil_image, ocr_config, quick_mode)
+            else:
+                # 指定された言語でOCR実行（一括実行済みの場合はその結果を使う）
+                if first_pass is not None:
+                    text, confidence = first_pass, None
                 else:
-                    result_text = f"画像要素 (OCR失敗またはテキストなし) - サイズ: {pil_image.size}, 方法: {method}"
-                    if crop_info.get("cropped"):
-                        result_text += f", 切り抜きサイズ: {crop_info.get('cropped_size', 'unknown')}"
-                    result_confidence = 0.0
-                
+                    text, confidence = self._image_to_string_with_conf(pil_image, ocr_config, ocr_language)
+
+                # 日本語が含まれている場合のフォールバック
+                # 英数字を高い信頼度で読めている場合は英語の請求書と判断し、再OCRを省く
+                if (ocr_language == 'jpn+eng' and (not text.strip() or not self._contains_japanese_text(text))
+                        and not self._is_confident_ascii(text, confidence)):
+                    text_jpn = self._image_to_string(pil_image, '--oem 3 --psm 6', 'jpn')
+                    if text_jpn.strip() and self._contains_japanese_text(text_jpn):
+                        text = text_jpn
+                        if not quick_mode:
+                            self.logger.info(f"日本語専用OCRで再試行: '{text[:50]}{'...' if len(text) > 50 else ''}'")
+
+            # フォールバック: 元画像で意味のある結果が得られなかった場合のみ、
+            # 補正画像（ノイズ除去・拡大）で再試行する。スキャン品質が低い
+            # レシート対策。元画像で読めた場合の結果には一切影響しない
+            if not self._ocr_text_looks_valid(text):
+                retry = self._ocr_variants_in_order(iter_preprocess_variants(pil_image, self.logger), ocr_config,
+                                                    'jpn+eng' if ocr_language == 'auto' else ocr_language)
+                if retry is not None:
+                    variant_idx, text = retry
+                    if not quick_mode:
+                        self.logger.info(f"補正画像(変種{variant_idx + 1})でのOCR再試行に成功: '{text.strip()[:30]}...'")
+            
+            # 成功時の文字列処理は前後の空白除去1回のみとする
+            text = text.strip() if text else ''
+            if text:
+                confidence = 0.8 if quick_mode else 0.9  # 高速モードでは信頼度を少し下げる
                 result = AnalysisResult(
-                    text=result_text,
+                    text=text,
                     element_type="image",
-                    confidence=result_confidence,
+                    confidence=confidence,
                     bbox=element["bbox"],
-                    reading_order=0
+                    reading_order=idx
                 )
-                results.append(result)
                 
-                self.logger.info(f"画像要素 {element.get('index', idx)} の処理完了: '{result_text[:30]}{'...' if len(result_text) > 30 else ''}'")
-                
-            except Exception as e:
-                self.logger.error(f"画像要素処理エラー: {str(e)}", exc_info=True)
-                # エラーでも結果を作成
-                error_result = AnalysisResult(
-                    text=f"画像処理エラー: {str(e)[:50]}",
-                    element_type="image",
-                    confidence=0.0,
-                    bbox=element.get("bbox", (0, 0, 0, 0)),
-                    reading_order=0
-                )
-                results.append(error_result)
-        
-        self.logger.info(f"OCR処理完了: {len(results)}個の結果")
-        return results
-    
-    def _preprocess_image_for_ocr(self, pil_image: Image.Image) -> Dict[str, Image.Image]:
-        """OCR用の画像前処理"""
-        processed_images = {}
-        
-        try:
-            # オリジナル画像
-            processed_images["original"] = pil_image
+                if not quick_mode:
+                    self.logger.info(f"OCR成功: '{text[:30]}...'")
+                return result
+            else:
+                if not quick_mode:
+                    self.logger.info("OCR結果が空またはテキストなし")
+                return None
             
-            # グレースケール変換
-            if pil_image.mode != 'L':
-                gray_image = pil_image.convert('L')
-                processed_images["grayscale"] = gray_image
+        except Exception as e:
+            # OCRエラーを分類してフォールバック処理
+            error_type = self.error_handler.classify_ocr_error(e)
+            
+            if not quick_mode:
+                self.logger.error(f"OCR処理エラー (要素 {idx}): {str(e)}")
             
-            # コントラスト強化
+            # フォールバック処理を試行
+            return self._try_ocr_fallback(pil_image, element, idx, quick_mode)
+
+    def _ocr_variants_in_order(self, variants: Iterable[Image.Image], config: str, lang: str) -> Optional[Tuple[int, str]]:
+        """補正画像を順にOCRし、最初に意味のある結果が得られたものを返す
+
+        Args:
+            variants (Iterable[Image.Image]): 補正画像（試す順）。ジェネレータの場合は必要な分だけ生成される
+            config (str): tesseractの設定
+            lang (str): OCR言語
+
+        Returns:
+            Optional[Tuple[int, str]]: (変種の番号, OCR結果)。どの変種でも得られない場合はNone
+
+        Note:
+            同時実行数（OCR_CONCURRENCY）に空きがある場合は、1つ目の変種のOCR中に
+            2つ目の変種の生成とOCRを別スレッドで先行して実行する。結果は変種の順に評価するため、
+            順に実行した場合と同じ結果になる。1つ目の変種で結果が得られ、先行実行が
+            未着手の場合は取り消すため、2つ目以降の変種は生成されない
+        """
+        variants = iter(variants)
+        first = next(variants, None)
+        if first is None:
+            return None
+
+        # 先行実行中はvariantsを別スレッドが進めるため、メインスレッドはその結果を受け取るまで触らない
+        next_future = None
+        if _ocr_semaphore.acquire(blocking=False):
+            def ocr_next_with_slot():
+                try:
+                    image = next(variants, None)
+                    return None if image is None else self._image_to_string(image, config, lang)
+                finally:
+                    _ocr_semaphore.release()
             try:
-                from PIL import ImageEnhance
-                if pil_image.mode != 'L':
-                    enhancer = ImageEnhance.Contrast(pil_image.convert('L'))
+                next_future = self._ocr_retry_pool.submit(ocr_next_with_slot)
+            except RuntimeError:
+                # close()後でスレッドプールが使えない場合は、順に実行する
+                _ocr_semaphore.release()
+
+        try:
+            variant_idx = 0
+            retry_text = self._image_to_string(first, config, lang)
+            while not self._ocr_text_looks_valid(retry_text):
+                variant_idx += 1
+                if variant_idx == 1 and next_future is not None:
+                    retry_text = next_future.result()
                 else:
-                    enhancer = ImageEnhance.Contrast(pil_image)
-                contrast_image = enhancer.enhance(2.0)  # コントラストを2倍に
-                processed_images["contrast"] = contrast_image
-            except ImportError:
-                self.logger.debug("PIL.ImageEnhance not available, skipping contrast enhancement")
-            
-            # リサイズ（小さすぎる画像を拡大）
-            if pil_image.width < 100 or pil_image.height < 100:
-                scale_factor = max(2, 100 / min(pil_image.width, pil_image.height))
-                new_size = (int(pil_image.width * scale_factor), int(pil_image.height * scale_factor))
-                resized_image = pil_image.resize(new_size, Image.Resampling.LANCZOS)
-                processed_images["resized"] = resized_image
-            
-        except Exception as e:
-            self.logger.error(f"画像前処理エラー: {str(e)}")
-            # エラーの場合はオリジナルのみ返す
-            processed_images = {"original": pil_image}
-        
-        return processed_images
-    
-    def _filter_invalid_characters(self, text: str) -> str:
-        """無効な文字をフィルタリング"""
-        if not text:
-            return text
-        
-        # 明らかに無効な文字パターンを除去
-        invalid_chars = set('§°¢£¤¥¦©«®±²³´µ¶·¸¹º»¼½¾¿')
-        
-        # 文字を1つずつチェック
-        filtered_chars = []
-        for char in text:
-            if char not in invalid_chars:
-                filtered_chars.append(char)
-        
-        result = ''.join(filtered_chars)
-        
-        # 連続する特殊文字や意味不明なパターンを除去
-        import re
-        
-        # 連続する|や記号を除去
-        result = re.sub(r'[|§°]{2,}', '', result)
-        
-        # 単独の記号行を除去
-        lines = result.split('\n')
-        valid_lines = []
-        for line in lines:
-            line = line.strip()
-            # 日本語文字または英数字が含まれる行のみ保持
-            if line and (self._contains_japanese_text(line) or re.search(r'[a-zA-Z0-9]', line)):
-                valid_lines.append(line)
-        
-        return '\n'.join(valid_lines).strip()
-    
+                    variant = next(variants, None)
+                    retry_text = None if variant is None else self._image_to_string(variant, config, lang)
+                if retry_text is None:
+                    # すべての変種を試した
+                    return None
+            return variant_idx, retry_text
+        finally:
+            # 1つ目の変種で結果が得られた場合、未着手の先行実行は取り消す
+            if next_future is not None and next_future.cancel():
+                _ocr_semaphore.release()
+
     def _ocr_text_looks_valid(self, text: str) -> bool:
         """OCR結果に意味のある内容（日本語または英数字）が含まれているか
 
@@ -951,33 +1607,35 @@ class SelectionAnalyzer:
             return False
         if self._contains_japanese_text(text):
             return True
-        return any(ch.isascii() and ch.isalnum() for ch in text)
+        return _ASCII_ALNUM_RE.search(text) is not None
 
-    def _contains_japanese_text(self, text: str) -> bool:
-        """テキストに日本語文字が含まれているかチェック"""
-        if not text:
+    def _is_confident_ascii(self, text: str, confidence: Optional[int]) -> bool:
+        """英数字のテキストを高い信頼度で認識できているかを判定
+
+        Args:
+            text (str): OCR結果
+            confidence (Optional[int]): 単語の平均信頼度（0〜100）。不明な場合はNone
+
+        Returns:
+            bool: 信頼度がASCII_ACCEPT_CONFIDENCE以上で、英数字がASCII_ACCEPT_MIN_CHARS文字を超える場合True
+        """
+        if confidence is None or confidence < ASCII_ACCEPT_CONFIDENCE:
             return False
-        
-        # ひらがな、カタカナ、漢字の範囲をチェック
-        japanese_ranges = [
-            (0x3040, 0x309F),  # ひらがな
-            (0x30A0, 0x30FF),  # カタカナ
-            (0x4E00, 0x9FAF),  # CJK統合漢字
-            (0x3400, 0x4DBF),  # CJK拡張A
-            (0xFF66, 0xFF9D),  # 半角カタカナ
-        ]
-        
-        for char in text:
-            char_code = ord(char)
-            for start, end in japanese_ranges:
-                if start <= char_code <= end:
-                    return True
-        return False
+        return len(_ASCII_ALNUM_RE.findall(text)) > ASCII_ACCEPT_MIN_CHARS
+
+    def _contains_japanese_text(self, text: str) -> bool:
+        """テキストに日本語文字が含まれているかチェック
+
+        Note:
+            ひらがな、カタカナ、漢字（CJK拡張A・半角カタカナを含む）の範囲を、
+            事前コンパイルした正規表現の1回の検索で調べる
+        """
+        return bool(text) and _JP_RE.search(text) is not None
     
     def _auto_detect_language_ocr(self, pil_image, ocr_config: str, quick_mode: bool) -> str:
         """言語を自動検出してOCRを実行"""
         # 日本語優先で試行
-        text_jpn = pytesseract.image_to_string(pil_image, config=ocr_config, lang='jpn+eng')
+        text_jpn = self._image_to_string(pil_image, ocr_config, 'jpn+eng')
         
         if text_jpn.strip() and self._contains_japanese_text(text_jpn):
             if not quick_mode:
@@ -985,95 +1643,13 @@ class SelectionAnalyzer:
             return text_jpn
         
         # 日本語が検出されない場合は英語で試行
-        text_eng = pytesseract.image_to_string(pil_image, config=ocr_config, lang='eng')
+        text_eng = self._image_to_string(pil_image, ocr_config, 'eng')
         
         if not quick_mode:
             self.logger.info(f"英語でフォールバック: '{text_eng[:50]}{'...' if len(text_eng) > 50 else ''}'")
         
         return text_eng if text_eng.strip() else text_jpn
     
-    def _get_ocr_configs_for_language(self, ocr_language: str) -> list:
-        """言語に応じたOCR設定を取得"""
-        if ocr_language == 'jpn+eng':
-            return [
-                # 日本語優先設定
-                {'lang': 'jpn+eng', 'config': '--psm 6 -c preserve_interword_spaces=1'},
-                {'lang': 'jpn', 'config': '--psm 6 -c preserve_interword_spaces=1'},
-                {'lang': 'jpn+eng', 'config': '--psm 3'},
-                {'lang': 'jpn+eng', 'config': '--psm 7'},
-            ]
-        elif ocr_language == 'jpn':
-            return [
-                # 日本語のみ
-                {'lang': 'jpn', 'config': '--psm 6 -c preserve_interword_spaces=1'},
-                {'lang': 'jpn', 'config': '--psm 3'},
-                {'lang': 'jpn', 'config': '--psm 7'},
-            ]
-        elif ocr_language == 'eng':
-            return [
-                # 英語のみ
-                {'lang': 'eng', 'config': '--psm 6 -c preserve_interword_spaces=1'},
-                {'lang': 'eng', 'config': '--psm 7 -c tessedit_char_whitelist=0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz.,:-¥$€()[]'},
-                {'lang': 'eng', 'config': '--psm 8 -c tessedit_char_whitelist=0123456789.,¥$€'},
-            ]
-        else:
-            # デフォルト（日本語優先）
-            return self._get_ocr_configs_for_language('jpn+eng')
-    
-    def _evaluate_ocr_quality(self, text: str, ocr_config: dict) -> float:
-        """OCR結果の品質を評価"""
-        if not text or not text.strip():
-            return 0.0
-        
-        score = 0.0
-        
-        # 基本スコア（文字数）
-        text_length = len(text.replace(' ', '').replace('\n', ''))
-        score += min(text_length, 20)  # 最大20点
-        
-        # 日本語文字の検出
-        japanese_chars = sum(1 for char in text if '\u3040' <= char <= '\u309F' or '\u30A0' <= char <= '\u30FF' or '\u4E00' <= char <= '\u9FAF')
-        if japanese_chars > 0 and 'jpn' in ocr_config['lang']:
-            score += japanese_chars * 2  # 日本語文字1つにつき2点
-        
-        # 数字の検出
-        digit_chars = sum(1 for char in text if char.isdigit())
-        if digit_chars > 0:
-            score += digit_chars * 1.5  # 数字1つにつき1.5点
-        
-        # 英字の検出
-        alpha_chars = sum(1 for char in text if char.isalpha() and ord(char) < 128)
-        if alpha_chars > 0:
-            score += alpha_chars * 1  # 英字1つにつき1点
-        
-        # 意味のある単語パターンの検出
-        import re
-        
-        # 金額パターン
-        if re.search(r'\d+[,.]?\d*\s*[円¥$€]', text):
-            score += 15
-        
-        # 日付パターン
-        if re.search(r'\d{4}[-/年]\d{1,2}[-/月]\d{1,2}', text):
-            score += 10
-        
-        # 請求書関連単語
-        invoice_words = ['請求書', '領収書', 'invoice', 'receipt', '合計', 'total', '税込', '税抜']
-        for word in invoice_words:
-            if word.lower() in text.lower():
-                score += 8
-        
-        # 無効文字のペナルティ
-        invalid_char_count = sum(1 for char in text if char in '§|°¢£¤¥¦©«®±²³´µ¶·¸¹º»¼½¾¿')
-        score -= invalid_char_count * 0.5
-        
-        # 文字の多様性ボーナス
-        unique_chars = len(set(text.replace(' ', '').replace('\n', '')))
-        if unique_chars > 5:
-            score += min(unique_chars - 5, 10)  # 最大10点のボーナス
-        
-        return max(score, 0.0)
-    
     def _sort_by_reading_order(self, results: List[AnalysisResult]) -> List[AnalysisResult]:
         """座標情報に基づいて読み順でソート（Y座標許容誤差対応）
 
@@ -1095,10 +1671,21 @@ class SelectionAnalyzer:
         y_tolerance = self.config_manager.get_y_coordinate_tolerance()
 
         # Y座標を許容誤差内で丸めてソート（同じ行はX座標順）
-        sorted_results = sorted(
-            results,
-            key=lambda r: (round(r.bbox[1] / y_tolerance) * y_tolerance, r.bbox[0])
-        )
+        if np is not None and len(results) >= VECTORIZED_SORT_MIN_COUNT:
+            # 要素数が多い場合は座標を配列にまとめ、numpyで一括してソートする
+            # （np.roundとroundはどちらも偶数丸めで、lexsortは安定ソートのため結果は同じ）
+            # 行の比較は丸めた行番号だけで決まるため、許容誤差を掛け戻さずに整数のキーにする
+            count = len(results)
+            xs = np.fromiter((r.bbox[0] for r in results), dtype=np.float64, count=count)
+            ys = np.fromiter((r.bbox[1] for r in results), dtype=np.float64, count=count)
+            rows = np.round(ys / y_tolerance).astype(np.int64)
+            order = np.lexsort((xs, rows))
+            sorted_results = [results[i] for i in order.tolist()]
+        else:
+            sorted_results = sorted(
+                results,
+                key=lambda r: (round(r.bbox[1] / y_tolerance) * y_tolerance, r.bbox[0])
+            )
 
         # reading_orderを設定
         for i, result in enumerate(sorted_results):
@@ -1111,13 +1698,8 @@ class SelectionAnalyzer:
         if not results:
             return ""
         
-        # 読み順でソート済みの結果を結合
-        combined_texts = []
-        for result in results:
-            if result.text.strip():
-                combined_texts.append(result.text.strip())
-        
-        return ' '.join(combined_texts)
+        # 読み順でソート済みの結果を結合（各テキストのstripは1回だけ行う）
+        return ' '.join(text for text in (r.text.strip() for r in results) if text)
     
     def get_detailed_analysis(self, results: List[AnalysisResult]) -> Dict:
         """詳細な分析情報を返す"""
@@ -1130,9 +1712,11 @@ class SelectionAnalyzer:
                 "average_confidence": 0.0
             }
         
-        text_count = sum(1 for r in results if r.element_type == "text")
-        image_count = sum(1 for r in results if r.element_type == "image")
-        error_count = sum(1 for r in results if r.element_type in ["error", "unknown", "diagnostic"])
+        # 要素種別ごとの件数は1回の走査でまとめて数える
+        type_counts = Counter(r.element_type for r in results)
+        text_count = type_counts["text"]
+        image_count = type_counts["image"]
+        error_count = type_counts["error"] + type_counts["unknown"] + type_counts["diagnostic"]
         avg_confidence = sum(r.confidence for r in results) / len(results)
         
         return {
@@ -1169,13 +1753,13 @@ class SelectionAnalyzer:
             
             for config in fallback_configs:
                 try:
-                    text = pytesseract.image_to_string(pil_image, config=config, lang='jpn+eng')
-                    if text and text.strip():
+                    text = self._image_to_string(pil_image, config, 'jpn+eng').strip()
+                    if text:
                         if not quick_mode:
-                            self.logger.info(f"フォールバック成功 (config: {config}): '{text.strip()[:30]}...'")
+                            self.logger.info(f"フォールバック成功 (config: {config}): '{text[:30]}...'")
                         
                         return AnalysisResult(
-                            text=text.strip(),
+                            text=text,
                             element_type="image_fallback",
                             confidence=0.3,  # フォールバックなので低めの信頼度
                             bbox=element.get('bbox', (0, 0, 0, 0)),
@@ -1187,13 +1771,13 @@ class SelectionAnalyzer:
             # 2. 画像を前処理して再試行
             try:
                 processed_image = self._simple_image_preprocessing(pil_image)
-                text = pytesseract.image_to_string(processed_image, config='--psm 6', lang='jpn+eng')
-                if text and text.strip():
+                text = self._image_to_string(processed_image, '--psm 6', 'jpn+eng').strip()
+                if text:
                     if not quick_mode:
-                        self.logger.info(f"前処理フォールバック成功: '{text.strip()[:30]}...'")
+                        self.logger.info(f"前処理フォールバック成功: '{text[:30]}...'")
                     
                     return AnalysisResult(
-                        text=text.strip(),
+                        text=text,
                         element_type="image_preprocessed",
                         confidence=0.2,
                         bbox=element.get('bbox', (0, 0, 0, 0)),
@@ -1224,30 +1808,15 @@ class SelectionAnalyzer:
         try:
             # グレースケール変換
             if image.mode != 'L':
-                image = image.convert('L')
+                image = to_grayscale(image)
             
             # サイズが小さすぎる場合は拡大
             if image.size[0] < 100 or image.size[1] < 30:
                 scale_factor = max(100 / image.size[0], 30 / image.size[1])
                 new_size = (int(image.size[0] * scale_factor), int(image.size[1] * scale_factor))
-                image = image.resize(new_size, Image.Resampling.LANCZOS)
+                image = resize_for_ocr(image, new_size)
             
             return image
             
         except Exception:
-            return image
-    
-    def _check_memory_usage(self) -> bool:
-        """メモリ使用量をチェック（簡易版）"""
-        try:
-            import psutil
-            memory_percent = psutil.virtual_memory().percent
-            if memory_percent > 85:  # メモリ使用率85%以上で警告
-                self.logger.warning(f"メモリ使用率が高くなっています: {memory_percent:.1f}%")
-                return False
-            return True
-        except ImportError:
-            # psutilがない場合はチェックをスキップ
-            return True
-        except Exception:
-            return True
\ No newline at end of file
+            return image
\ No newline at end of file
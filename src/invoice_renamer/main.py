@@ -21,9 +21,7 @@ import os
 import platform
 from PySide6.QtWidgets import QApplication, QMessageBox
 from PySide6.QtGui import QIcon
-from invoice_renamer.ui.pdf_viewer import PDFViewerApp
 from invoice_renamer.logic.config_manager import ConfigManager
-from invoice_renamer.logic.pdf_handlers import PyMuPDFHandler, PDF2ImageHandler
 from invoice_renamer.utils.error_handler import ErrorHandler, ErrorType
 from invoice_renamer.utils.logger import setup_logger
 
@@ -39,18 +37,18 @@ def create_pdf_handler(error_handler: ErrorHandler):
 
     Raises:
         ValueError: 未知のPDFハンドラーが設定されている場合
+
+    Note:
+        PDFハンドラーのモジュール（PyMuPDF等）は、起動時間を短くするため
+        ハンドラーを作成する時点で読み込む
     """
+    from invoice_renamer.logic.pdf_handlers import PyMuPDFHandler, make_pdf_handler
+
     try:
         config = ConfigManager()
         handler_type = config.get_pdf_handler()
+        return make_pdf_handler(handler_type)
 
-        if handler_type.lower() == 'pymupdf':
-            return PyMuPDFHandler()
-        elif handler_type.lower() == 'pdf2image':
-            return PDF2ImageHandler()
-        else:
-            raise ValueError(f"未知のPDFハンドラが指定されています: {handler_type}")
-            
     except Exception as e:
         error_handler.handle_error(
             e,
@@ -74,6 +72,12 @@ def main():
         MemoryError: メモリ不足の場合
         Exception: その他の予期しないエラー
     """
+    # Tesseract内部のOpenMPによるスレッド並列を無効にする（OCRはPython側のスレッドで並列化する）
+    # TesseractのWikiでも、OpenMPは効率が悪く、OMP_THREAD_LIMIT=1の方が速い場合が多いとされている
+    # tesseractの子プロセスとtesserocr（OpenMPは読み込み時に設定を読む）の両方に効くよう、
+    # UI（selection_analyzer_v6）をインポートする前に設定する。設定箇所はここだけとする
+    os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+
     # ロガーとエラーハンドラーの初期化
     logger = setup_logger('invoice_renamer.main')
     error_handler = ErrorHandler(logger)
@@ -92,6 +96,10 @@ def main():
 
         app = QApplication(sys.argv)
 
+        # UIモジュール（解析・OCR関連のライブラリを含む）はQApplication作成後に読み込む
+        # 起動を早めるとともに、ライブラリ不足のImportErrorを下のエラー処理で扱えるようにする
+        from invoice_renamer.ui.pdf_viewer import PDFViewerApp
+
         # PDFハンドラーの作成
         pdf_handler = create_pdf_handler(error_handler)
 
@@ -27,45 +27,158 @@ the LICENSE file in the distribution root.
 import os
 import re
 import csv
+import logging
 import sys
+import stat
 import shutil
-from typing import Optional, List
+from collections import OrderedDict
+from datetime import datetime
+from itertools import chain
+from operator import itemgetter
+from typing import Optional, List, Tuple
 from PySide6.QtWidgets import (QMainWindow, QVBoxLayout, QHBoxLayout,
                             QPushButton, QListWidget, QWidget, QFileDialog,
                             QLabel, QTextEdit, QLineEdit, QMessageBox,
                             QListWidgetItem, QScrollArea, QFrame, QCheckBox,
                             QTextBrowser, QApplication, QComboBox)
-from PySide6.QtCore import Qt, Signal, QRect, QPoint, QTimer, QThread, QStandardPaths, QUrl, QSettings
-from PySide6.QtGui import (QPixmap, QImage, QPainter, QPen, QColor, QMouseEvent,
-                           QFont, QAction, QDesktopServices)
-from pdf2image import convert_from_path
-from invoice_renamer.logic.pdf_handlers import PDFHandler, PyMuPDFHandler, PDF2ImageHandler
+from PySide6.QtCore import (Qt, Signal, QRect, QPoint, QTimer, QObject, QRunnable, QThreadPool,
+                            QStandardPaths, QUrl, QSettings)
+from PySide6.QtGui import (QPixmap, QImage, QPainter, QPen, QBrush, QColor, QMouseEvent,
+                           QFont, QAction, QDesktopServices, QTransform)
+from invoice_renamer.logic.backup_manager import copy_file, get_pdf_files, invalidate_pdf_files_cache
+from invoice_renamer.logic.pdf_handlers import PDFHandler
 from invoice_renamer.logic.selection_analyzer_v6 import SelectionAnalyzer, SelectionData
 from invoice_renamer.utils.logger import setup_logger
 from invoice_renamer.utils import constants
+from invoice_renamer.utils.string_util import convert_dates
 from invoice_renamer.utils.error_handler import ErrorHandler, ErrorType
 
-
-class AnalysisWorker(QThread):
-    """選択範囲分析を非同期で実行するワーカースレッド
+# 表示用に拡大縮小済みのページ画像を保持する最大数（LRUで古いものから破棄）
+MAX_CACHED_PAGES = 8
+
+# 拡大縮小前のページ画像（レンダリング結果）を保持する最大数（LRUで古いものから破棄）
+# 高解像度で描画しているため1ページあたり数MB〜数十MBになり、表示用より少なくする
+MAX_CACHED_BASE_PAGES = 4
+
+# 抽出したページのテキストを保持する最大数（LRUで古いものから破棄）
+MAX_CACHED_PAGE_TEXTS = 64
+
+# 勘定科目（アイコン, 勘定科目, よみがな）をよみがなでソートするためのキー
+_BY_YOMIGANA = itemgetter(2)
+
+# ファイル名に使用できない文字（Windows/mac）と、変換後の全角文字
+_FILENAME_CHAR_MAP = {
+    '\\': '＼',
+    '/': '／',
+    ':': '：',
+    '*': '＊',
+    '?': '？',
+    '"': '"',
+    '<': '＜',
+    '>': '＞',
+    '|': '｜'
+}
+# ファイル名の文字変換テーブル（1回の走査ですべての文字を変換する）
+_FILENAME_TRANSLATE = str.maketrans(_FILENAME_CHAR_MAP)
+# ファイル名に使用できない文字のいずれかに一致するパターン（変換が不要な場合を判定する）
+_FILENAME_ILLEGAL_RE = re.compile('[' + re.escape(''.join(_FILENAME_CHAR_MAP)) + ']')
+
+# 保存されたフォルダパスに含まれていてはならない文字（改ざん検知用）
+_FORBIDDEN_PATH_CHARS = frozenset('\0\n\r\t')
+
+# ページ表示の更新要求をまとめる待ち時間（ミリ秒）。ホイール操作等で連続した要求は1回の描画にまとめる
+PAGE_UPDATE_DELAY_MS = 16
+
+# ズーム操作が落ち着いたと判断するまでの時間（ミリ秒）。操作中は高速な拡大縮小で表示し、
+# この時間だけ操作がなければ高品質な拡大縮小で描画し直す
+ZOOM_SETTLE_DELAY_MS = 150
+
+# 選択矩形の再描画範囲に加える余白（ピクセル）。枠線の太さ以上にする
+SELECTION_REPAINT_MARGIN = 2
+
+# 範囲選択の分析結果を保持する最大数（LRUで古いものから破棄）
+MAX_CACHED_ANALYSES = 32
+
+# テキスト項目の抽出に使うパターン（呼び出しごとに解析しないよう事前にコンパイル）
+# 日付パターン
+_DATE_RE = re.compile(r'\d{4}[-/年]\d{1,2}[-/月]\d{1,2}')
+# 請求書番号パターン (例: 請求書No.12345 や INV-2023-001 など)
+_INVOICE_RE = re.compile(r'(請求書|インボイス|[Ii]nvoice)[-\s]?(No|NO|番号)?\.?\s*[\w\d\-]+')
+# 金額パターン (例: \1,234,567 や 123.45円 など)
+_AMOUNT_RE = re.compile(r'(\|￥|$|＄)?\s*[\d,]+\s*(円|ドル|USD|JPY|USD|EUR|GBP|AUD|CAD|CHF|CNY|HKD|KRW|SGD|TWD)?')
+# 金額の行と判断するキーワード（英語は小文字化した行と比較する）
+_AMOUNT_KEYWORDS = ('total', 'amount', '合計', '金額', '総額')
+# 会社名と判断するキーワード
+_COMPANY_KEYWORDS = ('株式会社', '有限会社', '合同会社', 'Co., Ltd.')
+
+# OCR言語の選択肢（言語選択コンボボックスの項目順）。範囲外の場合は先頭を使う
+_OCR_LANGS = (
+    'jpn+eng',  # 日本語優先
+    'eng',      # 英語のみ
+    'jpn',      # 日本語のみ
+    'auto',     # 自動検出
+)
+
+# 分析結果バブルの定型文（_create_normal_bubble_text / _create_debug_bubble_text）
+# テキストを抽出できなかった場合
+_BUBBLE_EXTRACT_FAILED = "❌ テキストを抽出できませんでした\n\n💡 デバッグモードで詳細を確認できます"
+# テキストが検出されなかった場合
+_BUBBLE_NO_TEXT = (
+    "❌ テキストが検出されませんでした\n"
+    "\n"
+    "💡 以下をお試しください:\n"
+    "  • 画像全体を選択する\n"
+    "  • より大きな範囲を選択する\n"
+    "  • デバッグモードで詳細確認"
+)
+# v6の改善点説明
+_BUBBLE_V6_NOTES = (
+    "🆕 v6改善点:\n"
+    "  • 選択範囲の直接レンダリング実装\n"
+    "  • 既存画像の正確な切り抜き\n"
+    "  • ページ全体フォールバック廃止\n"
+    "  • 座標変換精度向上"
+)
+# 要素詳細に表示する処理方法（要素のテキストに含まれる語, 表示名）。先に書いたものを優先する
+_PROCESSING_METHODS = (
+    ("直接レンダリング", "直接レンダリング"),
+    ("cropped_from_existing", "既存画像切り抜き"),
+    ("診断情報", "診断情報"),
+)
+
+# 日付整形（_format_date_string）で除去する空白文字
+# （日付形式の検出・変換はstring_util.convert_datesで行う）
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+class AnalysisWorker(QRunnable):
+    """選択範囲分析を非同期で実行するワーカー
 
     UIをブロックせずにOCR分析を実行するためのワーカークラス。
+    QThreadPoolのスレッドで実行され、選択のたびにスレッドを作成・破棄しない。
     分析完了時またはエラー時にシグナルを発行する。
 
-    Signals:
-        analysis_finished: 分析完了時に結果リストを通知
-        analysis_error: エラー発生時にエラーメッセージを通知
+    Signals（self.signals）:
+        analysis_finished: 分析完了時に依頼番号と結果リストを通知
+        analysis_error: エラー発生時に依頼番号とエラーメッセージを通知
+        finished: 処理終了時（成功・失敗とも）に依頼番号を通知
 
     Attributes:
         analyzer (SelectionAnalyzer): 分析器インスタンス
         selection_data (SelectionData): 選択範囲データ
         analysis_params (dict): 分析パラメータ
         quick_mode (bool): 高速モード
+        request_id (int): 依頼番号（古い依頼の結果を区別するために使用）
+        signals (AnalysisWorker.Signals): シグナルの送信元
     """
-    analysis_finished = Signal(list)  # 分析結果のシグナル
-    analysis_error = Signal(str)  # エラーのシグナル
 
-    def __init__(self, analyzer, selection_data, analysis_params, quick_mode=True):
+    class Signals(QObject):
+        """QRunnableはシグナルを持てないため、シグナルを保持するQObject"""
+        analysis_finished = Signal(int, list)  # 分析結果のシグナル
+        analysis_error = Signal(int, str)  # エラーのシグナル
+        finished = Signal(int)  # 処理終了のシグナル
+
+    def __init__(self, analyzer, selection_data, analysis_params, quick_mode=True, request_id=0):
         """ワーカーを初期化
 
         Args:
@@ -73,25 +186,135 @@ class AnalysisWorker(QThread):
             selection_data (SelectionData): 選択範囲データ
             analysis_params (dict): 分析パラメータ（ズーム、サイズ等）
             quick_mode (bool): 高速モード（デフォルト: True）
+            request_id (int): 依頼番号
         """
         super().__init__()
         self.analyzer = analyzer
         self.selection_data = selection_data
         self.analysis_params = analysis_params
         self.quick_mode = quick_mode
+        self.request_id = request_id
+        self.signals = AnalysisWorker.Signals()
+        # 分析結果のキャッシュキー（依頼元が設定する）
+        self.cache_key = None
     
     def run(self):
         """バックグラウンドで分析を実行
 
         ワーカースレッドのメイン処理。
         分析が成功すればanalysis_finishedシグナル、
-        失敗すればanalysis_errorシグナルを発行。
+        失敗すればanalysis_errorシグナルを発行し、最後にfinishedシグナルを発行。
         """
         try:
             results = self.analyzer.analyze_selection(self.selection_data, self.analysis_params, self.quick_mode)
-            self.analysis_finished.emit(results)
+            self.signals.analysis_finished.emit(self.request_id, results)
         except Exception as e:
-            self.analysis_error.emit(str(e))
+            self.signals.analysis_error.emit(self.request_id, str(e))
+        finally:
+            self.signals.finished.emit(self.request_id)
+
+class PageRenderWorker(QRunnable):
+    """ページのプレビュー画像を非同期で描画するワーカー
+
+    ページ移動・ズームのたびにUIスレッドが描画で止まらないよう、
+    QThreadPoolのスレッドでPDFハンドラーに描画させる。
+    QPixmapはUIスレッド以外で作成できないため、QImageで結果を通知する。
+
+    Signals（self.signals）:
+        rendered: 描画終了時に依頼番号・キャッシュキー・画像（失敗時はNone）・
+            エラーメッセージ（成功時はNone）を通知
+
+    Attributes:
+        pdf_handler (PDFHandler): 描画に使うPDFハンドラー
+        pdf_path (str): PDFファイルのパス
+        page (int): ページ番号（0から始まる）
+        dpr (float): 表示先画面のデバイスピクセル比
+        request_id (int): 依頼番号（古い依頼の結果を区別するために使用）
+        cache_key (tuple): 描画結果のキャッシュキー
+        signals (PageRenderWorker.Signals): シグナルの送信元
+    """
+
+    class Signals(QObject):
+        """QRunnableはシグナルを持てないため、シグナルを保持するQObject"""
+        rendered = Signal(int, object, object, object)  # 描画結果のシグナル
+
+    def __init__(self, pdf_handler, pdf_path, page, dpr, request_id, cache_key):
+        """ワーカーを初期化
+
+        Args:
+            pdf_handler (PDFHandler): 描画に使うPDFハンドラー
+            pdf_path (str): PDFファイルのパス
+            page (int): ページ番号（0から始まる）
+            dpr (float): 表示先画面のデバイスピクセル比
+            request_id (int): 依頼番号
+            cache_key (tuple): 描画結果のキャッシュキー
+        """
+        super().__init__()
+        self.pdf_handler = pdf_handler
+        self.pdf_path = pdf_path
+        self.page = page
+        self.dpr = dpr
+        self.request_id = request_id
+        self.cache_key = cache_key
+        self.signals = PageRenderWorker.Signals()
+
+    def run(self):
+        """バックグラウンドで描画を実行し、結果をrenderedシグナルで通知"""
+        image, error = None, None
+        try:
+            image = self.pdf_handler.get_preview_image(self.pdf_path, self.page, self.dpr)
+            if image is None:
+                error = "プレビュー画像を生成できませんでした"
+        except Exception as e:
+            error = f"プレビュー生成エラー: {e}"
+        finally:
+            self.signals.rendered.emit(self.request_id, self.cache_key, image, error)
+
+class PdfLoadWorker(QRunnable):
+    """PDFファイルを非同期で読み込むワーカー
+
+    大きなPDFの解析でUIスレッドが止まらないよう、
+    QThreadPoolのスレッドでPDFハンドラーに読み込ませる。
+    エラーダイアログはUIスレッドでしか表示できないため、エラー内容をシグナルで通知する。
+
+    Signals（self.signals）:
+        loaded: 読み込み終了時に依頼番号・パス・総ページ数・エラー内容を通知
+            （成功時のエラー内容はNone。予期しない例外の場合は例外オブジェクト）
+
+    Attributes:
+        pdf_handler (PDFHandler): 読み込みに使うPDFハンドラー
+        pdf_path (str): PDFファイルのパス
+        request_id (int): 依頼番号（古い依頼の結果を区別するために使用）
+        signals (PdfLoadWorker.Signals): シグナルの送信元
+    """
+
+    class Signals(QObject):
+        """QRunnableはシグナルを持てないため、シグナルを保持するQObject"""
+        loaded = Signal(int, str, int, object)  # 読み込み結果のシグナル
+
+    def __init__(self, pdf_handler, pdf_path, request_id):
+        """ワーカーを初期化
+
+        Args:
+            pdf_handler (PDFHandler): 読み込みに使うPDFハンドラー
+            pdf_path (str): PDFファイルのパス
+            request_id (int): 依頼番号
+        """
+        super().__init__()
+        self.pdf_handler = pdf_handler
+        self.pdf_path = pdf_path
+        self.request_id = request_id
+        self.signals = PdfLoadWorker.Signals()
+
+    def run(self):
+        """バックグラウンドで読み込みを実行し、結果をloadedシグナルで通知"""
+        page_count, error = 0, None
+        try:
+            page_count, error = self.pdf_handler.load_pdf_quietly(self.pdf_path)
+        except Exception as e:
+            error = e
+        finally:
+            self.signals.loaded.emit(self.request_id, self.pdf_path, page_count, error)
 
 class SelectableLabel(QLabel):
     """範囲選択可能なQLabelウィジェット
@@ -139,7 +362,46 @@ class SelectableLabel(QLabel):
         self.panning = False
         self.pan_start = QPoint()
         self.scroll_area = None  # QScrollAreaへの参照（後で設定）
-        
+
+        # 選択範囲の描画に使うペン・ブラシ（paintEventのたびに生成しないよう保持）
+        self._selecting_pen = QPen(QColor(0, 120, 215), 2, Qt.DashLine)
+        self._selecting_brush = QBrush(QColor(0, 120, 215, 50))
+        self._confirmed_pen = QPen(QColor(0, 120, 215), 1, Qt.SolidLine)
+        self._confirmed_brush = QBrush(QColor(0, 120, 215, 20))
+
+        # 描画時に倍率を掛けて表示する、拡大縮小前の画像と倍率（set_scaled_source参照）
+        self._scaled_source = None
+        self._scaled_source_scale = 1.0
+
+    def set_scaled_source(self, pixmap: QPixmap, scale: float):
+        """拡大縮小前の画像を、描画時に倍率を掛けて表示する
+
+        Args:
+            pixmap (QPixmap): 拡大縮小前の画像
+            scale (float): 表示倍率（論理ピクセル単位）
+
+        Note:
+            拡大縮小済みの画像を作らず、paintEventで再描画範囲だけを高速に拡大縮小して描く。
+            ズーム操作中のように、すぐに描き直す表示でページ全体分の画像を確保しないために使う。
+            setPixmap・clearを呼ぶと通常の表示に戻る
+        """
+        super().setPixmap(QPixmap())
+        self._scaled_source = pixmap
+        self._scaled_source_scale = scale
+        size = pixmap.deviceIndependentSize()
+        self.resize(int(size.width() * scale), int(size.height() * scale))
+        self.update()
+
+    def setPixmap(self, pixmap: QPixmap):
+        """表示する画像を設定（set_scaled_sourceによる表示を解除する）"""
+        self._scaled_source = None
+        super().setPixmap(pixmap)
+
+    def clear(self):
+        """表示内容をクリア（set_scaled_sourceによる表示も解除する）"""
+        self._scaled_source = None
+        super().clear()
+
     def mousePressEvent(self, event: QMouseEvent):
         """マウスボタン押下イベント
 
@@ -155,8 +417,12 @@ class SelectableLabel(QLabel):
             self.mouse_moved = False
 
             # 既存の選択範囲をクリア（新しい選択開始）
+            # 再描画は消える矩形の周辺のみに限定する
+            old_rect = self.selection_rect
             self.selection_rect = QRect()
-            self.update()
+            if not old_rect.isEmpty():
+                self.update(old_rect.adjusted(-SELECTION_REPAINT_MARGIN, -SELECTION_REPAINT_MARGIN,
+                                              SELECTION_REPAINT_MARGIN, SELECTION_REPAINT_MARGIN))
         elif event.button() == Qt.RightButton:
             # 右クリックでパンニング開始
             self.panning = True
@@ -175,9 +441,13 @@ class SelectableLabel(QLabel):
         """
         if self.selecting and event.buttons() & Qt.LeftButton:
             self.selection_end = event.position().toPoint()
+            old_rect = self.selection_rect
             self.selection_rect = QRect(self.selection_start, self.selection_end).normalized()
             self.mouse_moved = True
-            self.update()
+            # 再描画は変更前後の矩形を含む範囲のみに限定する（枠線の太さ分を余白として加える）
+            self.update(old_rect.united(self.selection_rect).adjusted(
+                -SELECTION_REPAINT_MARGIN, -SELECTION_REPAINT_MARGIN,
+                SELECTION_REPAINT_MARGIN, SELECTION_REPAINT_MARGIN))
         elif self.panning and event.buttons() & Qt.RightButton:
             # パンニング処理
             if self.scroll_area:
@@ -241,21 +511,31 @@ class SelectableLabel(QLabel):
         Args:
             event: ペイントイベント
         """
-        super().paintEvent(event)
+        if self._scaled_source is not None:
+            # 再描画範囲だけを、倍率を掛けて高速に描画する
+            painter = QPainter(self)
+            painter.setClipRect(event.rect())
+            painter.scale(self._scaled_source_scale, self._scaled_source_scale)
+            painter.drawPixmap(0, 0, self._scaled_source)
+            painter.end()
+        else:
+            super().paintEvent(event)
         
         # 現在選択中の範囲を描画
         if self.selecting and not self.selection_rect.isEmpty():
             painter = QPainter(self)
-            painter.setPen(QPen(QColor(0, 120, 215), 2, Qt.DashLine))
-            painter.setBrush(QColor(0, 120, 215, 50))
+            painter.setPen(self._selecting_pen)
+            painter.setBrush(self._selecting_brush)
             painter.drawRect(self.selection_rect)
+            painter.end()
         
         # 確定した選択範囲を描画（薄く表示）
         elif not self.confirmed_selection.isEmpty():
             painter = QPainter(self)
-            painter.setPen(QPen(QColor(0, 120, 215), 1, Qt.SolidLine))
-            painter.setBrush(QColor(0, 120, 215, 20))
+            painter.setPen(self._confirmed_pen)
+            painter.setBrush(self._confirmed_brush)
             painter.drawRect(self.confirmed_selection)
+            painter.end()
 
 
 class AnalysisResultBubble(QFrame):
@@ -287,10 +567,10 @@ class AnalysisResultBubble(QFrame):
         self.extracted_text = extracted_text if extracted_text is not None else result_text
         self.is_debug_mode = is_debug_mode
 
-        # アプリケーションレベルのイベントフィルターをインストール
-        # （バブル外のクリックを検出するため）
-        QApplication.instance().installEventFilter(self)
-        
+        # バブル外のクリックでの非表示は、Qt.Popupにより Qt が自動で行う
+        # （アプリケーション全体のイベントフィルターは使わない）
+        self._app_state_connected = False
+
         # メインレイアウト
         main_layout = QVBoxLayout()
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -416,48 +696,42 @@ class AnalysisResultBubble(QFrame):
         # バブル内のクリックでは閉じない（コピー操作のため）
         event.accept()
 
-    def eventFilter(self, obj, event):
-        """アプリケーション全体のイベントをフィルタリング
+    def showEvent(self, event):
+        """バブルが表示される際の処理
 
-        バブル外でマウスクリックが発生した場合、バブルを非表示にする。
+        表示中のみ、アプリケーションの状態変化（タスク切り替え）を監視する。
 
         Args:
-            obj: イベントが発生したオブジェクト
-            event: 発生したイベント
+            event: showイベント
+        """
+        if not self._app_state_connected:
+            QApplication.instance().applicationStateChanged.connect(self._on_application_state_changed)
+            self._app_state_connected = True
+        super().showEvent(event)
 
-        Returns:
-            bool: イベントを処理した場合True、そうでない場合False
+    def _on_application_state_changed(self, state):
+        """アプリケーションの状態変化時の処理
+
+        別のアプリケーションに切り替わった場合、バブルを非表示にする。
+
+        Args:
+            state (Qt.ApplicationState): 変化後のアプリケーションの状態
         """
-        from PySide6.QtCore import QEvent
-
-        # マウスボタン押下イベントをチェック
-        if event.type() == QEvent.MouseButtonPress:
-            # バブル内のクリックかどうかを判定
-            click_pos = event.globalPosition().toPoint()
-            if not self.geometry().contains(self.mapFromGlobal(click_pos)):
-                # バブル外のクリックなので非表示
-                self.hide()
-                return False
-
-        # ウィンドウのアクティブ化状態の変更をチェック（タスク切り替え）
-        if event.type() == QEvent.ApplicationDeactivate:
-            # 別のアプリケーションに切り替わったので非表示
+        if state != Qt.ApplicationActive:
             self.hide()
-            return False
-
-        # 通常の処理を継続
-        return super().eventFilter(obj, event)
 
     def hideEvent(self, event):
         """バブルが非表示になる際の処理
 
-        イベントフィルターを解除し、タイマーを停止する。
+        アプリケーションの状態変化の監視を解除し、タイマーを停止する。
 
         Args:
             event: hideイベント
         """
-        # イベントフィルターを解除
-        QApplication.instance().removeEventFilter(self)
+        # アプリケーションの状態変化の監視を解除
+        if self._app_state_connected:
+            QApplication.instance().applicationStateChanged.disconnect(self._on_application_state_changed)
+            self._app_state_connected = False
 
         # タイマーを停止
         if hasattr(self, 'timer') and self.timer.isActive():
@@ -492,6 +766,10 @@ class ReloadableAccountComboBox(QComboBox):
 
 
 class PDFViewerApp(QMainWindow):
+    # 勘定科目リストのキャッシュ（((パス, 更新時刻ns, サイズ), 表示用文字列リスト)）
+    # ウィンドウを開き直してもCSVの読み込み・ソートをやり直さないよう、インスタンス間で共有する
+    _accounts_cache = None
+
     def __init__(self, pdf_handler: PDFHandler):
         super().__init__()
 
@@ -513,12 +791,25 @@ class PDFViewerApp(QMainWindow):
         self.current_page = 0
         self.total_pages = 0
         self.extracted_text_items = []  # 抽出されたテキストのリスト
+        # 抽出テキスト一覧（text_items_list）に表示中のテキストの集合。重複の確認に使う
+        # （一覧の項目を追加・削除する箇所では、この集合も合わせて更新する）
+        self._text_items_set = set()
 
         # 範囲選択関連
         self.selection_analyzer = SelectionAnalyzer()
         self.current_bubbles = []  # 表示中のバブルリスト
         self.debug_mode = False  # デバッグモードフラグ
         self.analysis_worker = None  # 分析ワーカー
+        self.analysis_request_id = 0  # 最新の分析依頼の番号（これと異なる番号の結果は破棄する）
+        # 実行中のワーカー（依頼番号 -> ワーカー）。キャンセル後も終了までシグナルの送信元を保持する
+        self._running_workers = {}
+        # 範囲選択の分析用のスレッドプール（同時に1件のみ実行）
+        # 破棄予定の分析が、共有のスレッドプールで行うPDFの読み込み・ページ描画を待たせないよう分ける
+        self._analysis_pool = QThreadPool(self)
+        self._analysis_pool.setMaxThreadCount(1)
+        # 範囲選択の分析結果のキャッシュ（(パス, ページ, 選択範囲, ズーム倍率, 表示サイズ, 言語, 高速モード) -> 結果リスト）
+        # 同じ範囲を選択し直した場合に、OCRを含む分析をやり直さないようにする
+        self._analysis_cache: "OrderedDict[tuple, list]" = OrderedDict()
         self.analysis_in_progress = False  # 分析実行中フラグ
         self.last_selection_rect = QRect()  # 最後の選択範囲
 
@@ -528,8 +819,62 @@ class PDFViewerApp(QMainWindow):
         self.max_zoom = 5.0   # 最大ズーム倍率
         self.zoom_step = 0.25  # ズームステップ
 
+        # ページ表示の更新要求をまとめるタイマー（待ち時間内の要求は最後の状態で1回だけ描画する）
+        self._page_update_timer = QTimer(self)
+        self._page_update_timer.setSingleShot(True)
+        self._page_update_timer.setInterval(PAGE_UPDATE_DELAY_MS)
+        self._page_update_timer.timeout.connect(self._do_update_page_display)
+
+        # ズーム操作中は高速な拡大縮小（Qt.FastTransformation）で表示するフラグと、
+        # 操作が落ち着いた時点で高品質に描画し直すタイマー
+        self._zoom_fast_scaling = False
+        self._zoom_settle_timer = QTimer(self)
+        self._zoom_settle_timer.setSingleShot(True)
+        self._zoom_settle_timer.setInterval(ZOOM_SETTLE_DELAY_MS)
+        self._zoom_settle_timer.timeout.connect(self._finalize_zoom)
+        # ビューポートに収めるためのベーススケール（(元画像のサイズ, 表示領域のサイズ, スケール)）
+        # ズームのみの更新では両サイズが変わらないため、計算し直さない
+        self._cached_base_scale = None
+        # テキスト欄に表示中のページ（(パス, ページ)）。ズームのみの更新ではテキストを設定し直さない
+        self._displayed_text_key = None
+
+        # 表示済みページ画像のキャッシュ
+        # ((パス, ページ, ズーム倍率, デバイスピクセル比, 表示領域のサイズ) -> 拡大縮小済みのQPixmap)
+        # ページ移動・ズームの切り替えで、同じ表示を再レンダリングしないようにする
+        self._page_cache: "OrderedDict[tuple, QPixmap]" = OrderedDict()
+        # ページのレンダリング結果（(パス, ページ, デバイスピクセル比) -> QPixmap）
+        # ズーム倍率だけが変わる場合や、最近表示したページに戻る場合は、レンダリングを省いて拡大縮小のみ行う
+        self._base_pixmaps: "OrderedDict[tuple, QPixmap]" = OrderedDict()
+        # PDF読み込みの依頼番号（これと異なる番号の読み込み結果は破棄する）と、
+        # 読み込み中のワーカー（依頼番号 -> ワーカー）。結果の通知まで送信元を保持する
+        self.pdf_load_request_id = 0
+        self._pdf_load_workers = {}
+        # ページ描画の依頼番号（これと異なる番号の描画結果は破棄する）
+        self.render_request_id = 0
+        # 描画中のワーカー（依頼番号 -> ワーカー）。描画結果の通知まで送信元を保持する
+        self._render_workers = {}
+        # 描画中のページのキー（同じページの描画を重ねて依頼しないため）
+        self._pending_render_key = None
+        # 前後のページの先読み中のワーカー（(キャッシュの世代, (パス, ページ, デバイスピクセル比)) -> ワーカー）
+        # キャッシュの破棄後も、描画結果の通知まで送信元を保持する
+        self._prefetch_workers = {}
+        # ページ描画・先読み用のスレッドプール。リネーム前に未実行の描画を取り消し、
+        # 実行中の描画の終了を待てるよう、他の処理とは別のプールにする
+        self._render_pool = QThreadPool(self)
+        # ページ画像キャッシュの世代（キャッシュを破棄するたびに増やし、破棄前に依頼した先読みの結果を使わない）
+        self._page_cache_generation = 0
+        # ページごとの抽出テキストのキャッシュ（(パス, ページ) -> テキスト）
+        # 描画後の表示更新でテキストを再取得せず、描画中のハンドラーの解放を待たないようにする
+        self._page_texts: "OrderedDict[tuple, str]" = OrderedDict()
+
+        # ページごとの抽出テキスト項目のキャッシュ（(パス, ページ) -> 抽出項目リスト）
+        # ページを行き来するたびに、テキスト抽出とパターン照合をやり直さないようにする
+        self._text_items_cache = {}
+
         self.setup_ui()
         self.setup_connections()
+        # 最初の範囲選択が遅くならないよう、OCRエンジンを先に初期化しておく
+        self.selection_analyzer.warmup(self.get_ocr_language())
         self.logger.info(constants.MESSAGE_VIEWER_INITIALIZED)
 
         # 前回のフォルダが復元された場合はログ出力
@@ -547,8 +892,10 @@ class PDFViewerApp(QMainWindow):
         - 読み取り権限があること
         - 危険な文字が含まれていないこと
 
+        存在・種別・権限の検証は、シンボリックリンクと「..」を解決したパスに対して行う。
+
         Returns:
-            Optional[str]: 検証済みのフォルダパス、または None（検証失敗時）
+            Optional[str]: 検証済みのフォルダパス（正規化済み）、または None（検証失敗時）
         """
         try:
             saved_folder = self.settings.value("last_folder_path", None)
@@ -574,18 +921,23 @@ class PDFViewerApp(QMainWindow):
                 return None
 
             # 危険な文字が含まれている場合（改ざん検知）
-            dangerous_chars = ['\0', '\n', '\r', '\t']
-            if any(char in saved_folder for char in dangerous_chars):
+            if not _FORBIDDEN_PATH_CHARS.isdisjoint(saved_folder):
                 self.logger.warning(f"危険な文字を含むパス「{saved_folder}」を検出。デフォルト位置を使用します")
                 return None
 
+            # シンボリックリンクや「..」を解決した実際のパスで以降の検証を行う
+            saved_folder = os.path.realpath(saved_folder)
+
             # ディレクトリが存在しない場合
-            if not os.path.exists(saved_folder):
+            # （存在確認と種別の確認は1回のstatで行う。ネットワークドライブではstatが遅いため）
+            try:
+                st = os.stat(saved_folder)
+            except OSError:
                 self.logger.info(f"保存されたフォルダ「{saved_folder}」が存在しません。デフォルト位置を使用します")
                 return None
 
             # ディレクトリでない場合（ファイルパスが指定されている）
-            if not os.path.isdir(saved_folder):
+            if not stat.S_ISDIR(st.st_mode):
                 self.logger.warning(f"保存されたパス「{saved_folder}」はディレクトリではありません。デフォルト位置を使用します")
                 return None
 
@@ -692,14 +1044,14 @@ class PDFViewerApp(QMainWindow):
         """ズームイン"""
         if self.zoom_scale < self.max_zoom:
             self.zoom_scale = min(self.zoom_scale + self.zoom_step, self.max_zoom)
-            self.update_page_display()
+            self._request_zoom_display()
             self.logger.info(f"ズームイン: {self.zoom_scale:.2f}x")
     
     def zoom_out(self):
         """ズームアウト"""
         if self.zoom_scale > self.min_zoom:
             self.zoom_scale = max(self.zoom_scale - self.zoom_step, self.min_zoom)
-            self.update_page_display()
+            self._request_zoom_display()
             self.logger.info(f"ズームアウト: {self.zoom_scale:.2f}x")
     
     def reset_zoom(self):
@@ -714,55 +1066,44 @@ class PDFViewerApp(QMainWindow):
         if not text or text.strip() == "":
             return []
 
-        # テキストを行に分割
-        lines = text.split('\n')
-
-        # 空白行を除去
-        lines = [line.strip() for line in lines if line.strip()]
+        # 日付パターンは空白・改行を含まないため、行に分割せずテキスト全体を1回で検索する
+        dates = _DATE_RE.findall(text)
+        invoice_numbers = []
+        amounts = []
+        company_names = []
 
-        # 日付パターンを検索
-        date_pattern = r'\d{4}[-/年]\d{1,2}[-/月]\d{1,2}'
-        dates = []
-        for line in lines:
-            matches = re.findall(date_pattern, line)
-            dates.extend(matches)
+        # 行単位で判定するパターンは、テキスト全体に手がかりがある場合のみ行を走査する
+        # （いずれかの行にマッチするなら、テキスト全体にも必ずマッチする）
+        match_invoice = _INVOICE_RE.search(text) is not None
+        lower_text = text.lower()
+        amount_keywords = [keyword for keyword in _AMOUNT_KEYWORDS if keyword in lower_text]
+        company_keywords = [keyword for keyword in _COMPANY_KEYWORDS if keyword in text]
+        if not (match_invoice or amount_keywords or company_keywords):
+            return list(dict.fromkeys(dates))
+
+        # テキストを行に分割し、空白行を除いた各行を1回の走査で照合する
+        for line in text.split('\n'):
+            line = line.strip()
+            if not line:
+                continue
 
-        # 請求書番号パターンを検索 (例: 請求書No.12345 や INV-2023-001 など)
-        invoice_pattern = r'(請求書|インボイス|[Ii]nvoice)[-\s]?(No|NO|番号)?\.?\s*[\w\d\-]+'
-        invoice_numbers = []
-        for line in lines:
-            matches = re.findall(invoice_pattern, line)
-            if matches:
-                # マッチした行全体を追加
+            # 請求書番号パターンを検索（マッチした行全体を追加）
+            if match_invoice and _INVOICE_RE.search(line):
                 invoice_numbers.append(line)
 
-        # 金額パターンを検索 (例: \1,234,567 や 123.45円 など)
-        amount_pattern = r'(\|￥|$|＄)?\s*[\d,]+\s*(円|ドル|USD|JPY|USD|EUR|GBP|AUD|CAD|CHF|CNY|HKD|KRW|SGD|TWD)?'
-        amounts = []
-        for line in lines:
-            if 'total' in line.lower() or 'amount' in line.lower() or '合計' in line \
-                    or '金額' in line or '総額' in line:
-                matches = re.findall(amount_pattern, line)
-                if matches:
-                    # マッチした行全体を追加
+            # 金額パターンを検索（キーワードを含み、マッチした行全体を追加）
+            if amount_keywords:
+                lower_line = line.lower()
+                if any(keyword in lower_line for keyword in amount_keywords) and _AMOUNT_RE.search(line):
                     amounts.append(line)
 
-        # 会社名や取引先名と思われるものを抽出 (見出し行や特定パターン)
-        company_names = []
-        for line in lines:
-            if len(line) > 3 and ( \
-                '株式会社' in line or \
-                '有限会社' in line or \
-                '合同会社' in line or \
-                'Co., Ltd.' in line
-                ):
+            # 会社名や取引先名と思われるものを抽出 (見出し行や特定パターン)
+            if company_keywords and len(line) > 3 and any(keyword in line for keyword in company_keywords):
                 company_names.append(line)
 
-        # すべての抽出項目をまとめる
-        all_items = dates + invoice_numbers + amounts + company_names
-
-        # 重複を除去して返却
-        return list(set(all_items))
+        # すべての抽出項目を種類の順につなぎ、重複を除去して返却（最初に現れた順序を保つ）
+        # 連結した中間リストは作らず、chainで順に渡す
+        return list(dict.fromkeys(chain(dates, invoice_numbers, amounts, company_names)))
 
     def add_text_to_filename(self, item):
         """クリックされたテキストをファイル名フィールドに追加
@@ -846,6 +1187,8 @@ class PDFViewerApp(QMainWindow):
             text = item.text()
             row = self.text_items_list.row(item)
             self.text_items_list.takeItem(row)
+            if not self.text_items_list.findItems(text, Qt.MatchExactly):
+                self._text_items_set.discard(text)
             self.logger.info(f"テキストアイテム「{text}」を削除しました")
 
     def _set_window_icon(self):
@@ -944,7 +1287,7 @@ class PDFViewerApp(QMainWindow):
             return f"　 {account}"
 
         def _default_display_list() -> List[str]:
-            sorted_accounts = sorted(default_accounts, key=lambda x: x[2])
+            sorted_accounts = sorted(default_accounts, key=_BY_YOMIGANA)
             return [_format_display(icon, account) for icon, account, _ in sorted_accounts]
 
         # ユーザー設定ファイルが存在しない場合は、デフォルトファイルからコピー
@@ -959,7 +1302,7 @@ class PDFViewerApp(QMainWindow):
                         with open(accounts_file, 'w', encoding='utf-8', newline='') as f:
                             writer = csv.writer(f)
                             writer.writerow(["アイコン", "勘定科目", "よみがな"])
-                            sorted_accounts = sorted(default_accounts, key=lambda x: x[2])
+                            sorted_accounts = sorted(default_accounts, key=_BY_YOMIGANA)
                             for icon, account, yomigana in sorted_accounts:
                                 writer.writerow([icon, account, yomigana])
                         self.logger.info(f"デフォルト値で勘定科目設定ファイルを作成しました: {accounts_file}")
@@ -971,7 +1314,7 @@ class PDFViewerApp(QMainWindow):
                     with open(accounts_file, 'w', encoding='utf-8', newline='') as f:
                         writer = csv.writer(f)
                         writer.writerow(["アイコン", "勘定科目", "よみがな"])
-                        sorted_accounts = sorted(default_accounts, key=lambda x: x[2])
+                        sorted_accounts = sorted(default_accounts, key=_BY_YOMIGANA)
                         for icon, account, yomigana in sorted_accounts:
                             writer.writerow([icon, account, yomigana])
                     self.logger.info(f"勘定科目設定ファイルを作成しました: {accounts_file}")
@@ -981,7 +1324,14 @@ class PDFViewerApp(QMainWindow):
 
         # ファイルから勘定科目を読み込む
         try:
-            file_size = os.path.getsize(accounts_file)
+            st = os.stat(accounts_file)
+            cache_key = (accounts_file, st.st_mtime_ns, st.st_size)
+            # 前回読み込み時からファイルが変更されていない場合はキャッシュを返す
+            cached = PDFViewerApp._accounts_cache
+            if cached is not None and cached[0] == cache_key:
+                return list(cached[1])
+
+            file_size = st.st_size
             max_file_size = 1024 * 1024  # 1MB
             if file_size > max_file_size:
                 self.logger.error(f"勘定科目設定ファイルのサイズが大きすぎます: {file_size} bytes (制限: {max_file_size} bytes)")
@@ -1019,10 +1369,11 @@ class PDFViewerApp(QMainWindow):
                     accounts_data.append((icon, account, yomigana))
 
                 if accounts_data:
-                    sorted_accounts = sorted(accounts_data, key=lambda x: x[2])
+                    sorted_accounts = sorted(accounts_data, key=_BY_YOMIGANA)
                     display_names = [_format_display(icon, account) for icon, account, _ in sorted_accounts]
                     self.logger.info(f"勘定科目を設定ファイルから読み込みました: {len(display_names)}項目（よみがなでソート済み）")
-                    return display_names
+                    PDFViewerApp._accounts_cache = (cache_key, display_names)
+                    return list(display_names)
                 else:
                     self.logger.warning("勘定科目設定ファイルが空です。デフォルト値を使用します")
                     return _default_display_list()
@@ -1101,126 +1452,135 @@ class PDFViewerApp(QMainWindow):
             - YYYY年MM月DD日 → YYYY-MM-DD
             - YY/MM/DD → 20YY-MM-DD
             - YY.MM.DD → 20YY-MM-DD
-            全角・半角スペースに対応
+            全角・半角スペースに対応。
+            テキスト内に複数の日付がある場合は、それぞれを変換する
         """
-        import re
-        from datetime import datetime
-
-        self.logger.info(f"日付整形処理開始: 入力テキスト「{text}」")
+        # ログ出力が無効な場合は、メッセージの組み立てを省く
+        log_info = self.logger.isEnabledFor(logging.INFO)
+        if log_info:
+            self.logger.info(f"日付整形処理開始: 入力テキスト「{text}」")
 
         # 前処理: すべての空白文字を除去
         # Y座標許容誤差の実装により、テキスト要素間に空白が入るケースが増えたため
         # 日付パターンマッチング前に空白を除去する
-        text_cleaned = re.sub(r'\s+', '', text)  # すべての空白文字を除去
+        text_cleaned = _WHITESPACE_RE.sub('', text)  # すべての空白文字を除去
         if text != text_cleaned:
-            self.logger.info(f"空白文字を除去: 「{text}」 → 「{text_cleaned}」")
+            if log_info:
+                self.logger.info(f"空白文字を除去: 「{text}」 → 「{text_cleaned}」")
             text = text_cleaned
 
-        # 全角・半角スペースの両方に対応するパターン
-        space_pattern = r'[\s\u3000]*'
-
-        # パターン0: 和暦 (例: 令和7年1月16日、令和 7年 1月16日、平成31年4月30日)
-        pattern_wareki = rf'(令和|平成|昭和|大正|明治){space_pattern}(\d{{1,2}})年{space_pattern}(\d{{1,2}})月{space_pattern}(\d{{1,2}})日?'
-        match = re.search(pattern_wareki, text)
-        if match:
-            era, year, month, day = match.groups()
-
-            # 元号ごとの開始年（西暦）
-            era_start_years = {
-                '令和': 2019,  # 2019年5月1日～
-                '平成': 1989,  # 1989年1月8日～2019年4月30日
-                '昭和': 1926,  # 1926年12月25日～1989年1月7日
-                '大正': 1912,  # 1912年7月30日～1926年12月24日
-                '明治': 1868   # 1868年1月25日～1912年7月29日
-            }
-
-            # 和暦から西暦に変換
-            start_year = era_start_years.get(era, 2019)
-            western_year = start_year + int(year) - 1
-
-            formatted_date = f"{western_year}-{int(month):02d}-{int(day):02d}"
-            result = re.sub(pattern_wareki, formatted_date, text)
-            self.logger.info(f"✓ 和暦を西暦に変換: {text} → {result} (元号: {era}{year}年)")
-            return result
-
-        # パターン1: YYYY年MM月DD日 (例: 2023年12月25日、2025年 1月16日)
-        pattern1 = rf'(\d{{4}})年{space_pattern}(\d{{1,2}})月{space_pattern}(\d{{1,2}})日?'
-        match = re.search(pattern1, text)
-        if match:
-            year, month, day = match.groups()
-            formatted_date = f"{year}-{int(month):02d}-{int(day):02d}"
-            result = re.sub(pattern1, formatted_date, text)
-            self.logger.info(f"✓ 日付を整形: {text} → {result}")
-            return result
-
-        # パターン2: YYYY/MM/DD または YYYY.MM.DD (例: 2023/12/25, 2023.12.25)
-        pattern2 = r'(\d{4})[/.](\d{1,2})[/.](\d{1,2})'
-        match = re.search(pattern2, text)
-        if match:
-            year, month, day = match.groups()
-            formatted_date = f"{year}-{int(month):02d}-{int(day):02d}"
-            result = re.sub(pattern2, formatted_date, text)
-            self.logger.info(f"日付を整形: {text} → {result}")
-            return result
-
-        # パターン3: YY/MM/DD または YY.MM.DD (例: 23/12/25, 23.12.25)
-        # 2000年代と仮定
-        pattern3 = r'(\d{2})[/.](\d{1,2})[/.](\d{1,2})'
-        match = re.search(pattern3, text)
-        if match:
-            year, month, day = match.groups()
-            full_year = f"20{year}"
-            formatted_date = f"{full_year}-{int(month):02d}-{int(day):02d}"
-            result = re.sub(pattern3, formatted_date, text)
-            self.logger.info(f"日付を整形: {text} → {result}")
-            return result
-
-        # パターン4: YYYY-MM-DD (すでに正しい形式)
-        pattern4 = r'\d{4}-\d{2}-\d{2}'
-        if re.search(pattern4, text):
-            self.logger.info(f"✓ 日付は既に正しい形式: {text}")
+        # よくある「既にYYYY-MM-DD形式の日付だけ」の場合は、正規表現を使わずに判定する
+        # （isdecimalは正規表現の\dと同じくUnicodeの10進数字を判定する）
+        if (len(text) == 10 and text[4] == '-' and text[7] == '-' and text[:4].isdecimal()
+                and text[5:7].isdecimal() and text[8:].isdecimal()):
+            if log_info:
+                self.logger.info(f"✓ 日付は既に正しい形式: {text}")
             return text
 
-        # 日付パターンに一致しない場合はそのまま返す
-        self.logger.info(f"✗ 日付パターンに一致しませんでした。元のテキストをそのまま使用: {text}")
-        return text
+        # すべての日付形式を1回の走査で検出し、それぞれYYYY-MM-DD形式に置き換える
+        result, kinds = convert_dates(text)
+        if log_info:
+            if not kinds:
+                # 日付パターンに一致しない場合はそのまま返す
+                self.logger.info(f"✗ 日付パターンに一致しませんでした。元のテキストをそのまま使用: {text}")
+            elif result == text:
+                self.logger.info(f"✓ 日付は既に正しい形式: {text}")
+            else:
+                self.logger.info(f"✓ 日付を整形: {text} → {result} (形式: {', '.join(kinds)})")
+        return result
+
+    def _request_zoom_display(self):
+        """ズーム操作に伴うページ表示の更新を要求
+
+        Note:
+            連続したズーム操作の間は高速な拡大縮小で表示し、
+            ZOOM_SETTLE_DELAY_MS の間操作がなければ_finalize_zoomで高品質に描画し直す
+        """
+        self._zoom_fast_scaling = True
+        self.update_page_display()
+        self._zoom_settle_timer.start()
+
+    def _finalize_zoom(self):
+        """ズーム操作の終了後に、高品質な拡大縮小で描画し直す"""
+        self._zoom_fast_scaling = False
+        self._do_update_page_display()
 
     def update_page_display(self):
+        """ページ表示の更新を要求
+
+        Note:
+            ホイール操作等で連続して呼ばれた場合に毎回描画しないよう、
+            実際の更新はPAGE_UPDATE_DELAY_MS後に_do_update_page_displayで1回だけ行う
+        """
+        self._page_update_timer.start()
+
+    def _do_update_page_display(self):
+        """現在のページ・ズーム倍率でプレビュー画像とページ情報を更新"""
         try:
             if not self.current_pdf_path:
                 return
 
-            # プレビュー画像の取得 (PDFハンドラーに依存)
-            pixmap = self.pdf_handler.get_preview(self.current_pdf_path, self.current_page)
+            dpr = self.devicePixelRatioF()
+            viewport_size = self.scroll_area.viewport().size()
+            cache_key = (self.current_pdf_path, self.current_page, round(self.zoom_scale, 2), dpr,
+                         viewport_size.width(), viewport_size.height())
+            scaled_pixmap = self._page_cache.get(cache_key)
+            if scaled_pixmap is not None:
+                # 表示済みの画像をそのまま使う
+                # （拡大縮小済みの画像を渡しているため、QLabelは再描画範囲だけを転送する。
+                #   同じ画像を表示中の場合は、setPixmapによる全体の再描画も行わない）
+                self._page_cache.move_to_end(cache_key)
+                if self.preview_label.pixmap().cacheKey() != scaled_pixmap.cacheKey():
+                    self.preview_label.setPixmap(scaled_pixmap)
+                    self.preview_label.resize(scaled_pixmap.deviceIndependentSize().toSize())
+                pixmap = None
+            else:
+                pixmap = self._get_base_pixmap(dpr)
             if pixmap:
-                # ズーム倍率を適用してスケーリング
-                original_size = pixmap.size()
-                viewport_size = self.scroll_area.viewport().size()
+                # ズーム倍率を適用してスケーリング（レイアウト計算は論理ピクセルで行う）
+                original_size = pixmap.deviceIndependentSize().toSize()
 
                 # ビューポートに収まるようにベーススケールを計算（アスペクト比を維持）
-                scale_w = viewport_size.width() / original_size.width()
-                scale_h = viewport_size.height() / original_size.height()
-                base_scale = min(scale_w, scale_h)  # 小さい方を採用してウィンドウに収める
+                cached_base_scale = self._cached_base_scale
+                if (cached_base_scale is not None and cached_base_scale[0] == original_size
+                        and cached_base_scale[1] == viewport_size):
+                    base_scale = cached_base_scale[2]
+                else:
+                    scale_w = viewport_size.width() / original_size.width()
+                    scale_h = viewport_size.height() / original_size.height()
+                    base_scale = min(scale_w, scale_h)  # 小さい方を採用してウィンドウに収める
+                    self._cached_base_scale = (original_size, viewport_size, base_scale)
 
                 # ズーム倍率を適用（zoom_scale=1.0の時はウィンドウにフィット）
                 final_scale = base_scale * self.zoom_scale
 
-                zoom_width = int(original_size.width() * final_scale)
-                zoom_height = int(original_size.height() * final_scale)
-
-                scaled_pixmap = pixmap.scaled(
-                    zoom_width, zoom_height,
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation
-                )
-                self.preview_label.setPixmap(scaled_pixmap)
-
-                # ラベルのサイズをピクセルマップのサイズに合わせる（スクロールバーが正しく表示されるように）
-                self.preview_label.resize(scaled_pixmap.size())
+                if self._zoom_fast_scaling:
+                    # ズーム操作中は拡大縮小済みの画像を作らず、表示範囲だけを描画時に拡大縮小する
+                    # （操作が落ち着いた時点で_finalize_zoomから高品質な画像を作り直す）
+                    self.preview_label.set_scaled_source(pixmap, final_scale)
+                else:
+                    # 実ピクセルでスケーリングし、デバイスピクセル比を設定して論理サイズに合わせる
+                    # （元画像と表示画像のデバイスピクセル比は同じため、実ピクセルの倍率もfinal_scaleになる。
+                    #   scaledのような縦横比の調整を挟まず、倍率を直接指定して変換する）
+                    scaled_pixmap = pixmap.transformed(
+                        QTransform.fromScale(final_scale, final_scale), Qt.SmoothTransformation
+                    )
+                    scaled_pixmap.setDevicePixelRatio(dpr)
+                    self.preview_label.setPixmap(scaled_pixmap)
+
+                    self._page_cache[cache_key] = scaled_pixmap
+                    while len(self._page_cache) > MAX_CACHED_PAGES:
+                        self._page_cache.popitem(last=False)
+
+                    # ラベルのサイズをピクセルマップのサイズに合わせる（スクロールバーが正しく表示されるように）
+                    self.preview_label.resize(scaled_pixmap.deviceIndependentSize().toSize())
 
             # テキストの取得 (PDFハンドラーに依存)
-            text = self.pdf_handler.get_text(self.current_pdf_path, self.current_page)
-            self.text_edit.setText(text)
+            # ズームのみの更新ではページが変わらないため、テキストは設定し直さない
+            text_key = (self.current_pdf_path, self.current_page)
+            if self._displayed_text_key != text_key:
+                self.text_edit.setText(self._get_page_text())
+                self._displayed_text_key = text_key
 
             # ページ情報の更新（ズーム情報も含む）
             zoom_percent = int(self.zoom_scale * 100)
@@ -1233,44 +1593,235 @@ class PDFViewerApp(QMainWindow):
         except Exception as e:
             error_message = f"ページ表示時にエラーが発生しました: {str(e)}"
             self.text_edit.setText(error_message)
+            self._displayed_text_key = None
             self.logger.error(error_message, exc_info=True)
             QMessageBox.warning(self, "エラー", error_message)
 
+    def _get_base_pixmap(self, dpr: float) -> Optional[QPixmap]:
+        """現在のページをレンダリングした画像を取得
+
+        Args:
+            dpr (float): 画面のデバイスピクセル比
+
+        Returns:
+            Optional[QPixmap]: レンダリングした画像。描画中・失敗した場合はNone
+
+        Note:
+            最近レンダリングしたページ・デバイスピクセル比の場合は、キャッシュした結果を返す。
+            それ以外の場合はワーカースレッドで描画を開始してNoneを返し、
+            描画が終わった時点で_on_page_renderedから表示を更新する
+        """
+        key = (self.current_pdf_path, self.current_page, dpr)
+        pixmap = self._base_pixmaps.get(key)
+        if pixmap is not None:
+            self._base_pixmaps.move_to_end(key)
+            return pixmap
+        if self._pending_render_key == key or (self._page_cache_generation, key) in self._prefetch_workers:
+            # 描画中・先読み中の場合は、その完了時に表示を更新する
+            return None
+
+        # プレビュー画像の取得 (PDFハンドラーに依存)
+        # 画面のデバイスピクセル比に合わせた解像度でレンダリングさせる
+        self.render_request_id += 1
+        self._pending_render_key = key
+        worker = PageRenderWorker(self.pdf_handler, self.current_pdf_path, self.current_page, dpr,
+                                  self.render_request_id, key)
+        worker.signals.rendered.connect(self._on_page_rendered)
+        self._render_workers[self.render_request_id] = worker
+        self._render_pool.start(worker)
+        return None
+
+    def _on_page_rendered(self, request_id: int, key: tuple, image, error):
+        """ページの描画完了時の処理
+
+        Args:
+            request_id (int): 描画の依頼番号
+            key (tuple): 描画結果のキャッシュキー（パス, ページ, デバイスピクセル比）
+            image (Optional[QImage]): 描画結果。失敗した場合はNone
+            error (Optional[str]): 失敗した場合のエラーメッセージ
+        """
+        self._render_workers.pop(request_id, None)
+        # 別のページ・倍率の描画が依頼済みの場合は、古い結果を使わない
+        if request_id != self.render_request_id:
+            return
+        self._pending_render_key = None
+        if error is not None:
+            self.logger.warning("%s: %s (ページ %d)", error, os.path.basename(key[0]), key[1] + 1)
+        if image is None or image.isNull():
+            return
+
+        pixmap = QPixmap.fromImage(image, Qt.NoFormatConversion)
+        pixmap.setDevicePixelRatio(key[2])
+        self._base_pixmaps[key] = pixmap
+        while len(self._base_pixmaps) > MAX_CACHED_BASE_PAGES:
+            self._base_pixmaps.popitem(last=False)
+        if key == (self.current_pdf_path, self.current_page, self.devicePixelRatioF()):
+            self._do_update_page_display()
+            self._prefetch_adjacent_pages(key[2])
+
+    def _prefetch_adjacent_pages(self, dpr: float):
+        """現在のページの前後のページを、バックグラウンドで先にレンダリングしておく
+
+        Args:
+            dpr (float): 画面のデバイスピクセル比
+
+        Note:
+            次へ・前へのページ移動で、キャッシュからすぐに表示できるようにする。
+            描画はPDFハンドラーのロックで直列化されるため、表示中のページの描画とは重ならない
+        """
+        for page in (self.current_page + 1, self.current_page - 1):
+            if not (0 <= page < self.total_pages):
+                continue
+            key = (self.current_pdf_path, page, dpr)
+            worker_key = (self._page_cache_generation, key)
+            if key in self._base_pixmaps or worker_key in self._prefetch_workers:
+                continue
+            worker = PageRenderWorker(self.pdf_handler, self.current_pdf_path, page, dpr,
+                                      self._page_cache_generation, key)
+            worker.signals.rendered.connect(self._on_page_prefetched)
+            self._prefetch_workers[worker_key] = worker
+            self._render_pool.start(worker)
+
+    def _on_page_prefetched(self, generation: int, key: tuple, image, error):
+        """先読みしたページの描画完了時の処理
+
+        Args:
+            generation (int): 先読みを依頼した時点のキャッシュの世代
+            key (tuple): 描画結果のキャッシュキー（パス, ページ, デバイスピクセル比）
+            image (Optional[QImage]): 描画結果。失敗した場合はNone
+            error (Optional[str]): 失敗した場合のエラーメッセージ
+        """
+        self._prefetch_workers.pop((generation, key), None)
+        if error is not None:
+            self.logger.debug("先読み失敗 %s: %s (ページ %d)", error, os.path.basename(key[0]), key[1] + 1)
+        if generation != self._page_cache_generation or image is None or image.isNull():
+            return
+
+        pixmap = QPixmap.fromImage(image, Qt.NoFormatConversion)
+        pixmap.setDevicePixelRatio(key[2])
+        self._base_pixmaps[key] = pixmap
+        while len(self._base_pixmaps) > MAX_CACHED_BASE_PAGES:
+            self._base_pixmaps.popitem(last=False)
+        # 先読み中にそのページへ移動していた場合は、ここで表示する
+        if key == (self.current_pdf_path, self.current_page, self.devicePixelRatioF()):
+            self._do_update_page_display()
+
+    def _get_page_text(self) -> str:
+        """現在のページのテキストを取得（取得済みの場合はキャッシュを返す）
+
+        Returns:
+            str: ページのテキスト
+        """
+        key = (self.current_pdf_path, self.current_page)
+        text = self._page_texts.get(key)
+        if text is not None:
+            self._page_texts.move_to_end(key)
+            return text
+        # PyMuPDFハンドラーはページ全体を1回で抽出する（sort=Falseでレイアウト解析を省く）
+        text = self.pdf_handler.get_text(self.current_pdf_path, self.current_page)
+        self._page_texts[key] = text
+        while len(self._page_texts) > MAX_CACHED_PAGE_TEXTS:
+            self._page_texts.popitem(last=False)
+        return text
+
+    def _clear_page_cache(self):
+        """表示済みページ画像・テキストのキャッシュを破棄"""
+        self._page_cache.clear()
+        self._page_texts.clear()
+        self._displayed_text_key = None
+        self._base_pixmaps.clear()
+        # 描画中・先読み中の結果も使わない
+        self.render_request_id += 1
+        self._pending_render_key = None
+        self._page_cache_generation += 1
+
+    def _stop_page_renders(self):
+        """未実行のページ描画・先読みを取り消し、実行中の描画の終了を待つ
+
+        Note:
+            ファイルの移動前に呼び出し、ワーカーがPDFを開き直さないようにする。
+            取り消したワーカーは結果を通知しないため、保持していた参照もここで破棄する
+        """
+        self._clear_page_cache()
+        self._render_pool.clear()
+        self._render_pool.waitForDone()
+        self._render_workers.clear()
+        self._prefetch_workers.clear()
+
     def update_text_items_list(self):
-        """抽出されたテキスト項目をリストに表示"""
-        self.text_items_list.clear()
-        for item in self.extracted_text_items:
-            self.text_items_list.addItem(item)
+        """抽出されたテキスト項目をリストに表示
+
+        Note:
+            表示中の項目と比較し、増減した行だけを追加・削除する。
+            似たページを続けて表示した場合に、共通する項目を作り直さずに済む
+        """
+        list_widget = self.text_items_list
+        new_texts = [str(item) for item in self.extracted_text_items]
+        old_texts = [list_widget.item(i).text() for i in range(list_widget.count())]
+        if old_texts == new_texts:
+            return
+
+        # 1件ずつ追加せず、まとめて追加して再レイアウト・再描画を1回にする
+        list_widget.setUpdatesEnabled(False)
+        try:
+            new_set = set(new_texts)
+            self._text_items_set = new_set
+            if new_set.isdisjoint(old_texts):
+                # 共通する項目がない場合は、まとめて作り直す方が速い
+                list_widget.clear()
+                list_widget.addItems(new_texts)
+                return
+
+            # 不要になった行を後ろから削除し、残った行の間に不足分を挿入する
+            for row in range(len(old_texts) - 1, -1, -1):
+                if old_texts[row] not in new_set:
+                    list_widget.takeItem(row)
+            for row, text in enumerate(new_texts):
+                current = list_widget.item(row)
+                if current is None or current.text() != text:
+                    list_widget.insertItem(row, text)
+            # 並び順の違いで余った行を削除
+            while list_widget.count() > len(new_texts):
+                list_widget.takeItem(list_widget.count() - 1)
+        finally:
+            list_widget.setUpdatesEnabled(True)
 
     def _add_page_text_items(self):
         """現在のページからテキストを抽出し、リストに累積追加する（重複はスキップ）"""
         if not self.current_pdf_path:
             return
-        text = self.pdf_handler.get_text(self.current_pdf_path, self.current_page)
-        new_items = self.extract_text_items(text)
-        existing_texts = set(
-            self.text_items_list.item(i).text()
-            for i in range(self.text_items_list.count())
-        )
+        key = (self.current_pdf_path, self.current_page)
+        new_items = self._text_items_cache.get(key)
+        if new_items is None:
+            text = self._get_page_text()
+            new_items = self.extract_text_items(text)
+            self._text_items_cache[key] = new_items
+        existing_texts = self._text_items_set
+        added_items = []
         for item_text in new_items:
             if item_text not in existing_texts:
-                self.text_items_list.addItem(item_text)
+                added_items.append(item_text)
                 existing_texts.add(item_text)
+        # 1件ずつ追加せず、まとめて追加して再レイアウト・再描画を1回にする
+        if added_items:
+            self.text_items_list.addItems(added_items)
 
     def clear_text_items_list(self):
         """抽出テキスト一覧をクリアし、現在のページから再抽出する"""
         self.text_items_list.clear()
+        self._text_items_set.clear()
         self._add_page_text_items()
         self.logger.info("抽出テキスト一覧をリセットしました")
 
-    def _normalize_filename(self, filename: str) -> str:
+    def _normalize_filename(self, filename: str) -> Tuple[str, List[str]]:
         """ファイル名を正規化し、Windows/macで使用できない文字を全角に変換
 
         Args:
             filename (str): 元のファイル名
 
         Returns:
-            str: 正規化されたファイル名
+            Tuple[str, List[str]]: (正規化されたファイル名, 変換した文字の一覧)。
+                一覧は「半角 → 全角」形式の文字列で、変換表の順に並ぶ
 
         Note:
             以下の文字を全角に変換:
@@ -1284,22 +1835,15 @@ class PDFViewerApp(QMainWindow):
             - >(大なり) → ＞
             - |(パイプ) → ｜
         """
-        # Windows/macで使用できない文字を全角に変換
-        char_map = {
-            '\\': '＼',
-            '/': '／',
-            ':': '：',
-            '*': '＊',
-            '?': '？',
-            '"': '"',
-            '<': '＜',
-            '>': '＞',
-            '|': '｜'
-        }
-
+        # Windows/macで使用できない文字を全角に変換（含まれていない場合は変換しない）
         normalized = filename
-        for half_char, full_char in char_map.items():
-            normalized = normalized.replace(half_char, full_char)
+        replaced_chars = []
+        found_chars = set(_FILENAME_ILLEGAL_RE.findall(filename))
+        if found_chars:
+            normalized = filename.translate(_FILENAME_TRANSLATE)
+            replaced_chars = [f"{half_char} → {full_char}"
+                              for half_char, full_char in _FILENAME_CHAR_MAP.items()
+                              if half_char in found_chars]
 
         # 先頭と末尾の空白を削除
         normalized = normalized.strip()
@@ -1307,7 +1851,7 @@ class PDFViewerApp(QMainWindow):
         # 先頭と末尾のピリオド（.）を削除（Windowsで問題になる）
         normalized = normalized.strip('.')
 
-        return normalized
+        return normalized, replaced_chars
 
     def reset_filename(self):
         """新しいファイル名を変更前のファイル名に戻す
@@ -1339,8 +1883,10 @@ class PDFViewerApp(QMainWindow):
             QMessageBox.warning(self, "エラー", "PDFファイルが開かれていません")
             return
 
-        # PDFファイルの存在確認
-        if not os.path.exists(self.current_pdf_path):
+        # PDFファイルの存在確認（取得したタイムスタンプは複製時の復元にも使う）
+        try:
+            stat_info = os.stat(self.current_pdf_path)
+        except OSError:
             QMessageBox.warning(
                 self,
                 "エラー",
@@ -1376,7 +1922,7 @@ class PDFViewerApp(QMainWindow):
             new_name_base = new_name
 
         # ファイル名を正規化（不適切な文字を全角に変換）
-        normalized_name_base = self._normalize_filename(new_name_base)
+        normalized_name_base, replaced_chars = self._normalize_filename(new_name_base)
 
         # 正規化後のファイル名が空でないかチェック
         if not normalized_name_base:
@@ -1385,14 +1931,7 @@ class PDFViewerApp(QMainWindow):
 
         # 正規化前後で変更があった場合は通知
         if normalized_name_base != new_name_base:
-            replaced_chars = []
-            for half_char, full_char in {
-                '\\': '＼', '/': '／', ':': '：', '*': '＊',
-                '?': '？', '"': '"', '<': '＜', '>': '＞', '|': '｜'
-            }.items():
-                if half_char in new_name_base:
-                    replaced_chars.append(f"{half_char} → {full_char}")
-
+            # 変換した文字は正規化時に集めたものを表示する
             message = f"ファイル名に使用できない文字が含まれていたため、以下のように変換されました:\n\n"
             if replaced_chars:
                 message += "\n".join(replaced_chars) + "\n\n"
@@ -1427,14 +1966,18 @@ class PDFViewerApp(QMainWindow):
             original_folder = os.path.join(self.current_folder, 'original')
             renamed_folder = os.path.join(self.current_folder, constants.RENAMED_FOLDER_NAME)
 
-            # フォルダが存在しない場合は作成
-            if not os.path.exists(original_folder):
+            # フォルダが存在しない場合は作成（存在確認と作成を1回のシステムコールで行う）
+            try:
                 os.makedirs(original_folder)
                 self.logger.info(f"originalフォルダを作成しました: {original_folder}")
+            except FileExistsError:
+                pass
 
-            if not os.path.exists(renamed_folder):
+            try:
                 os.makedirs(renamed_folder)
                 self.logger.info(f"renamedフォルダを作成しました: {renamed_folder}")
+            except FileExistsError:
+                pass
 
             # 2. 新しいファイルパスを作成（同名ファイルがあれば連番を付与）
             new_file_path = os.path.join(renamed_folder, new_name)
@@ -1452,37 +1995,39 @@ class PDFViewerApp(QMainWindow):
                         break
                     seq += 1
 
-            # 3. 元のファイル名を取得
-            original_filename = os.path.basename(self.current_pdf_path)
+            # 3. 元のファイルの移動先を作成
             original_file_new_path = os.path.join(original_folder, original_filename)
 
             # originalフォルダ内に同名ファイルが既に存在する場合
             if os.path.exists(original_file_new_path):
                 # タイムスタンプ付きのファイル名を生成
-                from datetime import datetime
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 name_without_ext = original_filename[:-4] if original_filename.lower().endswith('.pdf') else original_filename
                 original_file_new_path = os.path.join(original_folder, f"{name_without_ext}_{timestamp}.pdf")
                 self.logger.info(f"同名ファイルが存在するため、タイムスタンプを追加: {os.path.basename(original_file_new_path)}")
 
-            # 4. 元のファイルのタイムスタンプを取得
-            stat_info = os.stat(self.current_pdf_path)
+            # 4. 元のファイルのタイムスタンプを取得（存在確認時のstat結果を使う）
             original_atime = stat_info.st_atime  # アクセス時刻
             original_mtime = stat_info.st_mtime  # 変更時刻
 
             # 5. リネームしたファイルをrenamedフォルダに複製
-            import shutil
-            shutil.copy2(self.current_pdf_path, new_file_path)
+            # 同一ファイルシステム上ではコピーオンライト複製となり、データの読み書きが発生しない
+            # （7.の移動はos.renameで済むため、バイト単位のコピーはこの1回のみ）
+            copy_file(self.current_pdf_path, new_file_path)
 
-            # タイムスタンプを復元（copy2で保持されるが念のため）
+            # タイムスタンプを復元（copystatで保持されるが念のため）
             os.utime(new_file_path, (original_atime, original_mtime))
 
             self.logger.info(f"ファイルをリネームしてrenamedフォルダに複製: {original_filename} -> renamed/{new_name}")
 
             # 6. 開いているPDFをクローズ（ファイルハンドルを解放）
+            # 描画ワーカーがクローズ後に開き直さないよう、先に描画を止める
+            self._stop_page_renders()
             if self.pdf_handler:
                 self.pdf_handler.close()
                 self.logger.info(f"PDFをクローズしました: {original_filename}")
+            # 範囲選択の分析で開いたドキュメントも閉じる
+            self.selection_analyzer.release_document(self.current_pdf_path)
 
             # 7. 元のファイルをoriginalフォルダに移動
             shutil.move(self.current_pdf_path, original_file_new_path)
@@ -1511,6 +2056,8 @@ class PDFViewerApp(QMainWindow):
             self.preview_label.setText("PDFファイルを選択してください")
 
             # 8. PDF一覧を再取得（最初のPDFが自動的に開かれる）
+            # 更新時刻の精度が粗いファイルシステムでも移動前の一覧を使わないよう、キャッシュを破棄する
+            invalidate_pdf_files_cache(self.current_folder)
             self.load_pdf_files(self.current_folder)
 
         except PermissionError as e:
@@ -1841,9 +2388,7 @@ class PDFViewerApp(QMainWindow):
             return
         
         # 既に分析中の場合は新しい分析をキャンセル
-        if self.analysis_in_progress and self.analysis_worker:
-            self.analysis_worker.terminate()
-            self.analysis_worker.wait()
+        self._cancel_analysis()
         
         try:
             # 既存のバブルを削除
@@ -1865,9 +2410,11 @@ class PDFViewerApp(QMainWindow):
             quick_mode = not self.debug_mode  # デバッグモードでは詳細分析、通常は高速モード
             
             # デバッグモードの状態を常にログ出力
-            self.logger.info(f"🔧 分析モード: {'デバッグ' if self.debug_mode else '通常'} (quick_mode={quick_mode})")
+            log_info = self.logger.isEnabledFor(logging.INFO)
+            if log_info:
+                self.logger.info(f"🔧 分析モード: {'デバッグ' if self.debug_mode else '通常'} (quick_mode={quick_mode})")
             
-            if self.debug_mode:
+            if self.debug_mode and log_info:
                 self.logger.info(f"選択範囲分析開始 - Qt座標: x={selection_rect.x()}, y={selection_rect.y()}, w={selection_rect.width()}, h={selection_rect.height()}")
                 self.logger.info(f"ズーム倍率: {self.zoom_scale:.3f}")
                 self.logger.info(f"プレビューサイズ: {preview_size}")
@@ -1878,15 +2425,32 @@ class PDFViewerApp(QMainWindow):
                 'preview_size': preview_size,
                 'ocr_language': self.get_ocr_language()
             }
-            self.analysis_worker = AnalysisWorker(self.selection_analyzer, selection_data, analysis_params, quick_mode)
-            self.analysis_worker.analysis_finished.connect(self.on_analysis_finished)
-            self.analysis_worker.analysis_error.connect(self.on_analysis_error)
-            self.analysis_worker.finished.connect(self.on_worker_finished)
+            self.analysis_request_id += 1
+
+            # 同じ条件で分析済みの場合は、キャッシュした結果をそのまま表示する
+            cache_key = (self.current_pdf_path, self.current_page,
+                         (selection_rect.x(), selection_rect.y(), selection_rect.width(), selection_rect.height()),
+                         round(self.zoom_scale, 2), preview_size, analysis_params['ocr_language'], quick_mode)
+            cached_results = self._analysis_cache.get(cache_key)
+            if cached_results is not None:
+                self._analysis_cache.move_to_end(cache_key)
+                self.logger.info("キャッシュした分析結果を使用します")
+                self.on_analysis_finished(self.analysis_request_id, cached_results)
+                return
+
+            self.analysis_worker = AnalysisWorker(self.selection_analyzer, selection_data, analysis_params, quick_mode,
+                                                  self.analysis_request_id)
+            self.analysis_worker.cache_key = cache_key
+            self.analysis_worker.signals.analysis_finished.connect(self.on_analysis_finished)
+            self.analysis_worker.signals.analysis_error.connect(self.on_analysis_error)
+            self.analysis_worker.signals.finished.connect(self.on_worker_finished)
             
             self.analysis_in_progress = True
-            self.analysis_worker.start()
+            self._running_workers[self.analysis_request_id] = self.analysis_worker
+            self._analysis_pool.start(self.analysis_worker)
             
-            self.logger.info(f"範囲選択分析を開始: {selection_rect.x()},{selection_rect.y()},{selection_rect.width()},{selection_rect.height()}")
+            if log_info:
+                self.logger.info(f"範囲選択分析を開始: {selection_rect.x()},{selection_rect.y()},{selection_rect.width()},{selection_rect.height()}")
             
         except Exception as e:
             error_msg = f"範囲選択分析開始エラー: {str(e)}"
@@ -1896,18 +2460,42 @@ class PDFViewerApp(QMainWindow):
     def on_selection_cleared(self):
         """選択範囲がクリアされた時の処理"""
         # 分析中の処理をキャンセル
-        if self.analysis_in_progress and self.analysis_worker:
-            self.analysis_worker.terminate()
-            self.analysis_worker.wait()
-            self.analysis_in_progress = False
+        self._cancel_analysis()
         
         # バブルを削除
         self._clear_bubbles()
         
         self.logger.info("選択範囲がクリアされました")
     
-    def on_analysis_finished(self, analysis_results):
+    def _cancel_analysis(self):
+        """実行中の分析をキャンセル
+
+        Note:
+            スレッドプールで実行中の分析は強制終了できない（強制終了はロックを
+            保持したままのスレッドを止める恐れもある）ため、依頼番号を進めて
+            実行中の分析の結果を破棄する。まだ開始していない分析はキューから取り除く
+        """
+        if self.analysis_in_progress and self.analysis_worker:
+            if self._analysis_pool.tryTake(self.analysis_worker):
+                # 取り除いたワーカーは終了を通知しないため、ここで参照を破棄する
+                self._running_workers.pop(self.analysis_request_id, None)
+            self.analysis_request_id += 1
+            self.analysis_worker = None
+            self.analysis_in_progress = False
+
+    def on_analysis_finished(self, request_id, analysis_results):
         """分析完了時の処理"""
+        # キャンセル済みの古い分析の結果は使わない
+        if request_id != self.analysis_request_id:
+            return
+
+        # 分析結果をキャッシュ（上限を超えた場合は古いものから破棄）
+        worker = self._running_workers.get(request_id)
+        if worker is not None and worker.cache_key is not None and analysis_results:
+            self._analysis_cache[worker.cache_key] = analysis_results
+            while len(self._analysis_cache) > MAX_CACHED_ANALYSES:
+                self._analysis_cache.popitem(last=False)
+
         try:
             if analysis_results:
                 # 詳細分析情報を取得
@@ -1937,17 +2525,39 @@ class PDFViewerApp(QMainWindow):
             error_msg = f"分析結果処理エラー: {str(e)}"
             self.logger.error(error_msg, exc_info=True)
     
-    def on_analysis_error(self, error_msg):
+    def on_analysis_error(self, request_id, error_msg):
         """分析エラー時の処理"""
+        # キャンセル済みの古い分析のエラーは表示しない
+        if request_id != self.analysis_request_id:
+            return
         self._clear_bubbles()
         self.logger.error(f"範囲選択分析エラー: {error_msg}")
         QMessageBox.warning(self, "分析エラー", f"範囲選択の分析中にエラーが発生しました:\n{error_msg}")
     
-    def on_worker_finished(self):
+    def on_worker_finished(self, request_id):
         """ワーカー終了時の処理"""
+        self._running_workers.pop(request_id, None)
+        if request_id != self.analysis_request_id:
+            return
         self.analysis_in_progress = False
         self.analysis_worker = None
     
+    def _bubble_global_pos(self, selection_rect: QRect) -> QPoint:
+        """バブルの表示位置（選択範囲の右上、画面座標）を計算
+
+        Args:
+            selection_rect (QRect): 選択範囲の矩形（プレビューラベルの座標）
+
+        Returns:
+            QPoint: バブルの表示位置
+
+        Note:
+            呼び出しは選択の確定時・分析完了時の1回ずつで、ドラッグ中には呼ばれない。
+            ウィンドウの移動はプレビューラベルのmoveEventに通知されず、
+            画面座標をキャッシュすると古い位置に表示され得るため、毎回計算する
+        """
+        return self.preview_label.mapToGlobal(QPoint(selection_rect.right() + 10, selection_rect.top()))
+
     def _show_processing_indicator(self, selection_rect: QRect):
         """処理中インジケーターを表示"""
         self.last_selection_rect = selection_rect  # 後で使用するために保存
@@ -1955,13 +2565,9 @@ class PDFViewerApp(QMainWindow):
         # 簡単な処理中メッセージを表示
         processing_text = "🔄 分析中...\n選択範囲を解析しています。\nしばらくお待ちください。"
         
-        # バブルの位置を計算
-        global_pos = self.preview_label.mapToGlobal(
-            QPoint(selection_rect.right() + 10, selection_rect.top())
-        )
-        
         # 処理中バブルを作成して表示
-        processing_bubble = AnalysisResultBubble(processing_text, global_pos, False, None, self)
+        processing_bubble = AnalysisResultBubble(processing_text, self._bubble_global_pos(selection_rect),
+                                                 False, None, self)
         processing_bubble.show()
         self.current_bubbles.append(processing_bubble)
     
@@ -1969,18 +2575,12 @@ class PDFViewerApp(QMainWindow):
         """デバッグモードの切り替え"""
         # stateが2の場合はチェック状態、0の場合はアンチェック状態
         self.debug_mode = state == 2
-        self.logger.info(f"🔧 デバッグモード切り替え: {'有効' if self.debug_mode else '無効'} (state={state})")
+        self.logger.info("🔧 デバッグモード切り替え: %s (state=%s)", '有効' if self.debug_mode else '無効', state)
     
     def get_ocr_language(self) -> str:
         """選択されたOCR言語を取得"""
         index = self.language_combo.currentIndex()
-        language_map = {
-            0: 'jpn+eng',  # 日本語優先
-            1: 'eng',      # 英語のみ
-            2: 'jpn',      # 日本語のみ
-            3: 'auto'      # 自動検出
-        }
-        return language_map.get(index, 'jpn+eng')
+        return _OCR_LANGS[index] if 0 <= index < len(_OCR_LANGS) else _OCR_LANGS[0]
     
     def _create_bubble_text(self, analysis: dict) -> str:
         """分析結果からバブル表示用のテキストを作成"""
@@ -1991,116 +2591,101 @@ class PDFViewerApp(QMainWindow):
     
     def _create_normal_bubble_text(self, analysis: dict) -> str:
         """通常モード用のシンプルなバブルテキスト"""
-        text_parts = []
-        
         # 抽出されたテキストのみを表示
         combined_text = analysis['combined_text']
         if combined_text and combined_text.strip():
             # 診断情報は除外し、実際の抽出テキストのみ表示
             if "【診断情報】" not in combined_text:
-                text_parts.append("📄 抽出されたテキスト:")
-                text_parts.append("")
-                text_parts.append(combined_text)
+                text = f"📄 抽出されたテキスト:\n\n{combined_text}"
             else:
-                text_parts.append("❌ テキストを抽出できませんでした")
-                text_parts.append("")
-                text_parts.append("💡 デバッグモードで詳細を確認できます")
+                text = _BUBBLE_EXTRACT_FAILED
         else:
-            text_parts.append("❌ テキストが検出されませんでした")
-            text_parts.append("")
-            text_parts.append("💡 以下をお試しください:")
-            text_parts.append("  • 画像全体を選択する")
-            text_parts.append("  • より大きな範囲を選択する")
-            text_parts.append("  • デバッグモードで詳細確認")
-        
+            text = _BUBBLE_NO_TEXT
+
         # 基本統計（簡略版）
         if analysis['total_elements'] > 0:
-            text_parts.append("")
-            text_parts.append(f"📊 要素: {analysis['text_elements']}テキスト + {analysis['image_elements']}画像")
+            text += f"\n\n📊 要素: {analysis['text_elements']}テキスト + {analysis['image_elements']}画像"
             if analysis['average_confidence'] > 0:
-                text_parts.append(f"🎯 信頼度: {analysis['average_confidence']:.0%}")
-        
-        return "\n".join(text_parts)
+                text += f"\n🎯 信頼度: {analysis['average_confidence']:.0%}"
+
+        return text
     
     def _create_debug_bubble_text(self, analysis: dict) -> str:
         """デバッグモード用の詳細なバブルテキスト"""
-        text_parts = []
-        
-        # ヘッダー
-        text_parts.append("🔧 詳細診断情報 (v6)")
-        text_parts.append("=" * 40)
-        
-        # 統計情報
-        text_parts.append("📊 統計情報:")
-        text_parts.append(f"  • 総要素数: {analysis['total_elements']}")
-        text_parts.append(f"  • テキスト要素: {analysis['text_elements']}個")
-        text_parts.append(f"  • 画像要素: {analysis['image_elements']}個")
-        
         # エラー要素があれば表示
+        error_line = ""
         if analysis.get('error_elements', 0) > 0:
-            text_parts.append(f"  • エラー/診断要素: {analysis['error_elements']}個")
-        
-        text_parts.append(f"  • 平均信頼度: {analysis['average_confidence']:.1%}")
-        text_parts.append("")
-        
+            error_line = f"  • エラー/診断要素: {analysis['error_elements']}個\n"
+
         # 抽出されたテキスト
         combined_text = analysis['combined_text']
-        text_parts.append("📄 抽出結果:")
         if combined_text and combined_text.strip():
             # 診断情報と実際のテキストを分けて表示
             if "【診断情報】" in combined_text:
-                text_parts.append("  ℹ️ 診断モード - 詳細情報のみ")
-                text_parts.append(combined_text)
+                result_text = f"  ℹ️ 診断モード - 詳細情報のみ\n{combined_text}"
             else:
-                text_parts.append("  ✅ 選択範囲からテキストを抽出:")
-                text_parts.append(f"  '{combined_text}'")
+                result_text = f"  ✅ 選択範囲からテキストを抽出:\n  '{combined_text}'"
         else:
-            text_parts.append("  ❌ テキストが検出されませんでした")
-        
-        text_parts.append("")
-        
-        # 詳細情報
-        if analysis.get('details'):
-            text_parts.append("🔍 要素詳細:")
-            for i, detail in enumerate(analysis['details'][:5]):  # 最初の5つまで表示
-                element_type = detail['type']
-                detail_text = detail['text']
-                
-                # 処理方法の情報を抽出
-                processing_method = "不明"
-                if "直接レンダリング" in detail_text:
-                    processing_method = "直接レンダリング"
-                elif "cropped_from_existing" in detail_text:
-                    processing_method = "既存画像切り抜き"
-                elif "診断情報" in detail_text:
-                    processing_method = "診断情報"
-                elif element_type == "text":
-                    processing_method = "PDFテキスト抽出"
-                
-                element_info = f"  {i+1}. [{element_type}] 方法: {processing_method}"
-                text_parts.append(element_info)
-                
-                # テキスト内容（長すぎる場合は省略）
-                display_text = detail_text[:60] if detail_text else ""
-                if len(detail_text) > 60:
-                    display_text += "..."
-                text_parts.append(f"     内容: {display_text}")
-                
-                # 信頼度と座標
-                text_parts.append(f"     信頼度: {detail['confidence']:.1%}")
-                bbox = detail['bbox']
-                text_parts.append(f"     座標: ({bbox[0]:.1f}, {bbox[1]:.1f}, {bbox[2]:.1f}, {bbox[3]:.1f})")
-                
-                text_parts.append("")
-        
-        # v6の改善点説明
-        text_parts.append("🆕 v6改善点:")
-        text_parts.append("  • 選択範囲の直接レンダリング実装")
-        text_parts.append("  • 既存画像の正確な切り抜き")
-        text_parts.append("  • ページ全体フォールバック廃止")
-        text_parts.append("  • 座標変換精度向上")
-        
-        return "\n".join(text_parts)
+            result_text = "  ❌ テキストが検出されませんでした"
+
+        # 詳細情報（最初の5つまで表示）
+        details_text = ""
+        details = analysis.get('details')
+        if details:
+            details_text = "🔍 要素詳細:\n" + "".join(
+                self._format_bubble_detail(i, detail) for i, detail in enumerate(details[:5])
+            )
+
+        return (
+            # ヘッダー
+            f"🔧 詳細診断情報 (v6)\n{'=' * 40}\n"
+            # 統計情報
+            f"📊 統計情報:\n"
+            f"  • 総要素数: {analysis['total_elements']}\n"
+            f"  • テキスト要素: {analysis['text_elements']}個\n"
+            f"  • 画像要素: {analysis['image_elements']}個\n"
+            f"{error_line}"
+            f"  • 平均信頼度: {analysis['average_confidence']:.1%}\n"
+            f"\n"
+            f"📄 抽出結果:\n{result_text}\n"
+            f"\n"
+            f"{details_text}"
+            f"{_BUBBLE_V6_NOTES}"
+        )
+
+    @staticmethod
+    def _format_bubble_detail(i: int, detail: dict) -> str:
+        """デバッグモードのバブルに表示する要素1つ分の詳細を作成
+
+        Args:
+            i (int): 要素の番号（0始まり）
+            detail (dict): 要素の詳細（type, text, confidence, bbox）
+
+        Returns:
+            str: 要素の詳細（末尾に空行を含む）
+        """
+        element_type, detail_text, confidence, bbox = (
+            detail['type'], detail['text'], detail['confidence'], detail['bbox'])
+
+        # 処理方法の情報を抽出
+        processing_method = next(
+            (name for keyword, name in _PROCESSING_METHODS if keyword in detail_text),
+            "PDFテキスト抽出" if element_type == "text" else "不明"
+        )
+
+        # テキスト内容（長すぎる場合は省略）
+        display_text = detail_text[:60] if detail_text else ""
+        if len(detail_text) > 60:
+            display_text += "..."
+
+        # 信頼度と座標
+        return (
+            f"  {i+1}. [{element_type}] 方法: {processing_method}\n"
+            f"     内容: {display_text}\n"
+            f"     信頼度: {confidence:.1%}\n"
+            f"     座標: ({bbox[0]:.1f}, {bbox[1]:.1f}, {bbox[2]:.1f}, {bbox[3]:.1f})\n"
+            f"\n"
+        )
     
     def _show_analysis_bubble(self, text: str, selection_rect: QRect, extracted_text: str = None):
         """分析結果のバブルを表示
@@ -2113,13 +2698,9 @@ class PDFViewerApp(QMainWindow):
         # 既存のバブルを削除
         self._clear_bubbles()
 
-        # バブルの位置を計算（選択範囲の右上に表示）
-        global_pos = self.preview_label.mapToGlobal(
-            QPoint(selection_rect.right() + 10, selection_rect.top())
-        )
-
         # 新しいバブルを作成して表示
-        bubble = AnalysisResultBubble(text, global_pos, self.debug_mode, extracted_text, self)
+        bubble = AnalysisResultBubble(text, self._bubble_global_pos(selection_rect), self.debug_mode,
+                                      extracted_text, self)
         bubble.show()
         self.current_bubbles.append(bubble)
     
@@ -2137,31 +2718,26 @@ class PDFViewerApp(QMainWindow):
             text (str): 抽出されたテキスト
 
         Note:
-            テキストを行ごとに分割し、空でない行のみをリストに追加。
+            テキストを行ごとに分割し、空でない行のみをリストにまとめて追加。
             既に存在するテキストは重複して追加しない。
         """
         if not text or not text.strip():
             return
 
-        # テキストを行に分割
-        lines = text.split('\n')
-
-        # 各行を処理してリストに追加
-        for line in lines:
+        # テキストを行に分割し、空でない行のうち一覧にないものを集める
+        # （既に同じテキストがあるかは、一覧を走査せず集合で確認する。同じテキスト内の重複も除く）
+        existing_texts = self._text_items_set
+        new_lines = []
+        for line in text.split('\n'):
             line = line.strip()
-            if line:  # 空でない行のみ
-                # 既に同じテキストがリストにあるかチェック
-                exists = False
-                for i in range(self.text_items_list.count()):
-                    if self.text_items_list.item(i).text() == line:
-                        exists = True
-                        break
+            if line and line not in existing_texts:
+                existing_texts.add(line)
+                new_lines.append(line)
 
-                # 重複していなければ追加
-                if not exists:
-                    item = QListWidgetItem(line)
-                    self.text_items_list.addItem(item)
-                    self.logger.info(f"抽出テキストをリストに追加: {line[:50]}...")
+        # 1件ずつ追加せず、まとめて追加して再レイアウト・再描画を1回にする
+        if new_lines:
+            self.text_items_list.addItems(new_lines)
+            self.logger.info("抽出テキストをリストに追加: %d件", len(new_lines))
 
     def open_pdf(self, item):
         """ PDFファイルを開いてプレビューとテキストを表示 """
@@ -2169,29 +2745,23 @@ class PDFViewerApp(QMainWindow):
             return
 
         try:
-            self.current_pdf_path = os.path.join(self.current_folder, item.text())
-            self.logger.info(f"PDFファイルを開きます: {item.text()}")
-
-            # エラーハンドリングは pdf_handler.load_pdf 内で実行される
-            if self.pdf_handler.load_pdf(self.current_pdf_path, parent_widget=self):
-                self.current_page = 0
-                self.total_pages = self.pdf_handler.get_page_count()
-
-                # ズームと表示位置をリセット
-                self.reset_zoom()
-                self._add_page_text_items()
-
-                # 新しいファイル名フィールドは空のまま（ユーザーが入力）
-                self.rename_input.clear()
-                # 変更前ファイル名ラベルを更新
-                self.original_filename_value.setText(item.text())
-                self.logger.info(f"PDFファイルが正常に開かれました: {item.text()}")
-            else:
-                # load_pdfでエラーハンドリング済みなので、UIの状態をリセット
-                self.text_edit.setText("PDFファイルの読み込みに失敗しました")
-                self.current_pdf_path = None
-                self.current_page = 0
-                self.total_pages = 0
+            file_name = item.text()
+            pdf_path = os.path.join(self.current_folder, file_name)
+            self.logger.info("PDFファイルを開きます: %s", file_name)
+            # 同じパスでもファイルが変わっている可能性があるため、表示済みの画像・分析結果は使わない
+            self._clear_page_cache()
+            self._analysis_cache.clear()
+            self._text_items_cache.clear()
+
+            # 読み込みが終わるまでは、前のPDFに対する操作（描画・範囲選択・リネーム）を行わない
+            self.current_pdf_path = None
+
+            # 読み込みはワーカースレッドで行い、完了時に_on_pdf_loadedで表示を更新する
+            self.pdf_load_request_id += 1
+            worker = PdfLoadWorker(self.pdf_handler, pdf_path, self.pdf_load_request_id)
+            worker.signals.loaded.connect(self._on_pdf_loaded)
+            self._pdf_load_workers[self.pdf_load_request_id] = worker
+            QThreadPool.globalInstance().start(worker)
 
         except Exception as e:
             # 予期しないエラーの場合
@@ -2207,6 +2777,57 @@ class PDFViewerApp(QMainWindow):
             self.current_page = 0
             self.total_pages = 0
 
+    def _on_pdf_loaded(self, request_id: int, pdf_path: str, page_count: int, error):
+        """PDFの読み込み完了時の処理
+
+        Args:
+            request_id (int): 読み込みの依頼番号
+            pdf_path (str): PDFファイルのパス
+            page_count (int): 総ページ数（失敗時は0）
+            error: エラー内容。成功時はNone、読み込みの失敗時は (エラー種別, 追加情報)、
+                予期しない例外の場合は例外オブジェクト
+        """
+        self._pdf_load_workers.pop(request_id, None)
+        # 別のPDFを開く操作が後から行われた場合は、古い結果を使わない
+        if request_id != self.pdf_load_request_id:
+            return
+
+        file_name = os.path.basename(pdf_path)
+        if error is None:
+            self.current_pdf_path = pdf_path
+            self.current_page = 0
+            self.total_pages = page_count
+
+            # ズームと表示位置をリセット
+            self.reset_zoom()
+            self._add_page_text_items()
+
+            # 新しいファイル名フィールドは空のまま（ユーザーが入力）
+            self.rename_input.clear()
+            # 変更前ファイル名ラベルを更新
+            self.original_filename_value.setText(file_name)
+            self.logger.info("PDFファイルが正常に開かれました: %s", file_name)
+            return
+
+        if isinstance(error, Exception):
+            # 予期しないエラーの場合
+            self.error_handler.handle_error(
+                error,
+                ErrorType.UNKNOWN_ERROR,
+                parent=self,
+                additional_info=f"ファイル: {file_name}"
+            )
+            self.text_edit.setText("予期しないエラーが発生しました")
+        else:
+            # エラーはワーカースレッドでログ出力済みのため、ダイアログのみ表示する
+            error_type, additional_info = error
+            self.error_handler.show_error_dialog(error_type, self, additional_info)
+            self.text_edit.setText("PDFファイルの読み込みに失敗しました")
+        # UIの状態をリセット
+        self.current_pdf_path = None
+        self.current_page = 0
+        self.total_pages = 0
+
     def select_pdf_folder(self):
         """PDFフォルダ選択ダイアログを表示（OSネイティブUI使用）
 
@@ -2241,8 +2862,10 @@ class PDFViewerApp(QMainWindow):
             self.current_folder = folder_path
             # フォルダパスを永続化（次回起動時も復元される）
             self.settings.setValue("last_folder_path", folder_path)
+            # フォルダの選択し直しは最新の一覧を求める操作のため、キャッシュを使わない
+            invalidate_pdf_files_cache(folder_path)
             self.load_pdf_files(folder_path)
-            self.logger.info(f"PDFフォルダを選択: {folder_path}")
+            self.logger.info("PDFフォルダを選択: %s", folder_path)
 
     def open_renamed_folder(self):
         """リネーム後ファイルの保存先（renamedフォルダ）をOSのファイラーで開く
@@ -2274,13 +2897,12 @@ class PDFViewerApp(QMainWindow):
 
     def load_pdf_files(self, folder_path):
         # PDFファイルのみを抽出してリスト化
-        pdf_files = [f for f in os.listdir(folder_path)
-                     if f.lower().endswith('.pdf')]
+        # （os.scandirで走査し、フォルダの更新時刻が変わっていなければ前回の一覧を使う）
+        pdf_files = get_pdf_files(folder_path)
 
-        # リストウィジェットを更新
+        # リストウィジェットを更新（1件ずつ追加せず、まとめて追加する）
         self.pdf_list_widget.clear()
-        for pdf in pdf_files:
-            self.pdf_list_widget.addItem(pdf)
+        self.pdf_list_widget.addItems(pdf_files)
 
         # PDF一覧に項目がある場合、最初の項目を自動で開く
         if self.pdf_list_widget.count() > 0:
@@ -57,6 +57,40 @@ class ErrorType(Enum):
     OPERATION_CANCELLED = "operation_cancelled"
 
 
+# 例外メッセージからエラー種別を判定する規則（小文字化したメッセージと比較する）
+# (すべて含む必要がある語, いずれかを含む必要がある語, エラー種別) を上から順に調べ、最初に一致したものを使う
+_FILE_ERROR_RULES = (
+    ((), ("corrupt", "damaged"), ErrorType.FILE_CORRUPTED),
+)
+_PDF_ERROR_RULES = (
+    ((), ("password", "encrypted"), ErrorType.PDF_PASSWORD_PROTECTED),
+    ((), ("corrupt", "damaged", "invalid"), ErrorType.PDF_DAMAGED),
+)
+_OCR_ERROR_RULES = (
+    (("tesseract",), ("not found", "command not found"), ErrorType.OCR_TESSERACT_NOT_FOUND),
+    ((), ("language", "traineddata"), ErrorType.OCR_LANGUAGE_DATA_MISSING),
+    ((), ("memory", "image too large"), ErrorType.OCR_IMAGE_TOO_LARGE),
+)
+
+
+def _classify_by_rules(exception: Exception, rules: tuple, default: ErrorType) -> ErrorType:
+    """例外メッセージを判定規則と照合してエラー種別を返す
+
+    Args:
+        exception (Exception): 発生した例外
+        rules (tuple): 判定規則（_FILE_ERROR_RULES等）
+        default (ErrorType): どの規則にも一致しない場合のエラー種別
+
+    Returns:
+        ErrorType: 最初に一致した規則のエラー種別
+    """
+    error_str = str(exception).lower()
+    for all_of, any_of, error_type in rules:
+        if all(keyword in error_str for keyword in all_of) and any(keyword in error_str for keyword in any_of):
+            return error_type
+    return default
+
+
 class ErrorMessages:
     """ユーザーフレンドリーなエラーメッセージ"""
     
@@ -112,12 +146,37 @@ class ErrorMessages:
             "solution": "• アプリケーションを再起動してください\n• 問題が続く場合はログファイルを確認"
         }
     }
+
+    # ダイアログ本文の組み立て済みテキスト（エラー種別 -> (メッセージ, 解決方法の段落, 本文全体)）
+    # MESSAGESは変更されないため、表示のたびに連結せずクラス定義時に1回だけ作る
+    _DIALOG_TEXTS = {
+        error_type: (info["message"], f"\n\n解決方法:\n{info['solution']}",
+                     f"{info['message']}\n\n解決方法:\n{info['solution']}")
+        for error_type, info in MESSAGES.items()
+    }
     
     @classmethod
     def get_message(cls, error_type: ErrorType) -> Dict[str, str]:
         """エラータイプに対応するメッセージを取得"""
         return cls.MESSAGES.get(error_type, cls.MESSAGES[ErrorType.UNKNOWN_ERROR])
 
+    @classmethod
+    def get_dialog_text(cls, error_type: ErrorType, additional_info: Optional[str] = None) -> str:
+        """エラーダイアログの本文（メッセージ・詳細・解決方法）を取得
+
+        Args:
+            error_type (ErrorType): エラーの種別
+            additional_info (Optional[str]): 追加情報。指定した場合は「詳細」として差し込む
+
+        Returns:
+            str: ダイアログの本文
+        """
+        message, solution, full_text = cls._DIALOG_TEXTS.get(
+            error_type, cls._DIALOG_TEXTS[ErrorType.UNKNOWN_ERROR])
+        if additional_info:
+            return f"{message}\n\n詳細: {additional_info}{solution}"
+        return full_text
+
 
 class ErrorHandler:
     """エラーハンドリングのユーティリティクラス"""
@@ -149,6 +208,23 @@ class ErrorHandler:
         # ユーザーにダイアログ表示
         if show_dialog:
             self._show_error_dialog(error_type, parent, additional_info)
+
+    def show_error_dialog(self,
+                          error_type: ErrorType,
+                          parent: Optional[QWidget] = None,
+                          additional_info: Optional[str] = None) -> None:
+        """
+        ログ出力済みのエラーについて、ダイアログのみを表示
+
+        ワーカースレッドでhandle_error(show_dialog=False)により記録したエラーを、
+        UIスレッドで利用者に通知する場合に使う。
+
+        Args:
+            error_type: エラーの種別
+            parent: ダイアログの親ウィジェット
+            additional_info: 追加情報
+        """
+        self._show_error_dialog(error_type, parent, additional_info)
     
     def _show_error_dialog(self, 
                           error_type: ErrorType, 
@@ -157,11 +233,8 @@ class ErrorHandler:
         """エラーダイアログを表示"""
         message_info = ErrorMessages.get_message(error_type)
         
-        # メッセージテキストを構築
-        message_text = message_info["message"]
-        if additional_info:
-            message_text += f"\n\n詳細: {additional_info}"
-        message_text += f"\n\n解決方法:\n{message_info['solution']}"
+        # メッセージテキストを取得（追加情報がなければ組み立て済みのものを使う）
+        message_text = ErrorMessages.get_dialog_text(error_type, additional_info)
         
         # ダイアログを表示
         msg_box = QMessageBox(parent)
@@ -180,33 +253,14 @@ class ErrorHandler:
             return ErrorType.FILE_PERMISSION_DENIED
         elif isinstance(exception, IsADirectoryError):
             return ErrorType.FILE_UNSUPPORTED_FORMAT
-        elif "corrupt" in str(exception).lower() or "damaged" in str(exception).lower():
-            return ErrorType.FILE_CORRUPTED
-        else:
-            return ErrorType.UNKNOWN_ERROR
+        return _classify_by_rules(exception, _FILE_ERROR_RULES, ErrorType.UNKNOWN_ERROR)
     
     @staticmethod
     def classify_pdf_error(exception: Exception) -> ErrorType:
         """PDF関連エラーを分類"""
-        error_str = str(exception).lower()
-        
-        if "password" in error_str or "encrypted" in error_str:
-            return ErrorType.PDF_PASSWORD_PROTECTED
-        elif "corrupt" in error_str or "damaged" in error_str or "invalid" in error_str:
-            return ErrorType.PDF_DAMAGED
-        else:
-            return ErrorType.PDF_HANDLER_ERROR
+        return _classify_by_rules(exception, _PDF_ERROR_RULES, ErrorType.PDF_HANDLER_ERROR)
     
     @staticmethod
     def classify_ocr_error(exception: Exception) -> ErrorType:
         """OCR関連エラーを分類"""
-        error_str = str(exception).lower()
-        
-        if "tesseract" in error_str and ("not found" in error_str or "command not found" in error_str):
-            return ErrorType.OCR_TESSERACT_NOT_FOUND
-        elif "language" in error_str or "traineddata" in error_str:
-            return ErrorType.OCR_LANGUAGE_DATA_MISSING
-        elif "memory" in error_str or "image too large" in error_str:
-            return ErrorType.OCR_IMAGE_TOO_LARGE
-        else:
-            return ErrorType.OCR_PROCESSING_FAILED
\ No newline at end of file
+        return _classify_by_rules(exception, _OCR_ERROR_RULES, ErrorType.OCR_PROCESSING_FAILED)
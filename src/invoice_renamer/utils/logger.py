@@ -15,10 +15,14 @@ This program is distributed WITHOUT ANY WARRANTY; for more details see
 the LICENSE file in the distribution root.
 """
 
+import atexit
 import logging
 import os
+import queue
+import threading
 import time
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from invoice_renamer.logic.config_manager import ConfigManager
 from invoice_renamer.utils.constants import (
     PROJECT_NAME,
@@ -30,6 +34,25 @@ from invoice_renamer.utils.constants import (
 # 古いログの削除は起動ごとに1回で十分なため、実行済みフラグで多重実行を防ぐ
 _old_logs_cleaned = False
 
+# キューからファイル・コンソールへ書き出すリスナー（プロセスで1つ、全ロガーで共有）
+# 終了時に停止し、キューに残っているログを書き出してから終了する
+_queue_listeners = []
+
+# 全ロガーで共有する、キューへ積むハンドラーとロガーに設定するレベル
+# 最初のsetup_logger呼び出しで設定を読み込んで作成し、以降の呼び出しでは使い回す
+_shared_handler = None
+_shared_level = logging.NOTSET
+_shared_handler_lock = threading.Lock()
+
+
+def _stop_queue_listeners():
+    """すべてのログ出力リスナーを停止（キューに残っているログを書き出す）"""
+    while _queue_listeners:
+        _queue_listeners.pop().stop()
+
+
+atexit.register(_stop_queue_listeners)
+
 
 def _cleanup_old_logs(log_dir, retention_days=LOG_RETENTION_DAYS):
     """保持期限を過ぎたログファイルを削除する
@@ -65,44 +88,44 @@ def _cleanup_old_logs(log_dir, retention_days=LOG_RETENTION_DAYS):
         pass
 
 
-def setup_logger(module_name=None, log_dir="logs"):
-    """AP用のロガーセットアップ
+def _get_shared_handler(log_dir):
+    """全ロガーで共有するログ出力ハンドラーとレベルを取得（初回のみ作成）
 
     Args:
-        module_name (str, optional): モジュール名。指定がない場合はプロジェクト名を仕様
-        log_dir (str): ログファイル保存先ディレクトリ
+        log_dir (str): ログファイル保存先ディレクトリ（初回の呼び出しの値を使う）
+
     Returns:
-        logging.Logger: 設定済みのロガーインスタンス
+        Tuple[logging.Handler, int]: (キューへ積むハンドラー, ロガーに設定するレベル)
     """
-    # ConfigNamagerから設定を取得
-    config = ConfigManager()
-    console_log_level = getattr(logging, config.get_console_log_level().upper())
-    file_log_level = getattr(logging, config.get_file_log_level().upper())
+    global _shared_handler, _shared_level
+    if _shared_handler is not None:
+        return _shared_handler, _shared_level
 
-    # ログフォーマットを取得
-    console_log_format = config.get_console_log_format()
-    file_log_format = config.get_file_log_format()
+    with _shared_handler_lock:
+        if _shared_handler is not None:
+            return _shared_handler, _shared_level
 
-    # ログディレクトリが存在しない場合は作成
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+        # ConfigNamagerから設定を取得
+        config = ConfigManager()
+        console_log_level = getattr(logging, config.get_console_log_level().upper())
+        file_log_level = getattr(logging, config.get_file_log_level().upper())
 
-    # 保持期限を過ぎた古いログを削除（起動ごとに1回だけ実行される）
-    _cleanup_old_logs(log_dir)
+        # ログフォーマットを取得
+        console_log_format = config.get_console_log_format()
+        file_log_format = config.get_file_log_format()
 
-    # ロガー名の設定
-    logger_name = module_name if module_name else PROJECT_NAME
-    logger = logging.getLogger(logger_name)
-    logger.setLevel(min(console_log_level, file_log_level)) # 低い方のレベルを設定
+        # ログディレクトリが存在しない場合は作成
+        os.makedirs(log_dir, exist_ok=True)
+
+        # 保持期限を過ぎた古いログを削除（起動ごとに1回だけ実行される）
+        _cleanup_old_logs(log_dir)
 
-    # ハンドラーが存在しない場合に追加する
-    if not logger.handlers:
         # 現在時刻をファイル名に含める
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         log_file = os.path.join(log_dir, f'{PROJECT_NAME}_{timestamp}.log')
 
-        # ファイルハンドラ
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        # ファイルハンドラ（最初のログを書き出す時点でファイルを作成する）
+        file_handler = logging.FileHandler(log_file, encoding='utf-8', delay=True)
         file_handler.setLevel(file_log_level)
         file_handler.setFormatter(logging.Formatter(file_log_format))
 
@@ -111,10 +134,44 @@ def setup_logger(module_name=None, log_dir="logs"):
         console_handler.setLevel(console_log_level)
         console_handler.setFormatter(logging.Formatter(console_log_format))
 
-        # ハンドラの追加
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+        # ロガーにはキューへ積むだけのハンドラーを付け、ファイル・コンソールへの書き込みは
+        # リスナーのスレッドで行う（UIスレッド等のログ出力がディスクI/Oを待たないようにする）
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+        listener.start()
+        _queue_listeners.append(listener)
 
-    return logger
+        _shared_level = min(console_log_level, file_log_level)  # 低い方のレベルを設定
+        _shared_handler = QueueHandler(log_queue)
+        return _shared_handler, _shared_level
 
 
+def setup_logger(module_name=None, log_dir="logs"):
+    """AP用のロガーセットアップ
+
+    Args:
+        module_name (str, optional): モジュール名。指定がない場合はプロジェクト名を仕様
+        log_dir (str): ログファイル保存先ディレクトリ
+    Returns:
+        logging.Logger: 設定済みのロガーインスタンス
+
+    Note:
+        設定の読み込みとハンドラーの作成は最初の呼び出しで1回だけ行い、
+        すべてのロガーで同じハンドラー（同じログファイル）を共有する
+    """
+    handler, level = _get_shared_handler(log_dir)
+
+    # ロガー名の設定
+    logger_name = module_name if module_name else PROJECT_NAME
+    logger = logging.getLogger(logger_name)
+    logger.setLevel(level)
+
+    # ハンドラーが存在しない場合に追加する
+    if not logger.handlers:
+        logger.addHandler(handler)
+
+        # 自身のハンドラーで出力するため、親ロガーには伝播させない
+        # （親・ルートにハンドラーがある場合の二重出力と、親をたどる処理を省く）
+        logger.propagate = False
+
+    return logger
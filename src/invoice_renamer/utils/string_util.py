@@ -13,54 +13,82 @@ This program is distributed WITHOUT ANY WARRANTY; for more details see
 the LICENSE file in the distribution root.
 """
 import re
+from typing import List, Tuple
 from dateutil.parser import parse
-
-
-###抽出した文字列を組み合わせてファイル名を作成します。
-def generate_filename(extracted_texts):
-    result_file_name = ""
-
-    # 日付
-    result_file_name = result_file_name + "2024-"
-
-    # 取引先
-    partner_name = ""
-
-    # 金額
-    price = convert_date_text(12,000,000)
-
-    # 拡張子
-    ".pdf"
-
-    # テキストから日付や金額を抽出するロジック
-    # 例: 正規表現で日付や金額を特定
-
+from invoice_renamer.utils.constants import FILE_EXTENTION_NAME
+
+# 全角・半角の数字以外の文字（extract_numericで除去する）
+_NON_NUMERIC_RE = re.compile(r'[^\d０-９]')
+# 全角数字 → 半角数字の変換表
+_FW2HW_TABLE = str.maketrans('０１２３４５６７８９', '0123456789')
+
+# 対応するすべての日付形式を1つにまとめたパターン（convert_datesで1回の走査で検出・変換する）
+# 同じ位置で複数の形式に一致する場合は、先に書いた形式を優先する
+_DATE_ANY_RE = re.compile(
+    # 和暦 (例: 令和7年1月16日、令和 7年 1月16日、平成31年4月30日)
+    r'(?P<wareki>(?P<wareki_era>令和|平成|昭和|大正|明治)[\s\u3000]*(?P<wareki_y>\d{1,2})年'
+    r'[\s\u3000]*(?P<wareki_m>\d{1,2})月[\s\u3000]*(?P<wareki_d>\d{1,2})日?)'
+    # YYYY年MM月DD日 (例: 2023年12月25日、2025年 1月16日)
+    r'|(?P<ymd_jp>(?P<ymd_jp_y>\d{4})年[\s\u3000]*(?P<ymd_jp_m>\d{1,2})月[\s\u3000]*(?P<ymd_jp_d>\d{1,2})日?)'
+    # YYYY/MM/DD または YYYY.MM.DD (例: 2023/12/25, 2023.12.25)
+    r'|(?P<ymd_sep>(?P<ymd_sep_y>\d{4})[/.](?P<ymd_sep_m>\d{1,2})[/.](?P<ymd_sep_d>\d{1,2}))'
+    # YY/MM/DD または YY.MM.DD (例: 23/12/25, 23.12.25)。2000年代と仮定
+    r'|(?P<yy_sep>(?P<yy_sep_y>\d{2})[/.](?P<yy_sep_m>\d{1,2})[/.](?P<yy_sep_d>\d{1,2}))'
+    # YYYY-MM-DD (すでに正しい形式)
+    r'|(?P<iso>\d{4}-\d{2}-\d{2})'
+)
+# 元号ごとの開始年（西暦）
+_ERA_START_YEARS = {
+    '令和': 2019,  # 2019年5月1日～
+    '平成': 1989,  # 1989年1月8日～2019年4月30日
+    '昭和': 1926,  # 1926年12月25日～1989年1月7日
+    '大正': 1912,  # 1912年7月30日～1926年12月24日
+    '明治': 1868   # 1868年1月25日～1912年7月29日
+}
+
+
+def _date_match_to_iso(match) -> str:
+    """_DATE_ANY_REに一致した日付をYYYY-MM-DD形式の文字列に変換
+
+    Args:
+        match (re.Match): _DATE_ANY_REの一致結果
+
+    Returns:
+        str: YYYY-MM-DD形式の日付
+    """
+    kind = match.lastgroup
+    if kind == 'iso':
+        return match.group(0)
+
+    year = match.group(f'{kind}_y')
+    if kind == 'wareki':
+        # 和暦から西暦に変換
+        year = _ERA_START_YEARS.get(match.group('wareki_era'), 2019) + int(year) - 1
+    elif kind == 'yy_sep':
+        year = f"20{year}"
+    return f"{year}-{int(match.group(f'{kind}_m')):02d}-{int(match.group(f'{kind}_d')):02d}"
+
+
+###抽出した文字列（日付・取引先・金額）を組み合わせてファイル名を作成します。
+def generate_filename(date: str, partner: str, price: str, ext: str = FILE_EXTENTION_NAME) -> str:
+    # 連結を繰り返さず、1回で組み立てる（例: 2024-01-31-株式会社〇〇-12000.pdf）
+    return f"{date}-{partner}-{price}{ext}"
 
 
 ###テキストから数字のみを抽出
 def extract_numeric(amount):
     #全角または半角の数字のみ抽出
-    numeric_string = re.sub(r'[^\d０-９]', '', amount)
+    numeric_string = _NON_NUMERIC_RE.sub('', amount)
     #抽出結果をすべて半角数字に置換
-    numeric_string = normalize_numeric(numeric_string)
-    return numeric_string
+    return numeric_string.translate(_FW2HW_TABLE)
 
 ###全角数字を半角数字に置換
 def normalize_numeric(numeric):
-    fullwidth_digits = '０１２３４５６７８９'
-    halfwidth_digits = '0123456789'
-    translation_table = str.maketrans(fullwidth_digits, halfwidth_digits) 
-    return numeric.translate(translation_table)
-
-# テスト
-input_string = "a1b２c３d４"
-result = extract_numeric(input_string)
-print(f"元の文字列: {input_string}")
-print(f"数字のみ（半角に変換）: {result}")
-
+    return numeric.translate(_FW2HW_TABLE)
 
 
 ###日付文字列の解析
+# 年・月が欠けた日付は実行時の日付で補われるため、結果はキャッシュしない
 def parse_date(date_str):
     try:
         # 文字列型の日付値をDate型に変換
@@ -69,6 +97,25 @@ def parse_date(date_str):
         print(f"'{date_str}'の解析に失敗しました")
         return None
 
+###テキスト内の日付をすべてYYYY-MM-DD形式に変換
+def convert_dates(text: str) -> Tuple[str, List[str]]:
+    """テキスト内の日付をそれぞれYYYY-MM-DD形式に置き換える
+
+    Args:
+        text (str): 変換対象のテキスト
+
+    Returns:
+        Tuple[str, List[str]]: (変換後のテキスト, 一致した日付形式の名前のリスト)。
+            日付がない場合はテキストをそのまま返し、リストは空
+    """
+    kinds = []
+
+    def _replace(match):
+        kinds.append(match.lastgroup)
+        return _date_match_to_iso(match)
+
+    return _DATE_ANY_RE.sub(_replace, text), kinds
+
 ###日付データを指定のフォーマットの文字列に変換
 def change_date_format(date, to_format):
     try:
@@ -79,4 +126,9 @@ def change_date_format(date, to_format):
         return None
 
 
-
+if __name__ == "__main__":
+    # テスト
+    input_string = "a1b２c３d４"
+    result = extract_numeric(input_string)
+    print(f"元の文字列: {input_string}")
+    print(f"数字のみ（半角に変換）: {result}")
@@ -0,0 +1,83 @@
+"""
+backup_managerのテスト（ファイルのコピー）
+
+Copyright (C) 2023-2025 mrhoge
+
+This file is part of InvoiceRenamer.
+
+InvoiceRenamer is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed WITHOUT ANY WARRANTY; for more details see
+the LICENSE file in the distribution root.
+"""
+import os
+import shutil
+
+import pytest
+
+from invoice_renamer.logic.backup_manager import _copy_file, copy_file
+
+
+def _write(path, data: bytes):
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def _read(path) -> bytes:
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def test_copy_file_copies_content_and_mtime(tmp_path):
+    src = tmp_path / "a.pdf"
+    dst = tmp_path / "b.pdf"
+    _write(src, b"%PDF-1.4 original")
+    os.utime(src, (1_600_000_000, 1_600_000_000))
+
+    copy_file(str(src), str(dst))
+
+    assert _read(dst) == b"%PDF-1.4 original"
+    assert os.stat(dst).st_mtime == os.stat(src).st_mtime
+
+
+def test_copy_file_replaces_existing_destination(tmp_path):
+    src = tmp_path / "a.pdf"
+    dst = tmp_path / "b.pdf"
+    _write(src, b"new")
+    _write(dst, b"old contents that are longer")
+
+    copy_file(str(src), str(dst))
+
+    assert _read(dst) == b"new"
+    assert _read(src) == b"new"
+
+
+def test_copy_file_refuses_hardlinked_destination(tmp_path):
+    # リネーム時の複製（rename_current_file）で、コピー先が元ファイルへのハードリンクだった場合に
+    # 元ファイルを切り詰めず、shutil.copy2と同様にSameFileErrorとする
+    src = tmp_path / "a.pdf"
+    dst = tmp_path / "renamed" / "b.pdf"
+    dst.parent.mkdir()
+    _write(src, b"%PDF-1.4 original")
+    os.link(src, dst)
+
+    with pytest.raises(shutil.SameFileError):
+        copy_file(str(src), str(dst))
+
+    assert _read(src) == b"%PDF-1.4 original"
+    assert _read(dst) == b"%PDF-1.4 original"
+
+
+def test_copy_file_with_hardlinks_keeps_existing_link(tmp_path):
+    src = tmp_path / "a.pdf"
+    dst = tmp_path / "b.pdf"
+    _write(src, b"%PDF-1.4 original")
+    os.link(src, dst)
+
+    _copy_file(str(src), str(dst), use_hardlinks=True)
+
+    assert _read(src) == b"%PDF-1.4 original"
+    assert os.path.samefile(src, dst)
@@ -0,0 +1,48 @@
+"""
+ocr_preprocessのテスト（OCR再試行用の補正画像）
+
+Copyright (C) 2023-2025 mrhoge
+
+This file is part of InvoiceRenamer.
+
+InvoiceRenamer is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed WITHOUT ANY WARRANTY; for more details see
+the LICENSE file in the distribution root.
+"""
+import pytest
+from PIL import Image
+
+from invoice_renamer.logic.ocr_preprocess import (
+    iter_preprocess_variants, preprocess_variants, resize_for_ocr, to_grayscale)
+
+
+@pytest.mark.parametrize("size, expected_size", [
+    ((200, 50), (400, 100)),     # 小さい切り抜きは拡大する
+    ((800, 700), (800, 700)),    # 十分な大きさの画像はそのまま
+    ((2500, 500), (2500, 500)),  # 拡大すると上限ピクセル数を超える画像はそのまま
+])
+def test_preprocess_variants_are_grayscale_and_upscaled(size, expected_size):
+    variants = preprocess_variants(Image.new('RGB', size, 'white'))
+    assert len(variants) == 2
+    assert all(v.mode == 'L' and v.size == expected_size for v in variants)
+
+
+def test_iter_preprocess_variants_does_not_modify_source():
+    image = Image.new('RGB', (100, 40), (255, 0, 0))
+    list(iter_preprocess_variants(image))
+    assert image.mode == 'RGB' and image.size == (100, 40)
+
+
+def test_iter_preprocess_variants_stops_on_failure():
+    # 画像として扱えない入力でも例外を出さず、生成できた変種のみを返す
+    assert list(iter_preprocess_variants(object())) == []
+
+
+def test_to_grayscale_and_resize_for_ocr():
+    gray = to_grayscale(Image.new('RGB', (10, 4), (255, 255, 255)))
+    assert gray.mode == 'L' and gray.getpixel((0, 0)) == 255
+    assert resize_for_ocr(gray, (30, 12)).size == (30, 12)
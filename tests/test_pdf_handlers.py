@@ -0,0 +1,72 @@
+"""
+pdf_handlersのテスト（開いたドキュメントのキャッシュ）
+
+Copyright (C) 2023-2025 mrhoge
+
+This file is part of InvoiceRenamer.
+
+InvoiceRenamer is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed WITHOUT ANY WARRANTY; for more details see
+the LICENSE file in the distribution root.
+"""
+from invoice_renamer.logic.pdf_handlers import DOCUMENT_CACHE_SIZE, PDFHandler
+
+
+class _FakeDocument:
+    """closeの呼び出しを記録するだけのドキュメント"""
+
+    def __init__(self, page_count=1):
+        self.page_count = page_count
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def _open(handler, path):
+    """load_pdfで新しく開いた場合と同じ順序で、現在のドキュメントとキャッシュに登録する"""
+    doc = _FakeDocument()
+    handler._set_current_document(path, doc)
+    handler._cache_document(path, doc, 0)
+    return doc
+
+
+def test_current_document_evicted_from_cache_is_closed_on_replace():
+    # 開いているドキュメントはキャッシュの上限を超えても閉じず、差し替えた時点で閉じる
+    handler = PDFHandler()
+    first = _open(handler, "first.pdf")
+    for i in range(DOCUMENT_CACHE_SIZE):
+        handler._cache_document(f"other{i}.pdf", _FakeDocument(), 0)
+    assert not first.closed
+
+    _open(handler, "next.pdf")
+
+    assert first.closed
+
+
+def test_cached_document_stays_open_on_replace():
+    handler = PDFHandler()
+    first = _open(handler, "first.pdf")
+    second = _open(handler, "second.pdf")
+    assert not first.closed
+
+    handler._set_current_document("first.pdf", first)
+
+    assert not second.closed
+    assert handler.current_pdf is first and handler.current_path == "first.pdf"
+
+
+def test_stale_current_document_is_closed_on_reload():
+    # ファイルの更新でキャッシュから外れた現在のドキュメントは、開き直した時点で閉じる
+    handler = PDFHandler()
+    first = _open(handler, "a.pdf")
+    assert handler._get_cached_document("a.pdf", 1) is None
+    assert not first.closed
+
+    _open(handler, "a.pdf")
+
+    assert first.closed
@@ -0,0 +1,99 @@
+"""
+selection_analyzer_v6のテスト（OCR用の描画倍率・補正画像での再試行）
+
+Copyright (C) 2023-2025 mrhoge
+
+This file is part of InvoiceRenamer.
+
+InvoiceRenamer is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed WITHOUT ANY WARRANTY; for more details see
+the LICENSE file in the distribution root.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from invoice_renamer.logic.selection_analyzer_v6 import (
+    OCR_MAX_SCALE, OCR_MIN_SCALE, OCR_TARGET_TEXT_HEIGHT_PX, SelectionAnalyzer)
+
+
+def _choose_scale(font_sizes, rect=None, quick_mode=False):
+    """指定した文字サイズ（ポイント）のスパンがある範囲の描画倍率を求める
+
+    SelectionAnalyzerの生成はtesserocr・スレッドプール等を伴うため、
+    倍率の決定に使うスパンの取得だけを差し替えて呼び出す
+    """
+    spans = [(0, 0, 0, size) for size in font_sizes]
+    analyzer = SimpleNamespace(
+        _spans_in_rect=lambda page, rect: spans,
+        _get_page_spans=lambda page: ([],),
+    )
+    rect = rect or SimpleNamespace(width=200, height=50)
+    return SelectionAnalyzer._choose_ocr_scale(analyzer, None, rect, quick_mode)
+
+
+@pytest.mark.parametrize("font_size", [7.0, 8.0, 10.0, 12.0, 15.0, 20.0])
+def test_choose_ocr_scale_renders_glyphs_at_target_height(font_size):
+    # 倍率sの行列では1ポイントがsピクセルになるため、文字の高さ = 文字サイズ × 倍率
+    glyph_height_px = font_size * _choose_scale([font_size])
+    assert glyph_height_px == pytest.approx(OCR_TARGET_TEXT_HEIGHT_PX)
+
+
+def test_choose_ocr_scale_uses_median_font_size():
+    assert _choose_scale([8.0, 10.0, 40.0]) == pytest.approx(OCR_TARGET_TEXT_HEIGHT_PX / 10.0)
+
+
+@pytest.mark.parametrize("font_size, expected", [
+    (2.0, OCR_MAX_SCALE),   # 非常に小さい文字でも拡大しすぎない
+    (60.0, OCR_MIN_SCALE),  # 大きい文字は縮小しない
+])
+def test_choose_ocr_scale_is_clamped(font_size, expected):
+    assert _choose_scale([font_size]) == pytest.approx(expected)
+
+
+def test_choose_ocr_scale_without_text_limits_longest_side():
+    rect = SimpleNamespace(width=4000, height=100)
+    assert _choose_scale([], rect=rect) == pytest.approx(0.5)
+    assert _choose_scale([], quick_mode=True) == pytest.approx(1.5)
+
+
+def _ocr_variants(results):
+    """変種ごとのOCR結果を与えて補正画像での再試行を行い、(戻り値, 生成された変種の番号)を返す"""
+    built = []
+
+    def variants():
+        for i in range(len(results)):
+            built.append(i)
+            yield i
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        analyzer = SimpleNamespace(
+            _image_to_string=lambda image, config, lang: results[image],
+            _ocr_text_looks_valid=lambda text: SelectionAnalyzer._ocr_text_looks_valid(analyzer, text),
+            _contains_japanese_text=lambda text: False,
+            _ocr_retry_pool=pool,
+        )
+        result = SelectionAnalyzer._ocr_variants_in_order(analyzer, variants(), '', 'eng')
+    return result, built
+
+
+@pytest.mark.parametrize("results, expected", [
+    (["Invoice", "Total"], (0, "Invoice")),
+    (["", "Total"], (1, "Total")),
+    (["", "---", "No. 123"], (2, "No. 123")),
+    (["", "---"], None),
+    ([], None),
+])
+def test_ocr_variants_in_order_returns_first_valid_variant(results, expected):
+    assert _ocr_variants(results)[0] == expected
+
+
+def test_ocr_variants_in_order_stops_generating_after_valid_variant():
+    # 2つ目以降の変種を使わない場合は、先行実行の分（最大1つ）を超えて生成しない
+    _, built = _ocr_variants(["Invoice", "Total", "No. 123"])
+    assert built[:1] == [0] and len(built) <= 2
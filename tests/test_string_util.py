@@ -0,0 +1,92 @@
+"""
+string_utilのテスト（日付の変換・ファイル名の生成）
+
+Copyright (C) 2023-2025 mrhoge
+
+This file is part of InvoiceRenamer.
+
+InvoiceRenamer is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed WITHOUT ANY WARRANTY; for more details see
+the LICENSE file in the distribution root.
+"""
+from datetime import datetime
+
+import pytest
+
+from invoice_renamer.utils import string_util
+from invoice_renamer.utils.constants import FILE_EXTENTION_NAME
+from invoice_renamer.utils.string_util import convert_dates, generate_filename, parse_date
+
+
+# 日付が1つだけのテキストの変換結果（形式ごとに検索・置換していた従来の実装と同じ結果）
+@pytest.mark.parametrize("text, expected, kind", [
+    ("令和7年1月16日", "2025-01-16", "wareki"),
+    ("令和 7年 1月16日", "2025-01-16", "wareki"),
+    ("平成31年4月30日", "2019-04-30", "wareki"),
+    ("昭和64年1月7日", "1989-01-07", "wareki"),
+    ("大正1年7月30日", "1912-07-30", "wareki"),
+    ("明治45年7月29日", "1912-07-29", "wareki"),
+    ("2023年12月25日", "2023-12-25", "ymd_jp"),
+    ("2025年 1月16日", "2025-01-16", "ymd_jp"),
+    ("2023/12/25", "2023-12-25", "ymd_sep"),
+    ("2023.1.5", "2023-01-05", "ymd_sep"),
+    ("23/12/25", "2023-12-25", "yy_sep"),
+    ("23.1.5", "2023-01-05", "yy_sep"),
+    ("2024-01-31", "2024-01-31", "iso"),
+    ("請求日：2024/3/4", "請求日：2024-03-04", "ymd_sep"),
+    ("発行日 令和6年10月1日 御中", "発行日 2024-10-01 御中", "wareki"),
+])
+def test_convert_dates_single_date(text, expected, kind):
+    assert convert_dates(text) == (expected, [kind])
+
+
+@pytest.mark.parametrize("text", ["", "日付なし", "No date here", "12,000円"])
+def test_convert_dates_without_date(text):
+    assert convert_dates(text) == (text, [])
+
+
+def test_convert_dates_multiple_dates_are_converted_independently():
+    # 従来は最初の日付の値で、同じ形式の日付がすべて上書きされていた
+    assert convert_dates("2023/1/2と2024/3/4") == (
+        "2023-01-02と2024-03-04", ["ymd_sep", "ymd_sep"])
+
+
+def test_convert_dates_multiple_formats():
+    assert convert_dates("令和6年1月2日〜2024年3月4日") == (
+        "2024-01-02〜2024-03-04", ["wareki", "ymd_jp"])
+
+
+def test_generate_filename_default_extension():
+    assert generate_filename("2024-01-31", "株式会社〇〇", "12000") == (
+        f"2024-01-31-株式会社〇〇-12000{FILE_EXTENTION_NAME}")
+
+
+def test_generate_filename_custom_extension():
+    assert generate_filename("2024-01-31", "株式会社〇〇", "12000", ext=".txt") == (
+        "2024-01-31-株式会社〇〇-12000.txt")
+
+
+def test_parse_date_full_date():
+    assert parse_date("2024-01-31") == datetime(2024, 1, 31)
+
+
+def test_parse_date_invalid():
+    assert parse_date("日付なし") is None
+
+
+def test_parse_date_is_not_cached(monkeypatch):
+    # 年が欠けた日付は実行時の年で補われるため、呼び出しごとに解析し直す
+    calls = []
+
+    def fake_parse(date_str, **kwargs):
+        calls.append(date_str)
+        return datetime(2024, 3, 4)
+
+    monkeypatch.setattr(string_util, "parse", fake_parse)
+    parse_date("3/4")
+    parse_date("3/4")
+    assert calls == ["3/4", "3/4"]